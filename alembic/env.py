@@ -3,9 +3,10 @@ Alembic environment configuration for Chat Marketplace Service
 """
 
 import asyncio
+import logging
 import os
 from logging.config import fileConfig
-from sqlalchemy import pool
+from sqlalchemy import inspect, pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
@@ -15,40 +16,80 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from datalayer.model.sqlalchemy_models import Base
-from config import Config
+from config import config as app_config
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# This line sets up loggers basically. Skipped when the app runs migrations
+# in-process (configure_logger=False) - fileConfig would disable the app's
+# loggers and replace its handlers
+if config.config_file_name is not None and config.attributes.get('configure_logger', True):
     fileConfig(config.config_file_name)
 
-# Load our application config
-app_config = Config()
-
-# Override the sqlalchemy.url with our configuration
-config.set_main_option('sqlalchemy.url', app_config.postgres_sync_url)
+# Override the sqlalchemy.url with our configuration: online migrations run
+# on an async engine and need the asyncpg URL, offline mode only renders SQL.
+# '%' is doubled because ini option values are interpolated
+_migration_url = app_config.postgres_sync_url if context.is_offline_mode() else app_config.postgres_url
+config.set_main_option('sqlalchemy.url', _migration_url.replace('%', '%%'))
 
 # Set environment variables for connection string interpolation
-os.environ.setdefault('POSTGRES_HOST', app_config.postgres_host)
-os.environ.setdefault('POSTGRES_PORT', str(app_config.postgres_port))
-os.environ.setdefault('POSTGRES_DB', app_config.postgres_db)
-os.environ.setdefault('POSTGRES_USER', app_config.postgres_user)
-os.environ.setdefault('POSTGRES_PASSWORD', app_config.postgres_password)
+# (values already present in the environment take precedence)
+_postgres_env = {
+    'POSTGRES_HOST': app_config.postgres_host,
+    'POSTGRES_PORT': str(app_config.postgres_port),
+    'POSTGRES_DB': app_config.postgres_db,
+    'POSTGRES_USER': app_config.postgres_user,
+    'POSTGRES_PASSWORD': app_config.postgres_password,
+}
+os.environ.update({k: v for k, v in _postgres_env.items() if k not in os.environ})
 
 # add your model's MetaData object here
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Application schemas - reflection is restricted to these so autogenerate
+# does not walk every schema in the database
+APP_SCHEMAS = ('auth', 'chats', 'marketplace')
+
+# Advisory lock key shared by every process that runs upgrades
+MIGRATION_LOCK_KEY = 'alembic:chat_marketplace:migrate'
+
+logger = logging.getLogger('alembic.env')
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """Only reflect the schemas owned by the application"""
+    if type_ == "schema":
+        # None is the default (public) schema holding alembic_version
+        return name is None or name in APP_SCHEMAS
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
 
+# Reflection results shared by every inspector this process creates, so
+# repeated upgrades (e.g. the app's in-process runs) reflect each schema once
+_INFO_CACHE: dict = {}
+
+
+def _prime_reflection_cache(connection: Connection):
+    """Reflect the app schemas in bulk into the shared cache and return the inspector"""
+    insp = inspect(connection)
+    insp.info_cache = _INFO_CACHE
+    for schema in APP_SCHEMAS:
+        # One catalog query per kind and schema instead of one per table
+        insp.get_multi_columns(schema=schema)
+        insp.get_multi_indexes(schema=schema)
+        insp.get_multi_foreign_keys(schema=schema)
+    return insp
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -69,6 +110,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         # Include schemas in migration
         include_schemas=True,
+        include_name=include_name,
         # Version table schema
         version_table_schema='public'
     )
@@ -79,13 +121,19 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with database connection"""
+    # Expose the warmed inspector to revision scripts via context.config
+    config.attributes['inspector'] = _prime_reflection_cache(connection)
+
     context.configure(
         connection=connection, 
         target_metadata=target_metadata,
         # Include schemas in migration
         include_schemas=True,
+        include_name=include_name,
         # Version table schema
         version_table_schema='public',
+        # Plain ALTER on PostgreSQL, no SQLite-style table copies
+        render_as_batch=False,
         # Compare types for better migrations
         compare_type=True,
         # Compare server defaults
@@ -102,14 +150,33 @@ async def run_async_migrations() -> None:
 
     """
 
+    # A small queue pool keeps the reflection connection warm across
+    # the comparison queries instead of reconnecting with NullPool. Two
+    # connections are checked out at once: the lock holder and the migrator
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        poolclass=pool.AsyncAdaptedQueuePool,
+        pool_size=2,
+        max_overflow=0,
     )
 
-    async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
+    # Serialize concurrent upgrades (replicas/workers) with an advisory lock
+    # held on its own connection: the migration connection commits mid-run
+    # (autocommit blocks) which would release a transaction-level lock early.
+    # The lock is released automatically when the transaction ends or the
+    # process dies, so a crashed worker never leaves it behind.
+    async with connectable.connect() as lock_connection:
+        async with lock_connection.begin():
+            logger.info("Waiting for the migration advisory lock")
+            await lock_connection.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+                {"key": MIGRATION_LOCK_KEY}
+            )
+            logger.info("Migration advisory lock acquired")
+            async with connectable.connect() as connection:
+                await connection.run_sync(do_run_migrations)
+        logger.info("Migration advisory lock released")
 
     await connectable.dispose()
 
@@ -0,0 +1,53 @@
+"""Restrict the featured index to active bots and add a premium counterpart
+
+Revision ID: active_listing_partial_indexes
+Revises: bot_listing_indexes
+Create Date: 2026-10-17 01:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'active_listing_partial_indexes'
+down_revision = 'bot_listing_indexes'
+branch_labels = None
+depends_on = None
+
+def _has_listing_columns() -> bool:
+    """Databases bootstrapped from init.sql may lack the marketplace listing columns"""
+    return op.get_bind().execute(sa.text("""
+        SELECT count(*) = 4 FROM information_schema.columns
+        WHERE table_schema = 'marketplace' AND table_name = 'bots'
+          AND column_name IN ('is_featured', 'is_premium', 'rating', 'display_name')
+    """)).scalar()
+
+def upgrade():
+    """Index only active featured/premium bots, in the order their listings read them"""
+    if not _has_listing_columns():
+        return
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bot_featured_active '
+            'ON marketplace.bots (rating DESC, display_name) '
+            "WHERE is_featured AND bot_status = 'active'"
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bot_premium_active '
+            'ON marketplace.bots (rating DESC, display_name) '
+            "WHERE is_premium AND bot_status = 'active'"
+        )
+        # Superseded: get_featured_bots only reads active bots
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_bot_featured')
+
+def downgrade():
+    """Restore the featured-only index"""
+    if not _has_listing_columns():
+        return
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bot_featured '
+            'ON marketplace.bots (rating DESC, display_name) WHERE is_featured'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_bot_premium_active')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_bot_featured_active')
@@ -0,0 +1,27 @@
+"""Add a non-negative check on document file sizes
+
+Revision ID: add_document_size_check
+Revises: brin_time_indexes
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_document_size_check'
+down_revision = 'brin_time_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Add ck_document_file_size without holding an exclusive lock during the scan"""
+    # NOT VALID takes a brief lock; VALIDATE scans under SHARE UPDATE EXCLUSIVE
+    op.execute(
+        'ALTER TABLE chats.document ADD CONSTRAINT ck_document_file_size '
+        'CHECK (document_file_size >= 0) NOT VALID'
+    )
+    op.execute('ALTER TABLE chats.document VALIDATE CONSTRAINT ck_document_file_size')
+
+def downgrade():
+    """Drop the file size check"""
+    op.execute('ALTER TABLE chats.document DROP CONSTRAINT IF EXISTS ck_document_file_size')
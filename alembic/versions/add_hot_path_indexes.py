@@ -0,0 +1,45 @@
+"""Add composite indexes for the foreign key list queries
+
+Revision ID: add_hot_path_indexes
+Revises: set_role_session_defaults
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_hot_path_indexes'
+down_revision = 'set_role_session_defaults'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Index (fk, timestamp) so list queries stream rows in order instead of sorting"""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_conv_user_updated '
+            'ON chats.conversation (conversation_user_id, conversation_updated_at DESC)'
+        )
+        # Covering index - the message list never has to visit the heap for role/bot
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_msg_conv_created '
+            'ON chats.message (message_conversation_id, created_at) '
+            'INCLUDE (message_role, message_bot_id)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_doc_msg_created '
+            'ON chats.document (document_message_id, created_at)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_memhist_conv_time '
+            'ON chats.memory_history (conversation_id, date_time DESC)'
+        )
+
+def downgrade():
+    """Drop the composite indexes without blocking writes"""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_memhist_conv_time')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_doc_msg_created')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_msg_conv_created')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_conv_user_updated')
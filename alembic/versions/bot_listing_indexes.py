@@ -0,0 +1,51 @@
+"""Add composite indexes matching the bot listing ORDER BYs
+
+Revision ID: bot_listing_indexes
+Revises: bot_search_tsvector
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'bot_listing_indexes'
+down_revision = 'bot_search_tsvector'
+branch_labels = None
+depends_on = None
+
+def _has_listing_columns() -> bool:
+    """Databases bootstrapped from init.sql may lack the marketplace listing columns"""
+    return op.get_bind().execute(sa.text("""
+        SELECT count(*) = 4 FROM information_schema.columns
+        WHERE table_schema = 'marketplace' AND table_name = 'bots'
+          AND column_name IN ('is_featured', 'rating', 'display_name', 'total_conversations')
+    """)).scalar()
+
+def upgrade():
+    """Serve get_by_category and get_top_rated_bots without a Sort node"""
+    if not _has_listing_columns():
+        return
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bot_cat_listing '
+            'ON marketplace.bots (bot_category_id, bot_status, is_featured DESC, rating DESC, display_name)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bot_top_rated '
+            'ON marketplace.bots (bot_status, rating DESC, total_conversations DESC) '
+            'WHERE rating IS NOT NULL'
+        )
+        # Superseded: bot_category_id leads ix_bot_cat_listing
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.idx_bots_category_id')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_marketplace_bots_bot_category_id')
+
+def downgrade():
+    """Restore the single-column category index"""
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bots_category_id '
+            'ON marketplace.bots (bot_category_id)'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_bot_top_rated')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_bot_cat_listing')
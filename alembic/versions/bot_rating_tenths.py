@@ -0,0 +1,41 @@
+"""Store bot ratings as smallint tenths instead of double precision
+
+Revision ID: bot_rating_tenths
+Revises: document_file_type_column
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'bot_rating_tenths'
+down_revision = 'document_file_type_column'
+branch_labels = None
+depends_on = None
+
+def _has_rating() -> bool:
+    """Databases bootstrapped from init.sql may lack the column"""
+    return op.get_bind().execute(sa.text("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'marketplace' AND table_name = 'bots'
+          AND column_name = 'rating'
+    """)).first() is not None
+
+def upgrade():
+    """0.0-5.0 ratings in 0.1 steps fit a 2-byte smallint scaled by 10"""
+    if not _has_rating():
+        return
+    op.execute(
+        'ALTER TABLE marketplace.bots '
+        'ALTER COLUMN rating TYPE smallint USING round(rating * 10)::smallint'
+    )
+
+def downgrade():
+    """Convert tenths back to a double precision rating"""
+    if not _has_rating():
+        return
+    op.execute(
+        'ALTER TABLE marketplace.bots '
+        'ALTER COLUMN rating TYPE double precision USING rating / 10.0'
+    )
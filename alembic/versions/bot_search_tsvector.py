@@ -0,0 +1,47 @@
+"""Add a generated tsvector column with a GIN index for bot full-text search
+
+Revision ID: bot_search_tsvector
+Revises: trigram_search_indexes
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'bot_search_tsvector'
+down_revision = 'trigram_search_indexes'
+branch_labels = None
+depends_on = None
+
+def _has_display_name() -> bool:
+    """Databases bootstrapped from init.sql may lack the column the vector covers"""
+    return op.get_bind().execute(sa.text("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'marketplace' AND table_name = 'bots'
+          AND column_name = 'display_name'
+    """)).first() is not None
+
+def upgrade():
+    """Index bot name, display name and description for multi-word search"""
+    if not _has_display_name():
+        return
+    # A stored generated column rewrites marketplace.bots - small, but run off-peak
+    op.execute("""
+        ALTER TABLE marketplace.bots ADD COLUMN IF NOT EXISTS search_tsv tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', coalesce(bot_name, '') || ' ' ||
+                coalesce(display_name, '') || ' ' || coalesce(bot_description, ''))
+        ) STORED
+    """)
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bot_search_tsv '
+            'ON marketplace.bots USING gin (search_tsv)'
+        )
+
+def downgrade():
+    """Drop the full-text column and its index"""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_bot_search_tsv')
+    op.execute('ALTER TABLE marketplace.bots DROP COLUMN IF EXISTS search_tsv')
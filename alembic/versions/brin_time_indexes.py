@@ -0,0 +1,30 @@
+"""Replace the global time btrees on message and memory_history with BRIN
+
+Revision ID: brin_time_indexes
+Revises: drop_covered_fk_indexes
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'brin_time_indexes'
+down_revision = 'drop_covered_fk_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Append-only tables are physically time ordered - a BRIN index is a few pages"""
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS brin_msg_created ON chats.message USING brin (created_at)')
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS brin_memhist_time ON chats.memory_history USING brin (date_time)')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.idx_message_created_at')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.idx_memory_datetime')
+
+def downgrade():
+    """Restore the btree time indexes"""
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_memory_datetime ON chats.memory_history (date_time DESC)')
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_message_created_at ON chats.message (created_at DESC)')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.brin_memhist_time')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.brin_msg_created')
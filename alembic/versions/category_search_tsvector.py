@@ -0,0 +1,36 @@
+"""Add a generated tsvector column with a GIN index for category full-text search
+
+Revision ID: category_search_tsvector
+Revises: active_listing_partial_indexes
+Create Date: 2026-10-17 02:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'category_search_tsvector'
+down_revision = 'active_listing_partial_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Index category name and description for multi-word search"""
+    # A stored generated column rewrites marketplace.bot_categories - a handful of rows
+    op.execute("""
+        ALTER TABLE marketplace.bot_categories ADD COLUMN IF NOT EXISTS search_tsv tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('simple', coalesce(category_name, '') || ' ' ||
+                coalesce(category_description, ''))
+        ) STORED
+    """)
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_category_search_tsv '
+            'ON marketplace.bot_categories USING gin (search_tsv)'
+        )
+
+def downgrade():
+    """Drop the full-text column and its index"""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_category_search_tsv')
+    op.execute('ALTER TABLE marketplace.bot_categories DROP COLUMN IF EXISTS search_tsv')
@@ -0,0 +1,55 @@
+"""Index conversation lists by last_message_at, matching the repository ORDER BY
+
+Revision ID: conversation_last_message_indexes
+Revises: add_document_size_check
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'conversation_last_message_indexes'
+down_revision = 'add_document_size_check'
+branch_labels = None
+depends_on = None
+
+def _has_last_message_at() -> bool:
+    """Databases bootstrapped from an older init.sql may lack the column"""
+    return op.get_bind().execute(sa.text("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'chats' AND table_name = 'conversation'
+          AND column_name = 'last_message_at'
+    """)).first() is not None
+
+def upgrade():
+    """Replace (user, updated_at) and (bot) indexes with last_message_at composites"""
+    if not _has_last_message_at():
+        return
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_conv_user_last '
+            'ON chats.conversation (conversation_user_id, last_message_at DESC, conversation_updated_at DESC)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_conv_bot_last '
+            'ON chats.conversation (conversation_bot_id, last_message_at DESC)'
+        )
+        # Superseded: idx_conversation_bot_id is a prefix of ix_conv_bot_last and
+        # no query orders by conversation_updated_at alone
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_conv_user_updated')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.idx_conversation_bot_id')
+
+def downgrade():
+    """Restore the previous conversation indexes"""
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversation_bot_id '
+            'ON chats.conversation (conversation_bot_id)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_conv_user_updated '
+            'ON chats.conversation (conversation_user_id, conversation_updated_at DESC)'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_conv_bot_last')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_conv_user_last')
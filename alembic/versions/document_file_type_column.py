@@ -0,0 +1,36 @@
+"""Add a generated document_file_type column with an index
+
+Revision ID: document_file_type_column
+Revises: jsonb_metadata_columns
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'document_file_type_column'
+down_revision = 'jsonb_metadata_columns'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Store the major MIME type once per row instead of computing it on read"""
+    # A stored generated column rewrites chats.document - run in a quiet window
+    op.execute("""
+        ALTER TABLE chats.document ADD COLUMN IF NOT EXISTS document_file_type
+        character varying(100) GENERATED ALWAYS AS (
+            CASE WHEN strpos(document_mime_type, '/') > 0
+            THEN split_part(document_mime_type, '/', 1) ELSE 'unknown' END
+        ) STORED
+    """)
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_doc_file_type '
+            'ON chats.document (document_file_type)'
+        )
+
+def downgrade():
+    """Drop the generated column and its index"""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_doc_file_type')
+    op.execute('ALTER TABLE chats.document DROP COLUMN IF EXISTS document_file_type')
@@ -0,0 +1,39 @@
+"""Drop single-column foreign key indexes covered by composite indexes
+
+Revision ID: drop_covered_fk_indexes
+Revises: drop_duplicate_email_index
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'drop_covered_fk_indexes'
+down_revision = 'drop_duplicate_email_index'
+branch_labels = None
+depends_on = None
+
+# (schema, table, column, init.sql name) - each is the leading column of an add_hot_path_indexes index.
+# init.sql named these idx_*, create_all named them ix_<schema>_<table>_<column>
+COVERED_COLUMNS = [
+    ('chats', 'conversation', 'conversation_user_id', 'idx_conversation_user_id'),
+    ('chats', 'message', 'message_conversation_id', 'idx_message_conversation_id'),
+    ('chats', 'document', 'document_message_id', 'idx_document_message_id'),
+    ('chats', 'memory_history', 'conversation_id', 'idx_memory_conversation_id'),
+]
+
+def upgrade():
+    """Every write maintained both indexes; WHERE fk = ? uses the composite's prefix"""
+    with op.get_context().autocommit_block():
+        for schema, table, column, init_sql_name in COVERED_COLUMNS:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {schema}.{init_sql_name}')
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {schema}.ix_{schema}_{table}_{column}')
+
+def downgrade():
+    """Recreate the single-column indexes (init.sql names)"""
+    with op.get_context().autocommit_block():
+        for schema, table, column, init_sql_name in COVERED_COLUMNS:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {init_sql_name} '
+                f'ON {schema}.{table} ({column})'
+            )
@@ -0,0 +1,24 @@
+"""Drop the index duplicating the users.user_email unique constraint
+
+Revision ID: drop_duplicate_email_index
+Revises: toast_document_content
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'drop_duplicate_email_index'
+down_revision = 'toast_document_content'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Email lookups are served by users_user_email_key; the extra index only costs writes"""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS auth.idx_users_email')
+
+def downgrade():
+    """Recreate the plain email index"""
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_email ON auth.users (user_email)')
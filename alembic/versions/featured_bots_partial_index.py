@@ -0,0 +1,38 @@
+"""Add a partial index for featured bot listings
+
+Revision ID: featured_bots_partial_index
+Revises: bot_rating_tenths
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'featured_bots_partial_index'
+down_revision = 'bot_rating_tenths'
+branch_labels = None
+depends_on = None
+
+def _has_featured_columns() -> bool:
+    """Databases bootstrapped from init.sql may lack the marketplace listing columns"""
+    return op.get_bind().execute(sa.text("""
+        SELECT count(*) = 3 FROM information_schema.columns
+        WHERE table_schema = 'marketplace' AND table_name = 'bots'
+          AND column_name IN ('is_featured', 'rating', 'display_name')
+    """)).scalar()
+
+def upgrade():
+    """Index only featured bots, in the order get_featured_bots reads them"""
+    if not _has_featured_columns():
+        return
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bot_featured '
+            'ON marketplace.bots (rating DESC, display_name) WHERE is_featured'
+        )
+
+def downgrade():
+    """Drop the featured bots index"""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_bot_featured')
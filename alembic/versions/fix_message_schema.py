@@ -15,6 +15,9 @@ down_revision = 'add_bot_category_fields'
 branch_labels = None
 depends_on = None
 
+# Rows updated per transaction while backfilling message_type
+BACKFILL_BATCH_SIZE = 1000
+
 def upgrade():
     """Add missing fields to message table"""
     # Add message_user_id field for user messages
@@ -28,28 +31,48 @@ def upgrade():
         schema='chats'
     )
     
-    # Add message_type field to store actual message type
+    # Add message_type field to store actual message type.
+    # Added nullable first and backfilled in batches so large tables are not
+    # rewritten under an exclusive lock; NOT NULL is enforced afterwards.
     op.add_column('message',
         sa.Column('message_type',
                  sa.String(20),
-                 nullable=False,
-                 server_default='text',
+                 nullable=True,
                  comment='Type of message: text, image, document, etc.'
         ),
         schema='chats'
     )
-    
-    # Add index on message_user_id for performance
-    op.create_index('ix_message_user_id', 'message', ['message_user_id'], schema='chats')
-    
-    # Add index on message_type for filtering
-    op.create_index('ix_message_type', 'message', ['message_type'], schema='chats')
+    op.alter_column('message', 'message_type', server_default='text', schema='chats')
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        # Each batch commits on its own so row locks are held only briefly
+        while True:
+            result = bind.execute(sa.text("""
+                UPDATE chats.message SET message_type = 'text'
+                WHERE ctid IN (
+                    SELECT ctid FROM chats.message
+                    WHERE message_type IS NULL
+                    LIMIT :batch_size
+                )
+            """), {"batch_size": BACKFILL_BATCH_SIZE})
+            if result.rowcount == 0:
+                break
+
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        # Index on message_user_id for performance
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_user_id ON chats.message (message_user_id)')
+        # Index on message_type for filtering
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_type ON chats.message (message_type)')
+
+    op.alter_column('message', 'message_type', nullable=False, schema='chats')
 
 def downgrade():
     """Remove the added fields"""
-    # Drop indexes
-    op.drop_index('ix_message_type', 'message', schema='chats')
-    op.drop_index('ix_message_user_id', 'message', schema='chats')
+    # Drop indexes without blocking writes
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_message_type')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS chats.ix_message_user_id')
     
     # Drop columns
     op.drop_column('message', 'message_type', schema='chats')
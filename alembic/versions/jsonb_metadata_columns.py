@@ -0,0 +1,56 @@
+"""Store metadata, capabilities and configuration as jsonb
+
+Revision ID: jsonb_metadata_columns
+Revises: conversation_last_message_indexes
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'jsonb_metadata_columns'
+down_revision = 'conversation_last_message_indexes'
+branch_labels = None
+depends_on = None
+
+_JSON_COLUMNS = (
+    ('chats', 'conversation', 'custom_metadata'),
+    ('chats', 'message', 'custom_metadata'),
+    ('marketplace', 'bots', 'capabilities'),
+    ('marketplace', 'bots', 'configuration'),
+)
+
+def _existing_columns():
+    """Databases bootstrapped from init.sql may lack some of the JSON columns"""
+    rows = op.get_bind().execute(sa.text("""
+        SELECT table_schema, table_name, column_name FROM information_schema.columns
+        WHERE (table_schema, table_name) IN (('chats', 'conversation'), ('chats', 'message'), ('marketplace', 'bots'))
+    """))
+    existing = {tuple(row) for row in rows}
+    return [column for column in _JSON_COLUMNS if column in existing]
+
+def upgrade():
+    """Convert json columns to jsonb and index bot capabilities for containment"""
+    columns = _existing_columns()
+    for schema, table, column in columns:
+        op.execute(
+            f'ALTER TABLE {schema}.{table} '
+            f'ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb'
+        )
+    if ('marketplace', 'bots', 'capabilities') in columns:
+        with op.get_context().autocommit_block():
+            op.execute(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bot_capabilities_gin '
+                'ON marketplace.bots USING gin (capabilities)'
+            )
+
+def downgrade():
+    """Drop the GIN index and convert the columns back to json"""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS marketplace.ix_bot_capabilities_gin')
+    for schema, table, column in _existing_columns():
+        op.execute(
+            f'ALTER TABLE {schema}.{table} '
+            f'ALTER COLUMN {column} TYPE json USING {column}::json'
+        )
@@ -0,0 +1,25 @@
+"""Set timezone and search_path as role defaults for the application user
+
+Revision ID: set_role_session_defaults
+Revises: fix_message_schema
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'set_role_session_defaults'
+down_revision = 'fix_message_schema'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Let the server apply session settings at login instead of per-connection SETs"""
+    # init.sql does the same for fresh databases; this covers existing ones
+    op.execute("ALTER ROLE CURRENT_USER SET timezone = 'UTC'")
+    op.execute("ALTER ROLE CURRENT_USER SET search_path = auth, chats, marketplace, public")
+
+def downgrade():
+    """Remove the role-level session defaults"""
+    op.execute("ALTER ROLE CURRENT_USER RESET search_path")
+    op.execute("ALTER ROLE CURRENT_USER RESET timezone")
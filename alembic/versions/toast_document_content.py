@@ -0,0 +1,24 @@
+"""Move document content out of the heap page earlier
+
+Revision ID: toast_document_content
+Revises: use_native_status_enums
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'toast_document_content'
+down_revision = 'use_native_status_enums'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Compress/TOAST rows above 128 bytes instead of the ~2kB default"""
+    # Keeps document heap tuples to their metadata so scans that skip the
+    # deferred content column stay small; applies to rows written from now on
+    op.execute('ALTER TABLE chats.document SET (toast_tuple_target = 128)')
+
+def downgrade():
+    """Restore the default TOAST threshold"""
+    op.execute('ALTER TABLE chats.document RESET (toast_tuple_target)')
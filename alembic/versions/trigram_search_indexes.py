@@ -0,0 +1,50 @@
+"""Add pg_trgm GIN indexes for bot and category substring search
+
+Revision ID: trigram_search_indexes
+Revises: featured_bots_partial_index
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'trigram_search_indexes'
+down_revision = 'featured_bots_partial_index'
+branch_labels = None
+depends_on = None
+
+_TRGM_INDEXES = (
+    ('ix_bot_name_trgm', 'bots', 'bot_name'),
+    ('ix_bot_display_name_trgm', 'bots', 'display_name'),
+    ('ix_bot_description_trgm', 'bots', 'bot_description'),
+    ('ix_category_name_trgm', 'bot_categories', 'category_name'),
+    ('ix_category_description_trgm', 'bot_categories', 'category_description'),
+)
+
+def _existing_columns():
+    """Databases bootstrapped from init.sql may lack display_name"""
+    rows = op.get_bind().execute(sa.text("""
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE table_schema = 'marketplace' AND table_name IN ('bots', 'bot_categories')
+    """))
+    return {tuple(row) for row in rows}
+
+def upgrade():
+    """Let search_bots/search_categories' ILIKE '%query%' filters use an index"""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public')
+    columns = _existing_columns()
+    with op.get_context().autocommit_block():
+        for name, table, column in _TRGM_INDEXES:
+            if (table, column) not in columns:
+                continue
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} '
+                f'ON marketplace.{table} USING gin ({column} public.gin_trgm_ops)'
+            )
+
+def downgrade():
+    """Drop the trigram indexes (the extension is left installed)"""
+    with op.get_context().autocommit_block():
+        for name, _, _ in _TRGM_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS marketplace.{name}')
@@ -0,0 +1,50 @@
+"""Store status and role columns as native PostgreSQL ENUM types
+
+Revision ID: use_native_status_enums
+Revises: add_hot_path_indexes
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'use_native_status_enums'
+down_revision = 'add_hot_path_indexes'
+branch_labels = None
+depends_on = None
+
+# (schema, table, column, enum values, default, previous varchar length)
+# Each ENUM type is named after its column
+ENUM_COLUMNS = [
+    ('chats', 'conversation', 'conversation_status', ('active', 'archived', 'deleted'), 'active', 50),
+    ('chats', 'message', 'message_role', ('user', 'bot'), None, 20),
+    ('marketplace', 'bots', 'bot_status', ('active', 'inactive', 'pending', 'rejected'), 'active', 50),
+]
+
+def upgrade():
+    """Convert varchar status columns to ENUM (4 bytes per row, integer compares)"""
+    # ALTER COLUMN TYPE rewrites each table under an exclusive lock -
+    # run during a maintenance window on large databases
+    for schema, table, column, values, default, _length in ENUM_COLUMNS:
+        labels = ', '.join(f"'{value}'" for value in values)
+        op.execute(f'CREATE TYPE {schema}.{column} AS ENUM ({labels})')
+        # The varchar default cannot be cast automatically
+        op.execute(f'ALTER TABLE {schema}.{table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {schema}.{table} ALTER COLUMN {column} '
+            f'TYPE {schema}.{column} USING {column}::{schema}.{column}'
+        )
+        if default is not None:
+            op.execute(f"ALTER TABLE {schema}.{table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+
+def downgrade():
+    """Convert the ENUM columns back to varchar"""
+    for schema, table, column, _values, default, length in reversed(ENUM_COLUMNS):
+        op.execute(f'ALTER TABLE {schema}.{table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {schema}.{table} ALTER COLUMN {column} '
+            f'TYPE character varying({length}) USING {column}::text'
+        )
+        if default is not None:
+            op.execute(f"ALTER TABLE {schema}.{table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+        op.execute(f'DROP TYPE {schema}.{column}')
@@ -2,26 +2,35 @@ import asyncio
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-from datalayer.database import get_postgres_session
-from sqlalchemy import text
+import asyncpg
+from config import config
 
-async def check_schema():
-    session_gen = get_postgres_session()
-    session = await anext(session_gen)
+async def check_schema(schema: str = 'chats', table: str = 'message'):
+    # One-off read of information_schema - a bare asyncpg connection avoids
+    # bootstrapping SQLAlchemy engines and the application's pools
+    conn = await asyncpg.connect(
+        host=config.postgres_host,
+        port=config.postgres_port,
+        user=config.postgres_user,
+        password=config.postgres_password,
+        database=config.postgres_db
+    )
     try:
-        result = await session.execute(text('''
-            SELECT column_name, data_type, is_nullable 
-            FROM information_schema.columns 
-            WHERE table_schema = 'chats' AND table_name = 'message'
-            ORDER BY ordinal_position;
-        '''))
-        
-        print('Actual database columns in chats.message:')
-        print('Column Name | Data Type | Nullable')
-        print('-' * 40)
-        for row in result:
-            print(f'{row.column_name} | {row.data_type} | {row.is_nullable}')
+        rows = await conn.fetch('''
+            SELECT column_name, data_type, is_nullable
+            FROM information_schema.columns
+            WHERE table_schema = $1 AND table_name = $2
+            ORDER BY ordinal_position
+        ''', schema, table)
     finally:
-        await session.close()
+        await conn.close()
 
-asyncio.run(check_schema())
\ No newline at end of file
+    lines = [
+        f'Actual database columns in {schema}.{table}:',
+        'Column Name | Data Type | Nullable',
+        '-' * 40,
+    ]
+    lines.extend(f"{row['column_name']} | {row['data_type']} | {row['is_nullable']}" for row in rows)
+    print('\n'.join(lines))
+
+asyncio.run(check_schema())
@@ -5,28 +5,69 @@ Singleton pattern ile async PostgreSQL connection management
 
 import logging
 import asyncio
+import random
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
 
+import asyncpg
 from sqlalchemy.ext.asyncio import (
     AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 )
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import text, event
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 
-from src.config import Config
+from src.config import Config, config as app_config
 from src.datalayer.model.sqlalchemy_models import Base
 
 logger = logging.getLogger(__name__)
 
+# A DO block keeps this a single statement, which asyncpg can prepare
+# (multi-statement strings are rejected by the extended query protocol).
+# pg_trgm provides the gin_trgm_ops operator class used by the search indexes
+CREATE_SCHEMAS_SQL = """
+DO $$
+BEGIN
+    CREATE SCHEMA IF NOT EXISTS auth;
+    CREATE SCHEMA IF NOT EXISTS chats;
+    CREATE SCHEMA IF NOT EXISTS marketplace;
+    CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
+END $$
+"""
+
+HEALTH_CHECK_SQL = """
+SELECT
+    1 AS health_check,
+    (
+        SELECT COUNT(*)
+        FROM information_schema.schemata
+        WHERE schema_name IN ('auth', 'chats', 'marketplace')
+    ) AS schema_count
+"""
+
+HEALTH_CHECK_FULL_SQL = """
+SELECT
+    1 AS health_check,
+    version() AS version,
+    current_database() AS database,
+    (
+        SELECT COUNT(*)
+        FROM information_schema.schemata
+        WHERE schema_name IN ('auth', 'chats', 'marketplace')
+    ) AS schema_count
+"""
+
 class PostgreSQLManager:
     """Singleton PostgreSQL connection manager"""
     
     _instance: Optional['PostgreSQLManager'] = None
     _engine: Optional[AsyncEngine] = None
     _session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+    _config: Optional[Config] = None
     _initialized: bool = False
+    # Server invariants cached by health_check, cleared on new physical connections
+    _version: Optional[str] = None
+    _database_name: Optional[str] = None
     
     def __new__(cls) -> 'PostgreSQLManager':
         if cls._instance is None:
@@ -40,19 +81,29 @@ class PostgreSQLManager:
     def _initialize(self):
         """Initialize PostgreSQL connection"""
         try:
-            config = Config()
+            config = self._config = app_config
             logger.info(f"🔗 Initializing PostgreSQL connection - Host: {config.postgres_host}:{config.postgres_port}")
             
             # Create async engine
+            if config.postgres_use_null_pool:
+                # Explicit opt-in (e.g. CI tests) - every checkout opens a new connection
+                pool_options = {"poolclass": NullPool}
+            else:
+                pool_options = {
+                    "pool_size": config.postgres_pool_size,
+                    "max_overflow": config.postgres_max_overflow,
+                    "pool_pre_ping": True,  # Enable connection health checks
+                    "pool_recycle": config.postgres_pool_recycle,
+                    "pool_timeout": config.postgres_pool_timeout,
+                }
             self._engine = create_async_engine(
                 config.postgres_url,
                 echo=config.postgres_echo,
-                pool_size=config.postgres_pool_size,
-                max_overflow=config.postgres_max_overflow,
-                pool_pre_ping=True,  # Enable connection health checks
-                pool_recycle=3600,   # Recycle connections every hour
-                # Use NullPool for testing to avoid connection issues
-                poolclass=NullPool if config.app_env == 'test' else None
+                # Room for every repository statement shape (default 500)
+                query_cache_size=config.postgres_query_cache_size,
+                insertmanyvalues_page_size=config.postgres_insert_page_size,
+                connect_args={"prepared_statement_cache_size": config.postgres_statement_cache_size},
+                **pool_options
             )
             
             # Create session factory
@@ -64,7 +115,8 @@ class PostgreSQLManager:
                 expire_on_commit=False
             )
             
-            # Add event listeners for connection handling
+            # timezone and search_path come from the role defaults set in
+            # init.sql (ALTER ROLE ... SET), so no per-connection SETs here
             self._setup_event_listeners()
             
             PostgreSQLManager._initialized = True
@@ -78,14 +130,10 @@ class PostgreSQLManager:
         """Setup SQLAlchemy event listeners"""
         
         @event.listens_for(self._engine.sync_engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            """Set connection-level settings for PostgreSQL"""
-            if 'postgresql' in str(dbapi_connection.__class__):
-                with dbapi_connection.cursor() as cursor:
-                    # Set timezone
-                    cursor.execute("SET timezone TO 'UTC'")
-                    # Set schema search path
-                    cursor.execute("SET search_path TO auth, chats, marketplace, public")
+        def reset_server_info(dbapi_connection, connection_record):
+            """Forget cached server info - a new connection may reach a different server"""
+            self._version = None
+            self._database_name = None
     
     @property
     def engine(self) -> AsyncEngine:
@@ -110,8 +158,6 @@ class PostgreSQLManager:
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
     
     @asynccontextmanager
     async def get_transaction_session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -123,17 +169,13 @@ class PostgreSQLManager:
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
     
     async def create_all_tables(self):
         """Create all database tables"""
         try:
             async with self._engine.begin() as conn:
-                # Create schemas first
-                await conn.execute(text("CREATE SCHEMA IF NOT EXISTS auth"))
-                await conn.execute(text("CREATE SCHEMA IF NOT EXISTS chats"))
-                await conn.execute(text("CREATE SCHEMA IF NOT EXISTS marketplace"))
+                # Create schemas first - one statement, one round-trip
+                await conn.exec_driver_sql(CREATE_SCHEMAS_SQL)
                 
                 # Create all tables
                 await conn.run_sync(Base.metadata.create_all)
@@ -158,34 +200,36 @@ class PostgreSQLManager:
         """Check PostgreSQL connection health"""
         try:
             async with self.get_session() as session:
-                # Test basic connectivity
-                result = await session.execute(text("SELECT 1 as health_check"))
-                health_value = result.scalar()
-                
-                # Get version info
-                version_result = await session.execute(text("SELECT version()"))
-                version = version_result.scalar()
-                
-                # Get current database name
-                db_result = await session.execute(text("SELECT current_database()"))
-                database = db_result.scalar()
+                # Check out the connection first: opening a new one fires the
+                # connect listener, which clears the cached server info
+                await session.connection()
+                if self._version is not None and self._database_name is not None:
+                    # version()/current_database() are cached - only check liveness
+                    result = await session.execute(text(HEALTH_CHECK_SQL))
+                    row = result.one()
+                else:
+                    # Connectivity, version, database name and schema count in one round-trip
+                    result = await session.execute(text(HEALTH_CHECK_FULL_SQL))
+                    row = result.one()
+                    self._version = row.version
+                    self._database_name = row.database
+                health_value = row.health_check
+                version = self._version
+                database = self._database_name
+                schema_count = row.schema_count
                 
-                # Get schema info - simplified approach
-                schema_result = await session.execute(text("""
-                    SELECT COUNT(*) 
-                    FROM information_schema.schemata 
-                    WHERE schema_name IN ('auth', 'chats', 'marketplace')
-                """))
-                schema_count = schema_result.scalar()
+                # NullPool (POSTGRES_NULL_POOL) keeps no connections - no stats to report
+                pool = self._engine.pool
+                has_stats = isinstance(pool, QueuePool)
                 
                 return {
                     "status": "healthy" if health_value == 1 else "unhealthy",
                     "database": database,
                     "version": version,
                     "schema_count": schema_count,
-                    "pool_size": self._engine.pool.size(),
-                    "pool_checked_out": self._engine.pool.checkedout(),
-                    "pool_overflow": self._engine.pool.overflow(),
+                    "pool_size": pool.size() if has_stats else None,
+                    "pool_checked_out": pool.checkedout() if has_stats else None,
+                    "pool_overflow": pool.overflow() if has_stats else None,
                 }
                 
         except Exception as e:
@@ -195,29 +239,61 @@ class PostgreSQLManager:
                 "error": str(e)
             }
     
-    async def wait_for_connection(self, max_retries: int = 30, retry_delay: float = 2.0) -> bool:
-        """Wait for PostgreSQL to be available with retry logic"""
-        config = Config()
+    async def _probe_connection(self, config: Config, timeout: float = 1.0) -> None:
+        """Open and close a bare asyncpg connection - raises if PostgreSQL is unreachable"""
+        conn = await asyncio.wait_for(
+            asyncpg.connect(
+                host=config.postgres_host,
+                port=config.postgres_port,
+                user=config.postgres_user,
+                password=config.postgres_password,
+                database=config.postgres_db
+            ),
+            timeout=timeout
+        )
+        await conn.close()
+    
+    async def wait_for_connection(
+        self,
+        max_retries: int = 30,
+        retry_delay: float = 2.0,
+        total_timeout: float = 300.0
+    ) -> bool:
+        """Wait for PostgreSQL to be available with retry logic (jittered exponential backoff)"""
+        config = self._config
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + total_timeout
         
         for attempt in range(1, max_retries + 1):
             try:
                 logger.info(f"🔄 Attempting to connect to PostgreSQL (attempt {attempt}/{max_retries})")
                 
+                # Cheap probe first - no session/pool setup while the server is still down
+                await self._probe_connection(config)
+                
                 health = await self.health_check()
                 if health["status"] == "healthy":
                     logger.info(f"✅ Successfully connected to PostgreSQL database: {health['database']}")
                     return True
-                    
+                logger.warning(f"⚠️ PostgreSQL reachable but unhealthy: {health.get('error')}")
+                
+            except (asyncpg.InvalidPasswordError, asyncpg.InvalidCatalogNameError) as e:
+                # Configuration problems - retrying will not fix them
+                logger.error(f"❌ PostgreSQL rejected the connection, not retrying: {e}")
+                return False
             except Exception as e:
                 logger.warning(f"⚠️ PostgreSQL connection attempt {attempt} failed: {e}")
-                
-                if attempt < max_retries:
-                    logger.info(f"🕐 Waiting {retry_delay} seconds before retry...")
-                    await asyncio.sleep(retry_delay)
-                else:
-                    logger.error(f"❌ Failed to connect to PostgreSQL after {max_retries} attempts")
+            
+            if attempt < max_retries:
+                delay = min(retry_delay * (2 ** (attempt - 1)), 30)
+                delay *= 0.5 + random.random()
+                if loop.time() + delay > deadline:
+                    logger.error(f"❌ Gave up waiting for PostgreSQL after {total_timeout} seconds")
                     return False
+                logger.info(f"🕐 Waiting {delay:.1f} seconds before retry...")
+                await asyncio.sleep(delay)
         
+        logger.error(f"❌ Failed to connect to PostgreSQL after {max_retries} attempts")
         return False
     
     async def close(self):
@@ -245,9 +321,13 @@ async def health_check() -> dict:
     """Convenience function for health check"""
     return await postgres_manager.health_check()
 
-async def wait_for_postgres_connection(max_retries: int = 30, retry_delay: float = 2.0) -> bool:
+async def wait_for_postgres_connection(
+    max_retries: int = 30,
+    retry_delay: float = 2.0,
+    total_timeout: float = 300.0
+) -> bool:
     """Convenience function for waiting for PostgreSQL connection"""
-    return await postgres_manager.wait_for_connection(max_retries, retry_delay)
+    return await postgres_manager.wait_for_connection(max_retries, retry_delay, total_timeout)
 
 async def create_all_tables():
     """Convenience function for creating all tables"""
@@ -23,106 +23,130 @@ ALTER SCHEMA chats OWNER TO postgres;
 CREATE SCHEMA IF NOT EXISTS marketplace;
 ALTER SCHEMA marketplace OWNER TO postgres;
 
+-- Session defaults for the application role, applied by the server at login
+-- so the app does not have to issue SET statements on every new connection
+ALTER ROLE CURRENT_USER SET timezone = 'UTC';
+ALTER ROLE CURRENT_USER SET search_path = auth, chats, marketplace, public;
+
 -- Create extension (fallback for crypto functions)
 CREATE EXTENSION IF NOT EXISTS pgcrypto WITH SCHEMA public;
 COMMENT ON EXTENSION pgcrypto IS 'cryptographic functions';
 
+-- Trigram operator classes for the ILIKE '%query%' search indexes
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
+
+-- ENUM TYPES (values mirror the Python enums in sqlalchemy_models.py)
+CREATE TYPE chats.conversation_status AS ENUM ('active', 'archived', 'deleted');
+CREATE TYPE chats.message_role AS ENUM ('user', 'bot');
+CREATE TYPE marketplace.bot_status AS ENUM ('active', 'inactive', 'pending', 'rejected');
+
+-- Columns are declared widest-alignment first (8-byte timestamps and
+-- bigints, then uuids, enums and booleans, then variable-length text)
+-- so PostgreSQL does not insert alignment padding inside each row
+
 -- AUTH SCHEMA TABLES
 CREATE TABLE auth.users (
+    user_created_at timestamp with time zone DEFAULT now() NOT NULL,
+    user_updated_at timestamp with time zone DEFAULT now() NOT NULL,
     user_id uuid NOT NULL,
     user_name character varying(255) NOT NULL,
     user_surname character varying(255) NOT NULL,
     user_email character varying(254) NOT NULL,
-    user_created_at timestamp with time zone DEFAULT now() NOT NULL,
-    user_updated_at timestamp with time zone DEFAULT now() NOT NULL,
     password_hash text NOT NULL,
     CONSTRAINT email_lowercase CHECK (((user_email)::text = lower((user_email)::text))),
     CONSTRAINT email_syntax CHECK (((user_email)::text ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$'::text))
 );
 
 CREATE TABLE auth.user_profiles (
+    updated_at timestamp with time zone DEFAULT now() NOT NULL,
     user_id uuid NOT NULL,
     bio text,
-    avatar_url text,
-    updated_at timestamp with time zone DEFAULT now() NOT NULL
+    avatar_url text
 );
 
 CREATE TABLE auth.user_settings (
+    updated_at timestamp with time zone DEFAULT now() NOT NULL,
     user_id uuid NOT NULL,
-    theme character varying(20) DEFAULT 'dark'::character varying,
     notifications_enabled boolean DEFAULT true,
-    language character varying(10) DEFAULT 'tr'::character varying,
     privacy_mode boolean DEFAULT false,
-    bot_behavior character varying(255) DEFAULT 'kind'::character varying,
-    updated_at timestamp with time zone DEFAULT now() NOT NULL
+    theme character varying(20) DEFAULT 'dark'::character varying,
+    language character varying(10) DEFAULT 'tr'::character varying,
+    bot_behavior character varying(255) DEFAULT 'kind'::character varying
 );
 
 -- MARKETPLACE SCHEMA TABLES
 CREATE TABLE marketplace.bot_categories (
+    created_at timestamp with time zone DEFAULT now() NOT NULL,
+    updated_at timestamp with time zone DEFAULT now() NOT NULL,
     category_id uuid NOT NULL,
     category_name character varying(100) NOT NULL,
     category_description text,
-    created_at timestamp with time zone DEFAULT now() NOT NULL,
-    updated_at timestamp with time zone DEFAULT now() NOT NULL
+    search_tsv tsvector GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(category_name, '') || ' ' || coalesce(category_description, ''))
+    ) STORED
 );
 
 CREATE TABLE marketplace.bots (
+    created_at timestamp with time zone DEFAULT now() NOT NULL,
+    updated_at timestamp with time zone DEFAULT now() NOT NULL,
     bot_id uuid NOT NULL,
-    default_system_prompt text,
-    default_knowledge text,
-    bot_name character varying(255) NOT NULL,
-    bot_description text,
-    bot_avatar_url text,
     bot_category_id uuid,
     bot_owner_id uuid NOT NULL,
-    bot_status character varying(50) DEFAULT 'active'::character varying NOT NULL,
+    bot_status marketplace.bot_status DEFAULT 'active' NOT NULL,
     is_public boolean DEFAULT true NOT NULL,
+    bot_name character varying(255) NOT NULL,
     bot_version character varying(50) DEFAULT '1.0'::character varying,
-    created_at timestamp with time zone DEFAULT now() NOT NULL,
-    updated_at timestamp with time zone DEFAULT now() NOT NULL,
+    bot_avatar_url text,
+    bot_description text,
+    default_system_prompt text,
+    default_knowledge text,
     bot_default_memory text
 );
 
 -- CHATS SCHEMA TABLES
 CREATE TABLE chats.conversation (
+    conversation_created_at timestamp with time zone DEFAULT now() NOT NULL,
+    conversation_updated_at timestamp with time zone DEFAULT now() NOT NULL,
     conversation_id uuid NOT NULL,
     conversation_user_id uuid NOT NULL,
     conversation_bot_id uuid NOT NULL,
+    conversation_status chats.conversation_status DEFAULT 'active' NOT NULL,
+    conversation_title character varying(255),
     default_system_prompt text,
     default_knowledge text,
-    memory text,
-    conversation_title character varying(255),
-    conversation_status character varying(50) DEFAULT 'active'::character varying NOT NULL,
-    conversation_created_at timestamp with time zone DEFAULT now() NOT NULL,
-    conversation_updated_at timestamp with time zone DEFAULT now() NOT NULL
+    memory text
 );
 
 CREATE TABLE chats.message (
+    created_at timestamp with time zone DEFAULT now() NOT NULL,
+    updated_at timestamp with time zone DEFAULT now() NOT NULL,
     message_id uuid NOT NULL,
     message_conversation_id uuid NOT NULL,
     message_parent_message_id uuid,
-    message_role character varying(20) NOT NULL,
     message_bot_id uuid,
-    created_at timestamp with time zone DEFAULT now() NOT NULL,
-    updated_at timestamp with time zone DEFAULT now() NOT NULL
+    message_role chats.message_role NOT NULL
 );
 
 CREATE TABLE chats.document (
+    created_at timestamp with time zone DEFAULT now() NOT NULL,
+    updated_at timestamp with time zone DEFAULT now() NOT NULL,
+    document_file_size bigint NOT NULL,
     document_id uuid NOT NULL,
     document_uploaded_by uuid NOT NULL,
+    document_message_id uuid NOT NULL,
     document_filename character varying(500) NOT NULL,
-    document_file_size bigint NOT NULL,
     document_mime_type character varying(100) NOT NULL,
-    document_content text NOT NULL,
-    document_message_id uuid NOT NULL,
-    created_at timestamp with time zone DEFAULT now() NOT NULL,
-    updated_at timestamp with time zone DEFAULT now() NOT NULL
-);
+    document_file_type character varying(100) GENERATED ALWAYS AS (
+        CASE WHEN strpos(document_mime_type, '/') > 0
+        THEN split_part(document_mime_type, '/', 1) ELSE 'unknown' END
+    ) STORED,
+    document_content text NOT NULL
+) WITH (toast_tuple_target = 128);  -- keep large content out of the heap page
 
 CREATE TABLE chats.memory_history (
+    date_time timestamp without time zone NOT NULL,
     id uuid NOT NULL,
     conversation_id uuid NOT NULL,
-    date_time timestamp without time zone NOT NULL,
     memory_history text NOT NULL
 );
 
@@ -151,6 +175,7 @@ ALTER TABLE ONLY marketplace.bots ADD CONSTRAINT bots_bot_name_key UNIQUE (bot_n
 ALTER TABLE ONLY chats.conversation ADD CONSTRAINT conversation_pkey PRIMARY KEY (conversation_id);
 ALTER TABLE ONLY chats.message ADD CONSTRAINT message_pkey PRIMARY KEY (message_id);
 ALTER TABLE ONLY chats.document ADD CONSTRAINT document_pkey PRIMARY KEY (document_id);
+ALTER TABLE ONLY chats.document ADD CONSTRAINT ck_document_file_size CHECK (document_file_size >= 0);
 ALTER TABLE ONLY chats.memory_history ADD CONSTRAINT memort_history_pkey PRIMARY KEY (id);
 
 -- FOREIGN KEY CONSTRAINTS
@@ -173,18 +198,28 @@ ALTER TABLE ONLY chats.document ADD CONSTRAINT fk_document_uploaded_by FOREIGN K
 ALTER TABLE ONLY chats.memory_history ADD CONSTRAINT fk_memory_conversation FOREIGN KEY (conversation_id) REFERENCES chats.conversation(conversation_id) ON DELETE CASCADE;
 
 -- PERFORMANCE INDEXES
-CREATE INDEX idx_users_email ON auth.users(user_email);
-CREATE INDEX idx_conversation_user_id ON chats.conversation(conversation_user_id);
 CREATE INDEX idx_conversation_bot_id ON chats.conversation(conversation_bot_id);
-CREATE INDEX idx_message_conversation_id ON chats.message(message_conversation_id);
-CREATE INDEX idx_message_created_at ON chats.message(created_at DESC);
 CREATE INDEX idx_message_parent_id ON chats.message(message_parent_message_id);
-CREATE INDEX idx_document_message_id ON chats.document(document_message_id);
-CREATE INDEX idx_memory_conversation_id ON chats.memory_history(conversation_id);
-CREATE INDEX idx_memory_datetime ON chats.memory_history(date_time DESC);
 CREATE INDEX idx_bots_owner_id ON marketplace.bots(bot_owner_id);
 CREATE INDEX idx_bots_category_id ON marketplace.bots(bot_category_id);
 CREATE INDEX idx_bots_public ON marketplace.bots(is_public) WHERE is_public = true;
+-- Composite indexes matching the "WHERE fk = ? ORDER BY time" list queries
+CREATE INDEX ix_conv_user_updated ON chats.conversation(conversation_user_id, conversation_updated_at DESC);
+CREATE INDEX ix_msg_conv_created ON chats.message(message_conversation_id, created_at) INCLUDE (message_role, message_bot_id);
+CREATE INDEX ix_doc_msg_created ON chats.document(document_message_id, created_at);
+CREATE INDEX ix_doc_file_type ON chats.document(document_file_type);
+CREATE INDEX ix_memhist_conv_time ON chats.memory_history(conversation_id, date_time DESC);
+-- Append-only tables: rows arrive in time order, so a BRIN summary of block
+-- ranges serves time-range scans at a tiny fraction of a btree's size
+CREATE INDEX brin_msg_created ON chats.message USING brin (created_at);
+CREATE INDEX brin_memhist_time ON chats.memory_history USING brin (date_time);
+-- Substring search (ILIKE '%query%') cannot use a btree; trigram GIN can
+CREATE INDEX ix_bot_name_trgm ON marketplace.bots USING gin (bot_name public.gin_trgm_ops);
+CREATE INDEX ix_bot_description_trgm ON marketplace.bots USING gin (bot_description public.gin_trgm_ops);
+CREATE INDEX ix_category_name_trgm ON marketplace.bot_categories USING gin (category_name public.gin_trgm_ops);
+CREATE INDEX ix_category_description_trgm ON marketplace.bot_categories USING gin (category_description public.gin_trgm_ops);
+-- Multi-word category search matches words through the full-text vector
+CREATE INDEX ix_category_search_tsv ON marketplace.bot_categories USING gin (search_tsv);
 
 -- Success message
 SELECT 'Database schema created successfully! UUID generation will be handled by Python.' as result;
\ No newline at end of file
@@ -1,8 +1,10 @@
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 import logging
 import os
 import asyncio
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi.responses import ORJSONResponse, Response
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
@@ -24,6 +26,64 @@ from exceptions import (
 setup_logger()
 logger = logging.getLogger(__name__)
 
+ALEMBIC_INI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "alembic.ini")
+MIGRATION_MODES = ("sync", "async", "skip")
+
+
+def _alembic_upgrade_head():
+    """Run `alembic upgrade head` (blocking, meant for a worker thread)"""
+    from alembic import command
+    from alembic.config import Config as AlembicConfig
+
+    alembic_config = AlembicConfig(ALEMBIC_INI_PATH)
+    # Keep the app's logging setup - see alembic/env.py
+    alembic_config.attributes["configure_logger"] = False
+    command.upgrade(alembic_config, "head")
+
+
+async def _run_alembic(app: FastAPI):
+    """Run migrations in a worker thread and track their state"""
+    status = app.state.migration_status
+    status["status"] = "running"
+    try:
+        # alembic/env.py takes the advisory lock, so concurrent workers wait
+        # for the first one and then find nothing left to upgrade
+        await asyncio.to_thread(_alembic_upgrade_head)
+        status["status"] = "succeeded"
+        logger.info("Database migrations completed")
+    except Exception as e:
+        status["status"] = "failed"
+        status["error"] = str(e)
+        logger.error(f"Database migrations failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    mode = os.getenv("MIGRATION_MODE", "async").lower()
+    if mode not in MIGRATION_MODES:
+        logger.warning(f"Unknown MIGRATION_MODE '{mode}', falling back to 'async'")
+        mode = "async"
+
+    app.state.migration_status = {"mode": mode, "status": "pending", "error": None}
+    migration_task = None
+
+    if mode == "sync":
+        await _run_alembic(app)
+        if app.state.migration_status["status"] == "failed":
+            # Sync mode promises a migrated schema before serving - refuse to start
+            raise RuntimeError(f"Database migrations failed: {app.state.migration_status['error']}")
+    elif mode == "async":
+        # Serve requests immediately, migrations finish in the background
+        migration_task = asyncio.create_task(_run_alembic(app))
+    else:
+        app.state.migration_status["status"] = "skipped"
+
+    yield
+
+    if migration_task and not migration_task.done():
+        migration_task.cancel()
+
+
 app = FastAPI(
     title="Chat Marketplace Service",
     description="A production-ready REST API for WhatsApp-like chat marketplace with comprehensive user, conversation, message, and bot management operations",
@@ -37,6 +97,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     redirect_slashes=False,  # Disable automatic redirect for trailing slashes
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -55,186 +117,55 @@ if os.path.exists(static_dir):
 else:
     logger.warning(f"Static directory not found: {static_dir}")
 
-# Include routers
-try:
-    app.include_router(health_router)
-    logger.info("Health routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include health routes: {e}")
-
-try:
-    app.include_router(user_router)
-    logger.info("User routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include user routes: {e}")
-
-try:
-    app.include_router(profile_router)
-    logger.info("Profile routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include profile routes: {e}")
-
-try:
-    app.include_router(profile_search_router)
-    logger.info("Profile search routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include profile search routes: {e}")
-
-try:
-    app.include_router(settings_router)
-    logger.info("Settings routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include settings routes: {e}")
-
-try:
-    app.include_router(conversation_router)
-    logger.info("Conversation routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include conversation routes: {e}")
-
-try:
-    app.include_router(message_router)
-    logger.info("Message routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include message routes: {e}")
-
-try:
-    app.include_router(documents_router)
-    logger.info("Documents routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include documents routes: {e}")
-
-try:
-    app.include_router(memory_router)
-    logger.info("Memory routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include memory routes: {e}")
-
-try:
-    app.include_router(categories_router)
-    logger.info("Categories routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include categories routes: {e}")
-
-try:
-    app.include_router(bots_router)
-    logger.info("Bots routes included successfully")
-except Exception as e:
-    logger.error(f"Failed to include bots routes: {e}")
-
-# Exception handlers
-@app.exception_handler(ValidationError)
-async def validation_exception_handler(request, exc: ValidationError):
-    logger.warning(f"Validation error: {exc.message}")
-    return JSONResponse(
-        status_code=400,
-        content={
-            "detail": exc.message,
-            "code": exc.code,
-            "details": exc.details
-        }
-    )
-
-@app.exception_handler(NotFoundError)
-async def not_found_exception_handler(request, exc: NotFoundError):
-    logger.warning(f"Not found error: {exc.message}")
-    return JSONResponse(
-        status_code=404,
-        content={
-            "detail": exc.message,
-            "code": exc.code,
-            "details": exc.details
-        }
-    )
-
-@app.exception_handler(DuplicateError)
-async def duplicate_exception_handler(request, exc: DuplicateError):
-    logger.warning(f"Duplicate error: {exc.message}")
-    return JSONResponse(
-        status_code=409,
-        content={
-            "detail": exc.message,
-            "code": exc.code,
-            "details": exc.details
-        }
-    )
-
-@app.exception_handler(AuthenticationError)
-async def authentication_exception_handler(request, exc: AuthenticationError):
-    logger.warning(f"Authentication error: {exc.message}")
-    return JSONResponse(
-        status_code=401,
-        content={
-            "detail": exc.message,
-            "code": exc.code,
-            "details": exc.details
-        }
-    )
-
-@app.exception_handler(AuthorizationError)
-async def authorization_exception_handler(request, exc: AuthorizationError):
-    logger.warning(f"Authorization error: {exc.message}")
-    return JSONResponse(
-        status_code=403,
-        content={
-            "detail": exc.message,
-            "code": exc.code,
-            "details": exc.details
-        }
-    )
+# Include routers - a failure here should abort startup, not be swallowed
+ROUTERS = (
+    health_router, user_router, profile_router, profile_search_router,
+    settings_router, conversation_router, message_router, documents_router,
+    memory_router, categories_router, bots_router
+)
+for router in ROUTERS:
+    app.include_router(router)
+logger.info("Included %d routers", len(ROUTERS))
+
+# Exception handlers - exception class -> (status code, log level, log label)
+EXCEPTION_STATUS = {
+    ValidationError: (400, logging.WARNING, "Validation error"),
+    NotFoundError: (404, logging.WARNING, "Not found error"),
+    DuplicateError: (409, logging.WARNING, "Duplicate error"),
+    AuthenticationError: (401, logging.WARNING, "Authentication error"),
+    AuthorizationError: (403, logging.WARNING, "Authorization error"),
+    DatabaseError: (500, logging.ERROR, "Database error"),
+    ServiceUnavailableError: (503, logging.ERROR, "Service unavailable"),
+    RateLimitExceededError: (429, logging.WARNING, "Rate limit exceeded"),
+    ChatMarketplaceException: (500, logging.ERROR, "Chat marketplace exception"),
+}
 
-@app.exception_handler(DatabaseError)
-async def database_exception_handler(request, exc: DatabaseError):
-    logger.error(f"Database error: {exc.message}")
-    return JSONResponse(
-        status_code=500,
-        content={
+async def chat_marketplace_exception_handler(request, exc: ChatMarketplaceException):
+    # Subclasses (e.g. UserNotFoundError) resolve to their nearest mapped base
+    for exc_class in type(exc).__mro__:
+        if exc_class in EXCEPTION_STATUS:
+            break
+    status_code, level, label = EXCEPTION_STATUS[exc_class]
+    logger.log(level, f"{label}: {exc.message}")
+
+    if isinstance(exc, DatabaseError):
+        # Never leak database details to clients
+        content = {
             "detail": "Database operation failed",
             "code": exc.code,
             "details": {"message": "Please try again later"}
         }
-    )
-
-@app.exception_handler(ServiceUnavailableError)
-async def service_unavailable_exception_handler(request, exc: ServiceUnavailableError):
-    logger.error(f"Service unavailable: {exc.message}")
-    return JSONResponse(
-        status_code=503,
-        content={
-            "detail": exc.message,
-            "code": exc.code,
-            "details": exc.details
-        }
-    )
-
-@app.exception_handler(RateLimitExceededError)
-async def rate_limit_exception_handler(request, exc: RateLimitExceededError):
-    logger.warning(f"Rate limit exceeded: {exc.message}")
-    return JSONResponse(
-        status_code=429,
-        content={
-            "detail": exc.message,
-            "code": exc.code,
-            "details": exc.details
-        }
-    )
+    else:
+        content = exc.payload
+    return ORJSONResponse(status_code=status_code, content=content)
 
-@app.exception_handler(ChatMarketplaceException)
-async def chat_marketplace_exception_handler(request, exc: ChatMarketplaceException):
-    logger.error(f"Chat marketplace exception: {exc.message}")
-    return JSONResponse(
-        status_code=500,
-        content={
-            "detail": exc.message,
-            "code": exc.code,
-            "details": exc.details
-        }
-    )
+for exc_class in EXCEPTION_STATUS:
+    app.add_exception_handler(exc_class, chat_marketplace_exception_handler)
 
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc: ValueError):
     logger.warning(f"Value error: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={
             "detail": str(exc),
@@ -245,7 +176,7 @@ async def value_error_handler(request, exc: ValueError):
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -253,29 +184,33 @@ async def global_exception_handler(request, exc):
             "error": str(exc) if os.getenv("APP_ENV") == "development" else "An unexpected error occurred"
         }
     )
+# Root endpoint payload - fully static, so it is serialized once at import
+ROOT_PAYLOAD = {
+    "service": "Chat Marketplace Service",
+    "version": "2.0.0",
+    "description": "REST API for WhatsApp-like chat marketplace with comprehensive user, conversation, message, and bot management",
+    "docs_url": "/docs",
+    "health_url": "/health",
+    "trailing_slash_support": "Both with and without trailing slashes are supported",
+    "endpoints": {
+        "users": "/users",
+        "user_profiles": "/users/{user_id}/profile",
+        "user_settings": "/users/{user_id}/settings",
+        "conversations": "/users/{user_id}/conversations",
+        "messages": "/users/{user_id}/conversations/{conversation_id}/messages",
+        "documents": "/users/{user_id}/conversations/{conversation_id}/documents",
+        "memory": "/users/{user_id}/conversations/{conversation_id}/memory-history",
+        "bot_categories": "/marketplace/bot-categories",
+        "bots": "/marketplace/bots",
+        "admin": "/admin/*"
+    }
+}
+ROOT_BODY = orjson.dumps(ROOT_PAYLOAD)
+
 # Helper function for root endpoint
 async def _root_impl():
     """Implementation for root endpoint"""
-    return {
-        "service": "Chat Marketplace Service",
-        "version": "2.0.0",
-        "description": "REST API for WhatsApp-like chat marketplace with comprehensive user, conversation, message, and bot management",
-        "docs_url": "/docs",
-        "health_url": "/health",
-        "trailing_slash_support": "Both with and without trailing slashes are supported",
-        "endpoints": {
-            "users": "/users",
-            "user_profiles": "/users/{user_id}/profile",
-            "user_settings": "/users/{user_id}/settings",
-            "conversations": "/users/{user_id}/conversations",
-            "messages": "/users/{user_id}/conversations/{conversation_id}/messages",
-            "documents": "/users/{user_id}/conversations/{conversation_id}/documents",
-            "memory": "/users/{user_id}/conversations/{conversation_id}/memory-history",
-            "bot_categories": "/marketplace/bot-categories",
-            "bots": "/marketplace/bots",
-            "admin": "/admin/*"
-        }
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 # Root endpoints - both with and without trailing slash
 @app.get(
@@ -288,6 +223,21 @@ async def root():
     """API root endpoint (without trailing slash)"""
     return await _root_impl()
 
+# OpenAPI schema - FastAPI caches the dict but re-encodes it on every request,
+# so its route is replaced with one serving bytes encoded on first request
+# (not in lifespan, which not every ASGI host or TestClient runs)
+app.router.routes[:] = [
+    route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url
+]
+_openapi_body = None
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_json():
+    global _openapi_body
+    if _openapi_body is None:
+        _openapi_body = orjson.dumps(app.openapi())
+    return Response(content=_openapi_body, media_type="application/json")
+
 # Note: FastAPI doesn't support empty string paths well,
 # so trailing slash support is handled by redirect_slashes=False setting
 
@@ -1,143 +1,171 @@
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from pathlib import Path
 import os
+from typing import Optional
 
+
+@lru_cache(maxsize=None)
+def _parse_env_file(path: str) -> dict:
+    """Parse KEY=VALUE lines of an env file (read once per path)"""
+    values = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export "):].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
+            value = value[1:-1]
+        values[key] = value
+    return values
+
+
+def _parse_int(raw: str) -> int:
+    return int(raw)
+
+
+def _parse_bool(raw: str) -> bool:
+    return raw.lower() == "true"
+
+
+_DEFAULT_POOL_SIZE = max(8, (os.cpu_count() or 4) * 2)
+
+
+# (attribute, environment variable, parser, default)
+_SCHEMA = (
+    # PostgreSQL configuration
+    ("postgres_host", "POSTGRES_HOST", str, "localhost"),
+    ("postgres_port", "POSTGRES_PORT", _parse_int, 5432),
+    ("postgres_db", "POSTGRES_DB", str, "chat_marketplace"),
+    ("postgres_user", "POSTGRES_USER", str, "postgres"),
+    ("postgres_password", "POSTGRES_PASSWORD", str, "password"),
+    ("postgres_echo", "POSTGRES_ECHO", _parse_bool, False),
+    # Pool defaults to 2x CPU count (min 8), overflow to the pool size
+    ("postgres_pool_size", "POSTGRES_POOL_SIZE", _parse_int, _DEFAULT_POOL_SIZE),
+    ("postgres_max_overflow", "POSTGRES_MAX_OVERFLOW", _parse_int, None),
+    # Seconds before a pooled connection is replaced (below typical server/proxy idle timeouts)
+    ("postgres_pool_recycle", "POSTGRES_POOL_RECYCLE", _parse_int, 1800),
+    # Seconds to wait for a free connection before failing the checkout
+    ("postgres_pool_timeout", "POSTGRES_POOL_TIMEOUT", _parse_int, 30),
+    # Compiled SQL cache entries per engine (SQLAlchemy default 500 is
+    # smaller than the number of distinct repository statement shapes)
+    ("postgres_query_cache_size", "POSTGRES_QUERY_CACHE_SIZE", _parse_int, 1200),
+    # Prepared statements kept per connection by the asyncpg dialect (default
+    # 100) - room for every repository statement so none is re-parsed/planned
+    ("postgres_statement_cache_size", "POSTGRES_STATEMENT_CACHE_SIZE", _parse_int, 512),
+    # Rows per multi-row INSERT ... VALUES statement on bulk inserts
+    ("postgres_insert_page_size", "POSTGRES_INSERT_PAGE_SIZE", _parse_int, 1000),
+    # Opt-in, e.g. for CI tests
+    ("postgres_use_null_pool", "POSTGRES_NULL_POOL", _parse_bool, False),
+    # Admin API configuration
+    ("admin_api_key", "ADMIN_API_KEY", str, ""),
+    # Application configuration
+    ("app_name", "APP_NAME", str, "Chat Marketplace Service"),
+    ("app_version", "APP_VERSION", str, "2.0.0"),
+    ("app_port", "APP_PORT", _parse_int, 8080),
+    ("app_env", "APP_ENV", str, "development"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-        return cls._instance
-    
-    def __init__(self) -> None:
-        # Eğer daha önce initialize edilmişse tekrar yapma
-        if Config._initialized:
-            return
-            
-        # Load .env file
-        self._load_env_file()
-        
-        # PostgreSQL configuration
-        self.postgres_host = self._get_postgres_host()
-        self.postgres_port = self._get_postgres_port()
-        self.postgres_db = self._get_postgres_db()
-        self.postgres_user = self._get_postgres_user()
-        self.postgres_password = self._get_postgres_password()
-        self.postgres_echo = self._get_postgres_echo()
-        self.postgres_pool_size = self._get_postgres_pool_size()
-        self.postgres_max_overflow = self._get_postgres_max_overflow()
-        
-        # Admin API configuration
-        self.admin_api_key = self._get_admin_api_key()
+    """Application configuration - built once at import, see `config` below"""
+    postgres_host: str
+    postgres_port: int
+    postgres_db: str
+    postgres_user: str
+    postgres_password: str
+    postgres_echo: bool
+    postgres_pool_size: int
+    postgres_max_overflow: Optional[int]
+    postgres_pool_recycle: int
+    postgres_pool_timeout: int
+    postgres_query_cache_size: int
+    postgres_statement_cache_size: int
+    postgres_insert_page_size: int
+    postgres_use_null_pool: bool
+    admin_api_key: str
+    app_name: str
+    app_version: str
+    app_port: int
+    app_env: str
+    # Derived in __post_init__
+    postgres_url: str = field(init=False)
+    postgres_sync_url: str = field(init=False)
+    _admin_enabled: bool = field(init=False, repr=False)
+    _valid: bool = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        # Frozen - derived values are set through object.__setattr__
+        set_ = partial(object.__setattr__, self)
         
-        # Application configuration
-        self.app_name = self._get_app_name()
-        self.app_version = self._get_app_version()
-        self.app_port = self._get_app_port()
-        self.app_env = self._get_app_env()
+        # Overflow defaults to the (possibly overridden) pool size
+        if self.postgres_max_overflow is None:
+            set_("postgres_max_overflow", self.postgres_pool_size)
         
-        Config._initialized = True
+        # Connection URLs
+        credentials = f"{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+        set_("postgres_url", f"postgresql+asyncpg://{credentials}")  # asyncpg
+        set_("postgres_sync_url", f"postgresql://{credentials}")  # psycopg2 (sync)
         
-    def _load_env_file(self) -> None:
-        env_path = os.getenv("ENV_PATH")
-        if env_path:
-            load_dotenv(env_path)
-        elif os.path.exists(".env.example"):
-            load_dotenv(".env.example")
-        elif os.path.exists(".env"):
-            load_dotenv(".env")
-        else:
-            # Don't raise an error, use defaults instead
-            pass
-    def _get_admin_api_key(self) -> str:
-        """Get admin API key from environment variable"""
-        return os.getenv("ADMIN_API_KEY", "")
-    
-    def _get_app_name(self) -> str:
-        """Get application name from environment variable"""
-        return os.getenv("APP_NAME", "Chat Marketplace Service")
-    
-    def _get_app_version(self) -> str:
-        """Get application version from environment variable"""
-        return os.getenv("APP_VERSION", "2.0.0")
-        return os.getenv("EMBEDDING_MODEL", "nomic-embed-text")
-    
-    def _get_app_port(self) -> int:
-        """Get application port from environment variable"""
-        return int(os.getenv("APP_PORT", "8080"))
-    
-    def _get_app_env(self) -> str:
-        """Get application environment from environment variable"""
-        return os.getenv("APP_ENV", "development")
-    
-    # PostgreSQL configuration getters
-    def _get_postgres_host(self) -> str:
-        """Get PostgreSQL host from environment variable"""
-        return os.getenv("POSTGRES_HOST", "localhost")
-    
-    def _get_postgres_port(self) -> int:
-        """Get PostgreSQL port from environment variable"""
-        return int(os.getenv("POSTGRES_PORT", "5432"))
-    
-    def _get_postgres_db(self) -> str:
-        """Get PostgreSQL database name from environment variable"""
-        return os.getenv("POSTGRES_DB", "chat_marketplace")
-    
-    def _get_postgres_user(self) -> str:
-        """Get PostgreSQL user from environment variable"""
-        return os.getenv("POSTGRES_USER", "postgres")
-    
-    def _get_postgres_password(self) -> str:
-        """Get PostgreSQL password from environment variable"""
-        return os.getenv("POSTGRES_PASSWORD", "password")
-    
-    def _get_postgres_echo(self) -> bool:
-        """Get PostgreSQL echo setting from environment variable"""
-        return os.getenv("POSTGRES_ECHO", "false").lower() == "true"
-    
-    def _get_postgres_pool_size(self) -> int:
-        """Get PostgreSQL pool size from environment variable"""
-        return int(os.getenv("POSTGRES_POOL_SIZE", "10"))
-    
-    def _get_postgres_max_overflow(self) -> int:
-        """Get PostgreSQL max overflow from environment variable"""
-        return int(os.getenv("POSTGRES_MAX_OVERFLOW", "20"))
-    
-    
-    @property
-    def postgres_url(self) -> str:
-        """Get PostgreSQL connection URL for asyncpg"""
-        return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
-    
-    @property
-    def postgres_sync_url(self) -> str:
-        """Get PostgreSQL connection URL for psycopg2 (sync)"""
-        return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
-    
-    def validate_config(self) -> bool:
-        """Validate configuration values"""
+        set_("_admin_enabled", bool(self.admin_api_key and self.admin_api_key.strip()))
         try:
             # PostgreSQL validation
-            if not self.postgres_host:
-                return False
-            if not self.postgres_port or self.postgres_port <= 0:
-                return False
-            if not self.postgres_db:
-                return False
-            if not self.postgres_user:
-                return False
-            if not self.postgres_password:
-                return False
-            if self.postgres_pool_size <= 0:
-                return False
-            if self.postgres_max_overflow < 0:
-                return False
-            
-            return True
+            valid = all((
+                self.postgres_host,
+                self.postgres_port and self.postgres_port > 0,
+                self.postgres_db,
+                self.postgres_user,
+                self.postgres_password,
+                self.postgres_pool_size > 0,
+                self.postgres_max_overflow >= 0,
+                self.postgres_pool_timeout > 0,
+                self.postgres_query_cache_size >= 0,
+                self.postgres_statement_cache_size >= 0,
+                self.postgres_insert_page_size > 0,
+            ))
         except Exception:
-            return False
+            valid = False
+        set_("_valid", valid)
+    
+    def validate_config(self) -> bool:
+        """Validate configuration values"""
+        return self._valid
     
     def is_admin_enabled(self) -> bool:
         """Check if admin features are enabled"""
-        return bool(self.admin_api_key and self.admin_api_key.strip())
\ No newline at end of file
+        return self._admin_enabled
+
+
+def _load_env_file() -> None:
+    env_path = os.getenv("ENV_PATH")
+    if not env_path:
+        if os.path.exists(".env.example"):
+            env_path = ".env.example"
+        elif os.path.exists(".env"):
+            env_path = ".env"
+        else:
+            # Don't raise an error, use defaults instead
+            return
+    # Like load_dotenv: variables already set in the environment win
+    os.environ.update({
+        key: value for key, value in _parse_env_file(env_path).items()
+        if key not in os.environ
+    })
+
+
+def _build_config() -> Config:
+    """Load the .env file, then read every value from a single environment snapshot"""
+    _load_env_file()
+    env = dict(os.environ)
+    return Config(**{
+        attr: cast(env[key]) if key in env else default
+        for attr, key, cast, default in _SCHEMA
+    })
+
+
+config = _build_config()
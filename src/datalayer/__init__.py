@@ -1,5 +1,7 @@
 # Datalayer exports for Chat Marketplace Service
 
+from importlib import import_module
+
 from .database import (
     DatabaseManager,
     db_manager,
@@ -8,10 +10,36 @@ from .database import (
     health_check
 )
 
+# Models, repositories and triggers are imported on first access (PEP 562)
+# so that importing the database manager does not build every DTO and mapper
+_LAZY_MODULES = {
+    ".model": (
+        "Base", "UserStatus", "ConversationStatus", "MessageType", "BotStatus",
+        "MessageRole", "User", "UserProfile", "UserSettings", "Conversation", "Message",
+        "Document", "MemoryHistory", "BotCategory", "Bot",
+    ),
+    ".repository": (
+        "BaseRepository", "AsyncBaseRepository", "RepositoryFactory",
+        "AsyncRepositoryFactory", "UserRepository", "UserProfileRepository",
+        "UserSettingsRepository", "ConversationRepository", "MessageRepository",
+        "DocumentRepository", "MemoryHistoryRepository", "BotCategoryRepository",
+        "BotRepository",
+    ),
+    ".triggers": (
+        "set_parent_message_trigger",
+        "manually_set_parent_message",
+        "validate_parent_message_chain",
+    ),
+}
+_LAZY_ATTRS = {name: module for module, names in _LAZY_MODULES.items() for name in names}
 
-from .repository import *
-from .model import *
-from .triggers import *
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # PostgreSQL Database
@@ -26,6 +54,7 @@ __all__ = [
     "ConversationStatus", 
     "MessageType",
     "BotStatus",
+    "MessageRole",
     "User",
     "UserProfile",
     "UserSettings",
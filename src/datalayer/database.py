@@ -7,7 +7,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from sqlalchemy import text
-from config import Config
+import orjson
+from config import config
+
+def _json_serializer(value) -> str:
+    """Encode JSON columns with orjson (asyncpg's text codec expects str)"""
+    return orjson.dumps(value).decode()
 
 class DatabaseManager:
     _instance = None
@@ -22,12 +27,32 @@ class DatabaseManager:
     
     def _initialize(self):
         try:
-            config = Config()  # Artık singleton olduğu için güvenli
             self._engine = create_async_engine(
-                f"postgresql+asyncpg://{config.postgres_user}:{config.postgres_password}@{config.postgres_host}:{config.postgres_port}/{config.postgres_db}",
+                config.postgres_url,
                 echo=False,  # Set to True for SQL logging
-                pool_size=20,
-                max_overflow=0
+                # Async engines use AsyncAdaptedQueuePool by default; overflow
+                # absorbs bursts instead of failing checkouts with max_overflow=0
+                pool_size=config.postgres_pool_size,
+                max_overflow=config.postgres_max_overflow,
+                pool_timeout=config.postgres_pool_timeout,
+                # Replace connections dropped by the server or a proxy
+                # before a request gets ConnectionDoesNotExistError
+                pool_pre_ping=True,
+                pool_recycle=config.postgres_pool_recycle,
+                connect_args={
+                    # Keep idle pooled connections from being cut by NAT/firewalls
+                    "server_settings": {"tcp_keepalives_idle": "60"},
+                    # Prepared (parsed/planned) statements kept per connection
+                    "prepared_statement_cache_size": config.postgres_statement_cache_size,
+                },
+                # Room for every repository statement shape so hot queries
+                # are compiled once, not on every execute
+                query_cache_size=config.postgres_query_cache_size,
+                # bulk_insert() rows are sent as multi-row INSERT ... VALUES batches
+                insertmanyvalues_page_size=config.postgres_insert_page_size,
+                # metadata/capabilities JSON columns are decoded in C, not by the json module
+                json_serializer=_json_serializer,
+                json_deserializer=orjson.loads
             )
             self._session_local = async_sessionmaker(
                 self._engine,
@@ -57,8 +82,6 @@ class DatabaseManager:
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
     
     async def health_check(self) -> dict:
         """Simple health check"""
@@ -90,8 +113,6 @@ async def get_postgres_session() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 # Health check function
 async def health_check() -> dict:
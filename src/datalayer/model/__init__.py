@@ -10,6 +10,7 @@ __all__ = [
     "ConversationStatus", 
     "MessageType",
     "BotStatus",
+    "MessageRole",
     "User",
     "UserProfile",
     "UserSettings",
@@ -21,6 +22,7 @@ __all__ = [
     "Bot",
     # DTOs
     "BaseDto",
+    "PaginatedDto",
     # Auth DTOs
     "UserCreateDto",
     "UserUpdateDto", 
@@ -1,12 +1,25 @@
 # DTO exports for Chat Marketplace Service
 
-from .base_dto import BaseDto
+from .base_dto import BaseDto, PaginatedDto
 from .auth_dto import *
 from .chat_dto import *
 from .marketplace_dto import *
 
+# Resolve every forward reference in one pass, once all DTO modules are
+# loaded (chat_dto only references BotResponseDto under TYPE_CHECKING)
+_types_namespace = {**globals()}
+for _dto in (
+    UserWithProfileDto,
+    ConversationWithMessagesDto,
+    MessageWithDocumentsDto,
+    BotCategoryWithBotsDto,
+):
+    _dto.model_rebuild(_types_namespace=_types_namespace)
+del _dto, _types_namespace
+
 __all__ = [
     "BaseDto",
+    "PaginatedDto",
     # Auth DTOs
     "UserStatus",
     "UserCreateDto",
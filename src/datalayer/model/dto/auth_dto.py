@@ -2,11 +2,28 @@
 Auth DTOs for Chat Marketplace Service
 """
 
+import re
+import sys
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
-from .base_dto import BaseDto
+from .base_dto import BaseDto, PaginatedDto, describe
+
+# \w is Unicode-aware, so non-ASCII letters stay valid as they were under isalnum()
+_USERNAME_RE = re.compile(r'^[\w-]+\Z')
+
+def _lower_email(v: str) -> str:
+    """Emails are stored and compared in lowercase"""
+    return v.lower()
+
+# Settings fields drawn from small closed sets, repeated on every settings row;
+# timezone is free-form and left alone
+_INTERNED_SETTINGS_FIELDS = ('language', 'privacy_level', 'theme')
+
+def _intern_optional(v: Optional[str]) -> Optional[str]:
+    """Share one string object per distinct value"""
+    return sys.intern(v) if v is not None else v
 
 class UserStatus(str, Enum):
     ACTIVE = "active"
@@ -15,28 +32,32 @@ class UserStatus(str, Enum):
 
 # User DTOs
 class UserCreateDto(BaseDto):
-    email: str = Field(..., description="User email address")
-    password: str = Field(..., min_length=8, description="User password (min 8 characters)")
-    user_name: str = Field(..., min_length=1, max_length=255, description="First name")
-    user_surname: Optional[str] = Field(None, max_length=255, description="Last name")
-    username: Optional[str] = Field(None, min_length=3, max_length=100, description="Unique username")
-    phone_number: Optional[str] = Field(None, max_length=20, description="Phone number")
-
-    @validator('email')
+    email: str = Field(..., description=describe("User email address"))
+    password: str = Field(..., min_length=8, description=describe("User password (min 8 characters)"))
+    user_name: str = Field(..., min_length=1, max_length=255, description=describe("First name"))
+    user_surname: Optional[str] = Field(None, max_length=255, description=describe("Last name"))
+    username: Optional[str] = Field(None, min_length=3, max_length=100, description=describe("Unique username"))
+    phone_number: Optional[str] = Field(None, max_length=20, description=describe("Phone number"))
+
+    @field_validator('email')
+    @classmethod
     def email_must_be_lowercase(cls, v):
-        return v.lower()
+        return _lower_email(v)
 
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def username_alphanumeric(cls, v):
-        if v and not v.replace('_', '').replace('-', '').isalnum():
+        if v and not _USERNAME_RE.match(v):
             raise ValueError('Username must contain only alphanumeric characters, hyphens, and underscores')
         return v.lower() if v else v
 
-    @validator('user_name')
+    @field_validator('user_name')
+    @classmethod
     def validate_user_name(cls, v):
         return v.strip()
 
-    @validator('user_surname')
+    @field_validator('user_surname')
+    @classmethod
     def validate_user_surname(cls, v):
         return v.strip() if v else v
 
@@ -92,6 +113,11 @@ class UserSettingsCreateDto(BaseDto):
     theme: str = Field(default='light', max_length=20)
     two_factor_enabled: bool = Field(default=False)
 
+    @field_validator(*_INTERNED_SETTINGS_FIELDS)
+    @classmethod
+    def intern_setting(cls, v):
+        return _intern_optional(v)
+
 class UserSettingsUpdateDto(BaseDto):
     language: Optional[str] = Field(None, max_length=10)
     timezone: Optional[str] = Field(None, max_length=50)
@@ -101,6 +127,11 @@ class UserSettingsUpdateDto(BaseDto):
     theme: Optional[str] = Field(None, max_length=20)
     two_factor_enabled: Optional[bool] = None
 
+    @field_validator(*_INTERNED_SETTINGS_FIELDS)
+    @classmethod
+    def intern_setting(cls, v):
+        return _intern_optional(v)
+
 class UserSettingsResponseDto(BaseDto):
     settings_id: str
     user_id: str
@@ -114,50 +145,54 @@ class UserSettingsResponseDto(BaseDto):
     created_at: datetime
     updated_at: datetime
 
+    @field_validator(*_INTERNED_SETTINGS_FIELDS)
+    @classmethod
+    def intern_setting(cls, v):
+        return _intern_optional(v)
+
 # Authentication DTOs
 class LoginDto(BaseDto):
-    email: str = Field(..., description="User email address")
-    password: str = Field(..., description="User password")
+    email: str = Field(..., description=describe("User email address"))
+    password: str = Field(..., description=describe("User password"))
 
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def email_must_be_lowercase(cls, v):
-        return v.lower()
+        return _lower_email(v)
 
 # TokenResponseDto removed - not using JWT tokens for simple authentication
 
 class PasswordChangeDto(BaseDto):
-    current_password: str = Field(..., description="Current password")
-    new_password: str = Field(..., min_length=8, description="New password (min 8 characters)")
+    current_password: str = Field(..., description=describe("Current password"))
+    new_password: str = Field(..., min_length=8, description=describe("New password (min 8 characters)"))
 
 class PasswordResetRequestDto(BaseDto):
-    email: str = Field(..., description="User email address")
+    email: str = Field(..., description=describe("User email address"))
 
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def email_must_be_lowercase(cls, v):
-        return v.lower()
+        return _lower_email(v)
 
 class PasswordResetDto(BaseDto):
-    token: str = Field(..., description="Reset token")
-    new_password: str = Field(..., min_length=8, description="New password (min 8 characters)")
+    token: str = Field(..., description=describe("Reset token"))
+    new_password: str = Field(..., min_length=8, description=describe("New password (min 8 characters)"))
 
 # Pagination DTOs
-class UserListResponseDto(BaseDto):
+class UserListResponseDto(PaginatedDto):
     users: list[UserResponseDto]
     total: int
     page: int
     limit: int
-    has_next: bool
-    has_prev: bool
+    has_next: bool = False
+    has_prev: bool = False
 
 # Statistics DTO
 class UserStatsDto(BaseDto):
-    total_users: int = Field(..., description="Total number of users")
-    active_users: int = Field(..., description="Number of active users")
-    verified_users: int = Field(..., description="Number of verified users")
-    new_users_today: int = Field(..., description="Number of new users registered today")
-
-# Forward reference resolution
-UserWithProfileDto.model_rebuild()
+    total_users: int = Field(..., description=describe("Total number of users"))
+    active_users: int = Field(..., description=describe("Number of active users"))
+    verified_users: int = Field(..., description=describe("Number of verified users"))
+    new_users_today: int = Field(..., description=describe("Number of new users registered today"))
 
 __all__ = [
     "UserStatus",
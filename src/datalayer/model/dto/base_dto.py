@@ -1,10 +1,39 @@
-from pydantic import BaseModel, ConfigDict
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, model_validator
 from pydantic.alias_generators import to_camel
 
+from config import config
+
+# Field descriptions only feed the OpenAPI schema; production skips them
+_KEEP_DESCRIPTIONS = config.app_env.lower() != "production"
+
+
+def describe(text: str) -> Optional[str]:
+    """Field description, dropped when running in production"""
+    return text if _KEEP_DESCRIPTIONS else None
+
 
 class BaseDto(BaseModel):
     model_config = ConfigDict(
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        # DTOs are built once and serialized - nothing assigns to them afterwards
+        frozen=True,
     )
+
+
+class PaginatedDto(BaseDto):
+    """Base for list responses - subclasses declare total, page, limit, has_next and has_prev"""
+
+    @model_validator(mode='after')
+    def _derive_page_flags(self):
+        # Callers that probe with limit + 1 know better than page * limit,
+        # so only flags left unset are derived
+        fields_set = self.model_fields_set
+        if 'has_next' not in fields_set:
+            object.__setattr__(self, 'has_next', self.page * self.limit < self.total)
+        if 'has_prev' not in fields_set:
+            object.__setattr__(self, 'has_prev', self.page > 1)
+        return self
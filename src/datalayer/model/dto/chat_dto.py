@@ -2,11 +2,18 @@
 Chat DTOs for Chat Marketplace Service
 """
 
+import sys
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import TYPE_CHECKING, Optional, List, Dict, Any
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
-from .base_dto import BaseDto
+from .base_dto import BaseDto, PaginatedDto, describe
+
+if TYPE_CHECKING:
+    # Forward reference resolved by the dto package's model_rebuild pass
+    from .marketplace_dto import BotResponseDto
+
+_SENDER_TYPES = frozenset({'user', 'bot'})
 
 class ConversationStatus(str, Enum):
     ACTIVE = "active"
@@ -23,10 +30,10 @@ class MessageType(str, Enum):
 
 # Conversation DTOs
 class ConversationCreateDto(BaseDto):
-    bot_id: Optional[str] = Field(None, description="Bot ID for bot conversations")
-    title: str = Field(..., min_length=1, max_length=200, description="Conversation title")
-    description: Optional[str] = Field(None, max_length=1000, description="Conversation description")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    bot_id: Optional[str] = Field(None, description=describe("Bot ID for bot conversations"))
+    title: str = Field(..., min_length=1, max_length=200, description=describe("Conversation title"))
+    description: Optional[str] = Field(None, max_length=1000, description=describe("Conversation description"))
+    metadata: Optional[Dict[str, Any]] = Field(None, description=describe("Additional metadata"))
 
 class ConversationUpdateDto(BaseDto):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
@@ -51,27 +58,29 @@ class ConversationWithMessagesDto(ConversationResponseDto):
     messages: List["MessageResponseDto"] = []
     bot: Optional["BotResponseDto"] = None
 
-class ConversationListResponseDto(BaseDto):
+class ConversationListResponseDto(PaginatedDto):
     conversations: List[ConversationResponseDto]
     total: int
     page: int
     limit: int
-    has_next: bool
-    has_prev: bool
+    has_next: bool = False
+    has_prev: bool = False
 
 # Message DTOs
 class MessageCreateDto(BaseDto):
-    sender_type: str = Field(..., description="Sender type: 'user' or 'bot'")
-    sender_id: str = Field(..., description="Sender ID (user_id or bot_id)")
+    sender_type: str = Field(..., description=describe("Sender type: 'user' or 'bot'"))
+    sender_id: str = Field(..., description=describe("Sender ID (user_id or bot_id)"))
     message_type: MessageType = Field(default=MessageType.TEXT)
-    content: str = Field(..., min_length=1, description="Message content")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    content: str = Field(..., min_length=1, description=describe("Message content"))
+    metadata: Optional[Dict[str, Any]] = Field(None, description=describe("Additional metadata"))
 
-    @validator('sender_type')
+    @field_validator('sender_type')
+    @classmethod
     def validate_sender_type(cls, v):
-        if v not in ['user', 'bot']:
+        if v not in _SENDER_TYPES:
             raise ValueError('sender_type must be either "user" or "bot"')
-        return v
+        # Only two possible values - share one string object across messages
+        return sys.intern(v)
 
 class MessageUpdateDto(BaseDto):
     content: Optional[str] = Field(None, min_length=1)
@@ -96,22 +105,22 @@ class MessageWithDocumentsDto(MessageResponseDto):
     documents: List["DocumentResponseDto"] = []
     parent_message: Optional["MessageResponseDto"] = None
 
-class MessageListResponseDto(BaseDto):
+class MessageListResponseDto(PaginatedDto):
     messages: List[MessageResponseDto]
     total: int
     page: int
     limit: int
-    has_next: bool
-    has_prev: bool
+    has_next: bool = False
+    has_prev: bool = False
 
 # Document DTOs
 class DocumentCreateDto(BaseDto):
     file_name: str = Field(..., min_length=1, max_length=255)
     file_type: str = Field(..., min_length=1, max_length=50)
-    file_size: int = Field(..., gt=0, description="File size in bytes")
+    file_size: int = Field(..., gt=0, description=describe("File size in bytes"))
     mime_type: str = Field(..., min_length=1, max_length=100)
-    content: str = Field(..., min_length=1, description="Document content")
-    uploaded_by: str = Field(..., description="User ID who uploaded the document")
+    content: str = Field(..., min_length=1, description=describe("Document content"))
+    uploaded_by: str = Field(..., description=describe("User ID who uploaded the document"))
     # Note: file_url and metadata removed - not in database schema
 
 class DocumentResponseDto(BaseDto):
@@ -125,21 +134,21 @@ class DocumentResponseDto(BaseDto):
     uploaded_by: str
     created_at: datetime
 
-class DocumentListResponseDto(BaseDto):
+class DocumentListResponseDto(PaginatedDto):
     documents: List[DocumentResponseDto]
     total: int
     page: int
     limit: int
-    has_next: bool
-    has_prev: bool
+    has_next: bool = False
+    has_prev: bool = False
 
 # Memory History DTOs
 class MemoryHistoryCreateDto(BaseDto):
     memory_key: str = Field(..., min_length=1, max_length=100)
-    memory_value: str = Field(..., min_length=1, description="Memory content")
+    memory_value: str = Field(..., min_length=1, description=describe("Memory content"))
     memory_type: str = Field(default='context', max_length=50)
     priority: int = Field(default=1, ge=1, le=10)
-    expires_at: Optional[datetime] = Field(None, description="Memory expiration time")
+    expires_at: Optional[datetime] = Field(None, description=describe("Memory expiration time"))
 
 class MemoryHistoryUpdateDto(BaseDto):
     memory_value: Optional[str] = Field(None, min_length=1)
@@ -158,13 +167,13 @@ class MemoryHistoryResponseDto(BaseDto):
     created_at: datetime
     updated_at: datetime
 
-class MemoryHistoryListResponseDto(BaseDto):
+class MemoryHistoryListResponseDto(PaginatedDto):
     memories: List[MemoryHistoryResponseDto]
     total: int
     page: int
     limit: int
-    has_next: bool
-    has_prev: bool
+    has_next: bool = False
+    has_prev: bool = False
 
 # Chat Statistics DTOs
 class ConversationStatsDto(BaseDto):
@@ -185,7 +194,7 @@ class MessageStatsDto(BaseDto):
 
 # Search and Filter DTOs
 class ConversationSearchDto(BaseDto):
-    query: Optional[str] = Field(None, description="Search query")
+    query: Optional[str] = Field(None, description=describe("Search query"))
     status: Optional[ConversationStatus] = None
     bot_id: Optional[str] = None
     start_date: Optional[datetime] = None
@@ -194,7 +203,7 @@ class ConversationSearchDto(BaseDto):
     offset: int = Field(default=0, ge=0)
 
 class MessageSearchDto(BaseDto):
-    query: Optional[str] = Field(None, description="Search query")
+    query: Optional[str] = Field(None, description=describe("Search query"))
     message_type: Optional[MessageType] = None
     sender_type: Optional[str] = None
     start_date: Optional[datetime] = None
@@ -202,13 +211,6 @@ class MessageSearchDto(BaseDto):
     limit: int = Field(default=20, ge=1, le=200)
     offset: int = Field(default=0, ge=0)
 
-# Forward references for circular imports
-from .marketplace_dto import BotResponseDto
-
-# Forward reference resolution
-ConversationWithMessagesDto.model_rebuild()
-MessageWithDocumentsDto.model_rebuild()
-
 __all__ = [
     "ConversationStatus",
     "MessageType",
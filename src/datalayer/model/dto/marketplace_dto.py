@@ -2,11 +2,20 @@
 Marketplace DTOs for Chat Marketplace Service
 """
 
+import re
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
-from .base_dto import BaseDto
+from .base_dto import BaseDto, PaginatedDto, describe
+
+# Bot names must be URL-friendly
+_BOT_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+\Z')
+
+# Allowed values for search validators
+_BOT_SORT_FIELDS = frozenset({'name', 'display_name', 'rating', 'total_conversations', 'created_at', 'updated_at'})
+_CATEGORY_SORT_FIELDS = frozenset({'name', 'sort_order', 'created_at', 'updated_at'})
+_SORT_ORDERS = frozenset({'asc', 'desc'})
 
 class BotStatus(str, Enum):
     ACTIVE = "active"
@@ -16,38 +25,42 @@ class BotStatus(str, Enum):
 
 # Bot Category DTOs
 class BotCategoryCreateDto(BaseDto):
-    name: str = Field(..., min_length=1, max_length=100, description="Category name")
-    description: Optional[str] = Field(None, max_length=1000, description="Category description")
-    icon: Optional[str] = Field(None, description="Category icon (URL or SVG content)")
-    color: Optional[str] = Field(None, min_length=7, max_length=7, description="Hex color code")
+    name: str = Field(..., min_length=1, max_length=100, description=describe("Category name"))
+    description: Optional[str] = Field(None, max_length=1000, description=describe("Category description"))
+    icon: Optional[str] = Field(None, description=describe("Category icon (URL or SVG content)"))
+    color: Optional[str] = Field(None, min_length=7, max_length=7, description=describe("Hex color code"))
     is_active: bool = Field(default=True)
-    sort_order: int = Field(default=0, ge=0, description="Sort order for display")
+    sort_order: int = Field(default=0, ge=0, description=describe("Sort order for display"))
 
-    @validator('color')
+    @field_validator('color')
+    @classmethod
     def validate_color(cls, v):
         if v and not v.startswith('#'):
             raise ValueError('Color must be a valid hex color code starting with #')
         return v
 
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
         return v.strip()
 
 class BotCategoryUpdateDto(BaseDto):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=1000)
-    icon: Optional[str] = Field(None, description="Category icon (URL or SVG content)")
+    icon: Optional[str] = Field(None, description=describe("Category icon (URL or SVG content)"))
     color: Optional[str] = Field(None, min_length=7, max_length=7)
     is_active: Optional[bool] = None
     sort_order: Optional[int] = Field(None, ge=0)
 
-    @validator('color')
+    @field_validator('color')
+    @classmethod
     def validate_color(cls, v):
         if v and not v.startswith('#'):
             raise ValueError('Color must be a valid hex color code starting with #')
         return v
 
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
         if v:
             return v.strip()
@@ -68,35 +81,35 @@ class BotCategoryResponseDto(BaseDto):
 class BotCategoryWithBotsDto(BotCategoryResponseDto):
     bots: List["BotResponseDto"] = []
 
-class BotCategoryListResponseDto(BaseDto):
+class BotCategoryListResponseDto(PaginatedDto):
     categories: List[BotCategoryResponseDto]
     total: int
     page: int
     limit: int
-    has_next: bool
-    has_prev: bool
+    has_next: bool = False
+    has_prev: bool = False
 
 # Bot DTOs
 class BotCreateDto(BaseDto):
-    category_id: str = Field(..., description="Bot category ID")
-    name: str = Field(..., min_length=1, max_length=100, description="Bot unique name")
-    display_name: str = Field(..., min_length=1, max_length=150, description="Bot display name")
-    description: str = Field(..., min_length=1, max_length=5000, description="Bot description")
-    avatar_url: Optional[str] = Field(None, max_length=500, description="Bot avatar URL")
+    category_id: str = Field(..., description=describe("Bot category ID"))
+    name: str = Field(..., min_length=1, max_length=100, description=describe("Bot unique name"))
+    display_name: str = Field(..., min_length=1, max_length=150, description=describe("Bot display name"))
+    description: str = Field(..., min_length=1, max_length=5000, description=describe("Bot description"))
+    avatar_url: Optional[str] = Field(None, max_length=500, description=describe("Bot avatar URL"))
     is_featured: bool = Field(default=False)
     is_premium: bool = Field(default=False)
-    capabilities: Optional[Dict[str, Any]] = Field(None, description="Bot capabilities")
-    configuration: Optional[Dict[str, Any]] = Field(None, description="Bot configuration")
+    capabilities: Optional[Dict[str, Any]] = Field(None, description=describe("Bot capabilities"))
+    configuration: Optional[Dict[str, Any]] = Field(None, description=describe("Bot configuration"))
 
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
-        # Bot name should be URL-friendly
-        import re
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _BOT_NAME_RE.match(v):
             raise ValueError('Bot name must contain only alphanumeric characters, hyphens, and underscores')
         return v.lower()
 
-    @validator('display_name')
+    @field_validator('display_name')
+    @classmethod
     def validate_display_name(cls, v):
         return v.strip()
 
@@ -111,7 +124,8 @@ class BotUpdateDto(BaseDto):
     capabilities: Optional[Dict[str, Any]] = None
     configuration: Optional[Dict[str, Any]] = None
 
-    @validator('display_name')
+    @field_validator('display_name')
+    @classmethod
     def validate_display_name(cls, v):
         if v:
             return v.strip()
@@ -138,13 +152,15 @@ class BotResponseDto(BaseDto):
 class BotWithCategoryDto(BotResponseDto):
     category: Optional[BotCategoryResponseDto] = None
 
-class BotListResponseDto(BaseDto):
+class BotListResponseDto(PaginatedDto):
     bots: List[BotResponseDto]
     total: int
     page: int
     limit: int
-    has_next: bool
-    has_prev: bool
+    has_next: bool = False
+    has_prev: bool = False
+    # Pass as `after` to fetch the next page by keyset instead of offset
+    next_cursor: Optional[str] = None
 
 class BotDetailDto(BotResponseDto):
     category: BotCategoryResponseDto
@@ -170,49 +186,51 @@ class CategoryStatsDto(BaseDto):
 
 # Search and Filter DTOs
 class BotSearchDto(BaseDto):
-    query: Optional[str] = Field(None, description="Search query")
+    query: Optional[str] = Field(None, description=describe("Search query"))
     category_id: Optional[str] = None
     status: Optional[BotStatus] = None
     is_featured: Optional[bool] = None
     is_premium: Optional[bool] = None
     min_rating: Optional[float] = Field(None, ge=0, le=5)
-    sort_by: Optional[str] = Field(default='name', description="Sort field")
-    sort_order: Optional[str] = Field(default='asc', description="Sort order: asc, desc")
+    sort_by: Optional[str] = Field(default='name', description=describe("Sort field"))
+    sort_order: Optional[str] = Field(default='asc', description=describe("Sort order: asc, desc"))
     limit: int = Field(default=20, ge=1, le=200)
     offset: int = Field(default=0, ge=0)
 
-    @validator('sort_by')
+    @field_validator('sort_by')
+    @classmethod
     def validate_sort_by(cls, v):
-        allowed_fields = ['name', 'display_name', 'rating', 'total_conversations', 'created_at', 'updated_at']
-        if v not in allowed_fields:
-            raise ValueError(f'sort_by must be one of: {", ".join(allowed_fields)}')
+        if v not in _BOT_SORT_FIELDS:
+            raise ValueError(f'sort_by must be one of: {", ".join(sorted(_BOT_SORT_FIELDS))}')
         return v
 
-    @validator('sort_order')
+    @field_validator('sort_order')
+    @classmethod
     def validate_sort_order(cls, v):
-        if v not in ['asc', 'desc']:
+        if v not in _SORT_ORDERS:
             raise ValueError('sort_order must be "asc" or "desc"')
         return v
 
 class CategorySearchDto(BaseDto):
-    query: Optional[str] = Field(None, description="Search query")
+    query: Optional[str] = Field(None, description=describe("Search query"))
     is_active: Optional[bool] = None
-    has_bots: Optional[bool] = Field(None, description="Filter categories that have bots")
-    sort_by: Optional[str] = Field(default='sort_order', description="Sort field")
-    sort_order: Optional[str] = Field(default='asc', description="Sort order: asc, desc")
+    has_bots: Optional[bool] = Field(None, description=describe("Filter categories that have bots"))
+    sort_by: Optional[str] = Field(default='sort_order', description=describe("Sort field"))
+    sort_order: Optional[str] = Field(default='asc', description=describe("Sort order: asc, desc"))
     limit: int = Field(default=20, ge=1, le=200)
     offset: int = Field(default=0, ge=0)
 
-    @validator('sort_by')
+    @field_validator('sort_by')
+    @classmethod
     def validate_sort_by(cls, v):
-        allowed_fields = ['name', 'sort_order', 'created_at', 'updated_at']
-        if v not in allowed_fields:
-            raise ValueError(f'sort_by must be one of: {", ".join(allowed_fields)}')
+        if v not in _CATEGORY_SORT_FIELDS:
+            raise ValueError(f'sort_by must be one of: {", ".join(sorted(_CATEGORY_SORT_FIELDS))}')
         return v
 
-    @validator('sort_order')
+    @field_validator('sort_order')
+    @classmethod
     def validate_sort_order(cls, v):
-        if v not in ['asc', 'desc']:
+        if v not in _SORT_ORDERS:
             raise ValueError('sort_order must be "asc" or "desc"')
         return v
 
@@ -231,9 +249,6 @@ class BotConfigurationDto(BaseDto):
     capabilities: List[BotCapabilityDto] = []
     custom_settings: Optional[Dict[str, Any]] = None
 
-# Forward reference resolution
-BotCategoryWithBotsDto.model_rebuild()
-
 __all__ = [
     "BotStatus",
     "BotCategoryCreateDto",
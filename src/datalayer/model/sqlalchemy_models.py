@@ -6,17 +6,90 @@ Schemas: auth, chats, marketplace
 from datetime import datetime
 from typing import Optional, List
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime, Boolean, Float,
-    ForeignKey, JSON, Enum as SQLEnum, TIMESTAMP, func
+    CheckConstraint, Column, Computed, Integer, SmallInteger, String, Text, DateTime, Boolean,
+    ForeignKey, Index, MetaData, Enum as SQLEnum, TIMESTAMP, func, text
 )
-from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import DeclarativeBase, relationship, selectinload, synonym, Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+import os
+import threading
+import time
 import enum
 
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base for all schemas (SQLAlchemy 2.0 style)"""
+
+    # One MetaData for auth, chats and marketplace - cross-schema foreign keys
+    # only resolve within a single MetaData. Unnamed constraints get the names
+    # PostgreSQL itself would generate, so create_all matches init.sql; "ix" is
+    # SQLAlchemy's own default, kept so index=True columns still get a name
+    metadata = MetaData(naming_convention={
+        "ix": "ix_%(column_0_label)s",
+        "pk": "%(table_name)s_pkey",
+        "uq": "%(table_name)s_%(column_0_name)s_key",
+        "fk": "%(table_name)s_%(column_0_name)s_fkey",
+    })
+
+
+class TimestampMixin:
+    """created_at/updated_at pair stamped by the database on INSERT and UPDATE"""
+
+    # Fetch the server-generated timestamps via RETURNING in the same
+    # statement - an expired updated_at would otherwise lazy-load under asyncio
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Negative sort_order puts the 8-byte timestamps ahead of the subclass
+    # columns in CREATE TABLE, matching the alignment order in init.sql
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        sort_order=-10
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        sort_order=-10
+    )
+
+
+# Random bits for primary keys are sliced from one 64KB os.urandom() read
+# instead of a syscall per row (bulk inserts generate thousands of ids)
+_RANDOM_BUFFER_SIZE = 65536
+_random_buffer = memoryview(b"")
+_random_offset = 0
+_random_lock = threading.Lock()
+
+def _random_bytes(n: int) -> bytes:
+    global _random_buffer, _random_offset
+    with _random_lock:
+        if _random_offset + n > len(_random_buffer):
+            _random_buffer = memoryview(os.urandom(_RANDOM_BUFFER_SIZE))
+            _random_offset = 0
+        start = _random_offset
+        _random_offset += n
+        return _random_buffer[start:_random_offset].tobytes()
+
+def _reset_random_buffer() -> None:
+    """A forked worker must not reuse the parent's unread random bytes"""
+    global _random_buffer, _random_offset, _random_lock
+    _random_buffer = memoryview(b"")
+    _random_offset = 0
+    _random_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_reset_random_buffer)
+
+def _uuid7() -> str:
+    """RFC 9562 UUIDv7 - time-ordered, so new rows land at the right edge of the PK index"""
+    value = (time.time_ns() // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80  # 48-bit ms timestamp
+    value |= int.from_bytes(_random_bytes(10), "big")  # 80 random bits
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 # Enums
 class UserStatus(str, enum.Enum):
@@ -37,23 +110,73 @@ class MessageType(str, enum.Enum):
     VIDEO = "video"
     SYSTEM = "system"
 
+# Message.message_type is read for every message row; a dict lookup avoids
+# Enum.__call__ and the exception path for legacy/NULL values
+_MESSAGE_TYPE_LOOKUP = {member.value: member for member in MessageType}
+
 class BotStatus(str, enum.Enum):
     ACTIVE = "active"
     INACTIVE = "inactive"
     PENDING = "pending"
     REJECTED = "rejected"
 
+class MessageRole(str, enum.Enum):
+    USER = "user"
+    BOT = "bot"
+
+def _enum_values(enum_cls) -> List[str]:
+    """Store enum values (lowercase) rather than member names in PG ENUM types"""
+    return [member.value for member in enum_cls]
+
+class _EnumStr(TypeDecorator):
+    """varchar column read back as enum members - converted once per row at load"""
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_cls, length: int):
+        super().__init__(length)
+        self.enum_cls = enum_cls  # named after the __init__ argument - part of the cache key
+        self._lookup = {member.value: member for member in enum_cls}
+
+    def process_bind_param(self, value, dialect):
+        return value.value if isinstance(value, enum.Enum) else value
+
+    def process_result_value(self, value, dialect):
+        # Unknown legacy values pass through as plain strings
+        return self._lookup.get(value, value)
+
 # AUTH SCHEMA MODELS
 
 class User(Base):
     __tablename__ = 'users'
-    __table_args__ = {'schema': 'auth'}
+    __table_args__ = (
+        # Emails are stored lowercase, so the plain unique index on user_email
+        # serves case-insensitive lookups - no lower() expression index needed
+        CheckConstraint('user_email = lower(user_email)', name='email_lowercase'),
+        {'schema': 'auth'}
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
+    # Declared widest-alignment first (timestamps, uuid, boolean, then
+    # variable-length strings) so create_all lays rows out without padding
+    user_created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    user_updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+    last_login_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        default=_uuid7
     )
+    is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     user_email: Mapped[str] = mapped_column(
         String(254),
         unique=True,
@@ -65,40 +188,13 @@ class User(Base):
     user_surname: Mapped[Optional[str]] = mapped_column(String(255))
     username: Mapped[Optional[str]] = mapped_column(String(100), unique=True)
     phone_number: Mapped[Optional[str]] = mapped_column(String(20))
-    is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    status: Mapped[str] = mapped_column(String(20), default='active', nullable=False)
-    last_login_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
-    user_created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
-    user_updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
-    
-    # Properties to match service expectations
-    @property
-    def email(self) -> str:
-        return self.user_email
-    
-    @email.setter
-    def email(self, value: str):
-        self.user_email = value
-    
-    @property
-    def created_at(self) -> datetime:
-        return self.user_created_at
-    
-    @property
-    def updated_at(self) -> datetime:
-        return self.user_updated_at
+    status: Mapped[UserStatus] = mapped_column(_EnumStr(UserStatus, 20), default=UserStatus.ACTIVE, nullable=False)
     
-    @updated_at.setter
-    def updated_at(self, value: datetime):
-        self.user_updated_at = value
+    # Aliases to match service expectations - synonyms are plain instrumented
+    # attributes on instances and usable in queries
+    email = synonym("user_email")
+    created_at = synonym("user_created_at")
+    updated_at = synonym("user_updated_at")
     
     # Relationships
     profile: Mapped["UserProfile"] = relationship("UserProfile", back_populates="user", uselist=False)
@@ -108,6 +204,7 @@ class User(Base):
 class UserProfile(Base):
     __tablename__ = 'user_profiles'
     __table_args__ = {'schema': 'auth'}
+    __mapper_args__ = {"eager_defaults": True}
     
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -120,17 +217,14 @@ class UserProfile(Base):
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     
-    # Properties to match service expectations
-    @property
-    def profile_id(self) -> str:
-        return self.user_id  # Use user_id as profile_id
-    
-    @property
-    def created_at(self) -> datetime:
-        return self.updated_at  # Use updated_at as fallback since created_at doesn't exist
+    # Aliases to match service expectations - synonyms are plain instrumented
+    # attributes on instances and usable in queries
+    profile_id = synonym("user_id")
+    created_at = synonym("updated_at")  # no created_at column - updated_at is the fallback
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="profile")
@@ -138,6 +232,7 @@ class UserProfile(Base):
 class UserSettings(Base):
     __tablename__ = 'user_settings'
     __table_args__ = {'schema': 'auth'}
+    __mapper_args__ = {"eager_defaults": True}
     
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -173,26 +268,22 @@ class UserSettings(Base):
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     
-    # Properties to match service expectations
-    @property
-    def settings_id(self) -> str:
-        return self.user_id  # Use user_id as settings_id
+    # Aliases to match service expectations - synonyms are plain instrumented
+    # attributes on instances and usable in queries
+    settings_id = synonym("user_id")
+    email_notifications = synonym("notifications_enabled")
+    push_notifications = synonym("notifications_enabled")
+    created_at = synonym("updated_at")  # no created_at column - updated_at is the fallback
     
+    # Derived values without a backing column
     @property
     def timezone(self) -> str:
         return 'UTC'  # Default timezone
     
-    @property
-    def email_notifications(self) -> bool:
-        return self.notifications_enabled
-    
-    @property
-    def push_notifications(self) -> bool:
-        return self.notifications_enabled
-    
     @property
     def privacy_level(self) -> str:
         return 'private' if self.privacy_mode else 'public'
@@ -201,10 +292,6 @@ class UserSettings(Base):
     def two_factor_enabled(self) -> bool:
         return False  # Not available in current schema
     
-    @property
-    def created_at(self) -> datetime:
-        return self.updated_at  # Use updated_at as fallback
-    
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="settings")
 
@@ -212,86 +299,68 @@ class UserSettings(Base):
 
 class Conversation(Base):
     __tablename__ = 'conversation'
-    __table_args__ = {'schema': 'chats'}
-    
+    __table_args__ = (
+        # A user's / bot's conversation list in the repository's ORDER BY
+        # (last_message_at DESC, conversation_updated_at DESC) without a sort step
+        Index(
+            'ix_conv_user_last', 'conversation_user_id',
+            text('last_message_at DESC'), text('conversation_updated_at DESC')
+        ),
+        Index('ix_conv_bot_last', 'conversation_bot_id', text('last_message_at DESC')),
+        {'schema': 'chats'}
+    )
+    __mapper_args__ = {"eager_defaults": True}
+    
+    # Declared widest-alignment first, like User
+    conversation_created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    conversation_updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+    last_message_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
     conversation_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        default=_uuid7
     )
     conversation_user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey('auth.users.user_id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False  # leading column of the composite index
     )
     conversation_bot_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey('marketplace.bots.bot_id', ondelete='CASCADE'),
         nullable=False
     )
-    conversation_title: Mapped[Optional[str]] = mapped_column(String(255))
-    conversation_status: Mapped[str] = mapped_column(
-        String(50),
-        default='active',
+    conversation_status: Mapped[ConversationStatus] = mapped_column(
+        SQLEnum(
+            ConversationStatus, name='conversation_status', schema='chats',
+            native_enum=True, values_callable=_enum_values
+        ),
+        default=ConversationStatus.ACTIVE,
         nullable=False
     )
+    conversation_title: Mapped[Optional[str]] = mapped_column(String(255))
     default_system_prompt: Mapped[Optional[str]] = mapped_column(Text)
     default_knowledge: Mapped[Optional[str]] = mapped_column(Text)
     memory: Mapped[Optional[str]] = mapped_column(Text)
-    custom_metadata: Mapped[Optional[dict]] = mapped_column(JSON)
-    last_message_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
-    conversation_created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
-    conversation_updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
+    custom_metadata: Mapped[Optional[dict]] = mapped_column(JSONB)
     
-    # Properties to match service expectations
-    @property
-    def user_id(self) -> str:
-        return self.conversation_user_id
-    
-    @user_id.setter
-    def user_id(self, value: str):
-        self.conversation_user_id = value
-    
-    @property
-    def bot_id(self) -> str:
-        return self.conversation_bot_id
-    
-    @bot_id.setter
-    def bot_id(self, value: str):
-        self.conversation_bot_id = value
-    
-    @property
-    def title(self) -> Optional[str]:
-        return self.conversation_title
-    
-    @title.setter
-    def title(self, value: Optional[str]):
-        self.conversation_title = value
-    
-    @property
-    def status(self) -> ConversationStatus:
-        return ConversationStatus(self.conversation_status)
-    
-    @status.setter
-    def status(self, value: ConversationStatus):
-        self.conversation_status = value.value
-    
-    @property
-    def created_at(self) -> datetime:
-        return self.conversation_created_at
-    
-    @property
-    def updated_at(self) -> datetime:
-        return self.conversation_updated_at
+    # Aliases to match service expectations - synonyms are plain instrumented
+    # attributes on instances and usable in queries
+    user_id = synonym("conversation_user_id")
+    bot_id = synonym("conversation_bot_id")
+    title = synonym("conversation_title")
+    status = synonym("conversation_status")
+    created_at = synonym("conversation_created_at")
+    updated_at = synonym("conversation_updated_at")
     
     @property
     def description(self) -> Optional[str]:
@@ -307,29 +376,36 @@ class Conversation(Base):
     messages: Mapped[List["Message"]] = relationship("Message", back_populates="conversation", cascade="all, delete-orphan")
     memory_history: Mapped[List["MemoryHistory"]] = relationship("MemoryHistory", back_populates="conversation", cascade="all, delete-orphan")
 
-class Message(Base):
+class Message(TimestampMixin, Base):
     __tablename__ = 'message'
-    __table_args__ = {'schema': 'chats'}
-    
+    __table_args__ = (
+        # Conversation history in creation order; INCLUDE makes it covering
+        # for the role/bot columns the list views read
+        Index(
+            'ix_msg_conv_created', 'message_conversation_id', 'created_at',
+            postgresql_include=['message_role', 'message_bot_id']
+        ),
+        # Append-only, inserted in time order - BRIN covers time-range scans
+        # (retention, reporting) without a btree growing with the table
+        Index('brin_msg_created', 'created_at', postgresql_using='brin'),
+        {'schema': 'chats'}
+    )
+    
+    # Declared widest-alignment first, like User (timestamps come from TimestampMixin)
     message_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        default=_uuid7
     )
     message_conversation_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey('chats.conversation.conversation_id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False  # leading column of the composite index
     )
     message_parent_message_id: Mapped[Optional[str]] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey('chats.message.message_id', ondelete='SET NULL')
     )
-    message_role: Mapped[str] = mapped_column(
-        String(20),
-        nullable=False
-    )
     message_bot_id: Mapped[Optional[str]] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey('marketplace.bots.bot_id', ondelete='CASCADE')
@@ -339,6 +415,15 @@ class Message(Base):
         ForeignKey('auth.users.user_id', ondelete='CASCADE'),
         index=True
     )
+    message_role: Mapped[MessageRole] = mapped_column(
+        SQLEnum(
+            MessageRole, name='message_role', schema='chats',
+            native_enum=True, values_callable=_enum_values
+        ),
+        nullable=False
+    )
+    is_edited: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     message_type_db: Mapped[str] = mapped_column(
         'message_type',  # Database column name
         String(20),
@@ -347,44 +432,13 @@ class Message(Base):
         index=True
     )
     content: Mapped[Optional[str]] = mapped_column(Text)
-    custom_metadata: Mapped[Optional[dict]] = mapped_column(JSON)
-    is_edited: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
-    
-    # Properties to match service expectations
-    @property
-    def conversation_id(self) -> str:
-        return self.message_conversation_id
-    
-    @conversation_id.setter
-    def conversation_id(self, value: str):
-        self.message_conversation_id = value
-    
-    @property
-    def parent_message_id(self) -> Optional[str]:
-        return self.message_parent_message_id
+    custom_metadata: Mapped[Optional[dict]] = mapped_column(JSONB)
     
-    @parent_message_id.setter
-    def parent_message_id(self, value: Optional[str]):
-        self.message_parent_message_id = value
-    
-    @property
-    def sender_type(self) -> str:
-        return self.message_role
-    
-    @sender_type.setter
-    def sender_type(self, value: str):
-        self.message_role = value
+    # Aliases to match service expectations - synonyms are plain instrumented
+    # attributes on instances and usable in queries
+    conversation_id = synonym("message_conversation_id")
+    parent_message_id = synonym("message_parent_message_id")
+    sender_type = synonym("message_role")
     
     @property
     def sender_id(self) -> Optional[str]:
@@ -408,10 +462,7 @@ class Message(Base):
     @property
     def message_type(self) -> MessageType:
         """Get actual message type from database"""
-        try:
-            return MessageType(self.message_type_db)
-        except (ValueError, AttributeError):
-            return MessageType.TEXT  # Default fallback
+        return _MESSAGE_TYPE_LOOKUP.get(self.message_type_db, MessageType.TEXT)  # TEXT is the fallback
     
     @message_type.setter
     def message_type(self, value: MessageType):
@@ -420,17 +471,34 @@ class Message(Base):
     
     # Relationships
     conversation: Mapped["Conversation"] = relationship("Conversation", back_populates="messages")
-    parent_message: Mapped[Optional["Message"]] = relationship("Message", remote_side="Message.message_id")
+    # Rarely needed back-references raise instead of lazy loading - callers
+    # opt in with selectinload(); identity-map hits still resolve without SQL
+    parent_message: Mapped[Optional["Message"]] = relationship(
+        "Message", remote_side="Message.message_id", lazy="raise_on_sql"
+    )
     documents: Mapped[List["Document"]] = relationship("Document", back_populates="message", cascade="all, delete-orphan")
+    
+    @classmethod
+    def loader_with_documents(cls) -> list:
+        """Loader options for everything MessageWithDocumentsDto reads"""
+        return [
+            selectinload(cls.documents).undefer_group("content"),
+            selectinload(cls.parent_message)
+        ]
 
-class Document(Base):
+class Document(TimestampMixin, Base):
     __tablename__ = 'document'
-    __table_args__ = {'schema': 'chats'}
+    __table_args__ = (
+        Index('ix_doc_msg_created', 'document_message_id', 'created_at'),
+        Index('ix_doc_file_type', 'document_file_type'),
+        CheckConstraint('document_file_size >= 0', name='ck_document_file_size'),
+        {'schema': 'chats'}
+    )
     
     document_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        default=_uuid7
     )
     document_uploaded_by: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -449,109 +517,61 @@ class Document(Base):
         String(100),
         nullable=False
     )
+    # Major MIME type ("image/png" -> "image"), computed once on write so
+    # file type filters are an indexed equality instead of a LIKE on mime type
+    document_file_type: Mapped[str] = mapped_column(
+        String(100),
+        Computed(
+            "CASE WHEN strpos(document_mime_type, '/') > 0 "
+            "THEN split_part(document_mime_type, '/', 1) ELSE 'unknown' END",
+            persisted=True
+        )
+    )
+    # Can be megabytes - only loaded by queries that undefer the "content"
+    # group; raises instead of issuing a lazy load when it was not requested
     document_content: Mapped[str] = mapped_column(
         Text,
-        nullable=False
+        nullable=False,
+        deferred=True,
+        deferred_group="content",
+        deferred_raiseload=True
     )
     document_message_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey('chats.message.message_id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
-    )
-    created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
+        nullable=False  # leading column of the composite index
     )
     
-    # Properties to match service expectations
-    @property
-    def uploaded_by(self) -> str:
-        return self.document_uploaded_by
-    
-    @uploaded_by.setter
-    def uploaded_by(self, value: str):
-        self.document_uploaded_by = value
-    
-    @hybrid_property
-    def file_name(self) -> str:
-        return self.document_filename
-    
-    @file_name.setter
-    def file_name(self, value: str):
-        self.document_filename = value
-    
-    @file_name.expression
-    def file_name(cls):
-        return cls.document_filename
-    
-    @hybrid_property
-    def file_size(self) -> int:
-        return self.document_file_size
-    
-    @file_size.setter
-    def file_size(self, value: int):
-        self.document_file_size = value
-    
-    @file_size.expression
-    def file_size(cls):
-        return cls.document_file_size
-    
-    @property
-    def mime_type(self) -> str:
-        return self.document_mime_type
-    
-    @mime_type.setter
-    def mime_type(self, value: str):
-        self.document_mime_type = value
-    
-    @property
-    def content(self) -> str:
-        return self.document_content
-    
-    @content.setter
-    def content(self, value: str):
-        self.document_content = value
-    
-    @hybrid_property
-    def message_id(self) -> str:
-        return self.document_message_id
-    
-    @message_id.setter
-    def message_id(self, value: str):
-        self.document_message_id = value
-    
-    @message_id.expression
-    def message_id(cls):
-        return cls.document_message_id
-    
-    @property
-    def file_type(self) -> str:
-        return self.document_mime_type.split('/')[0] if '/' in self.document_mime_type else 'unknown'
+    # Aliases to match service expectations - synonyms are plain instrumented
+    # attributes on instances and usable in queries
+    uploaded_by = synonym("document_uploaded_by")
+    file_name = synonym("document_filename")
+    file_size = synonym("document_file_size")
+    mime_type = synonym("document_mime_type")
+    file_type = synonym("document_file_type")
+    content = synonym("document_content")
+    message_id = synonym("document_message_id")
     
     # Relationships
-    message: Mapped["Message"] = relationship("Message", back_populates="documents")
+    message: Mapped["Message"] = relationship("Message", back_populates="documents", lazy="raise_on_sql")
 
 class MemoryHistory(Base):
     __tablename__ = 'memory_history'
-    __table_args__ = {'schema': 'chats'}
+    __table_args__ = (
+        Index('ix_memhist_conv_time', 'conversation_id', text('date_time DESC')),
+        Index('brin_memhist_time', 'date_time', postgresql_using='brin'),
+        {'schema': 'chats'}
+    )
     
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        default=_uuid7
     )
     conversation_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey('chats.conversation.conversation_id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False  # leading column of the composite index
     )
     date_time: Mapped[datetime] = mapped_column(
         DateTime,  # timestamp without time zone
@@ -560,11 +580,13 @@ class MemoryHistory(Base):
     )
     memory_history: Mapped[str] = mapped_column(Text, nullable=False)
     
-    # Properties to match service expectations
-    @property
-    def memory_id(self) -> str:
-        return self.id
+    # Aliases to match service expectations - synonyms are plain instrumented
+    # attributes on instances and usable in queries
+    memory_id = synonym("id")
+    created_at = synonym("date_time")
+    updated_at = synonym("date_time")
     
+    # Fields packed into the memory_history JSON text
     @property
     def memory_key(self) -> str:
         # Extract key from JSON if structured, otherwise use default
@@ -623,14 +645,6 @@ class MemoryHistory(Base):
         except (json.JSONDecodeError, AttributeError, ValueError):
             return None
     
-    @property
-    def created_at(self) -> datetime:
-        return self.date_time
-    
-    @property
-    def updated_at(self) -> datetime:
-        return self.date_time
-    
     # Helper method to create structured memory JSON
     def set_structured_memory(
         self,
@@ -655,18 +669,31 @@ class MemoryHistory(Base):
         self.date_time = datetime.utcnow()
     
     # Relationships
-    conversation: Mapped["Conversation"] = relationship("Conversation", back_populates="memory_history")
+    conversation: Mapped["Conversation"] = relationship("Conversation", back_populates="memory_history", lazy="raise_on_sql")
 
 # MARKETPLACE SCHEMA MODELS
 
-class BotCategory(Base):
+class BotCategory(TimestampMixin, Base):
     __tablename__ = 'bot_categories'
-    __table_args__ = {'schema': 'marketplace'}
+    __table_args__ = (
+        # Trigram indexes serve search_categories' ILIKE '%query%' filters,
+        # which a btree cannot (requires the pg_trgm extension)
+        Index(
+            'ix_category_name_trgm', 'category_name',
+            postgresql_using='gin', postgresql_ops={'category_name': 'gin_trgm_ops'}
+        ),
+        Index(
+            'ix_category_description_trgm', 'category_description',
+            postgresql_using='gin', postgresql_ops={'category_description': 'gin_trgm_ops'}
+        ),
+        Index('ix_category_search_tsv', 'search_tsv', postgresql_using='gin'),
+        {'schema': 'marketplace'}
+    )
     
     category_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        default=_uuid7
     )
     category_name: Mapped[str] = mapped_column(
         String(100),
@@ -674,139 +701,150 @@ class BotCategory(Base):
         unique=True
     )
     category_description: Mapped[Optional[str]] = mapped_column(Text)
+    # Full-text document for multi-word search_categories queries, like
+    # Bot.search_tsv; only used in WHERE clauses, never loaded onto instances
+    search_tsv: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(category_name, '') || ' ' || "
+            "coalesce(category_description, ''))",
+            persisted=True
+        ),
+        deferred=True,
+        deferred_raiseload=True
+    )
     icon: Mapped[Optional[str]] = mapped_column(Text)
     color: Mapped[Optional[str]] = mapped_column(String(7))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
     
-    # Properties to match service expectations
-    @property
-    def name(self) -> str:
-        return self.category_name
-    
-    @name.setter
-    def name(self, value: str):
-        self.category_name = value
-    
-    @property
-    def description(self) -> Optional[str]:
-        return self.category_description
-    
-    @description.setter
-    def description(self, value: Optional[str]):
-        self.category_description = value
+    # Aliases to match service expectations - synonyms are plain instrumented
+    # attributes on instances and usable in queries
+    name = synonym("category_name")
+    description = synonym("category_description")
     
     # Relationships
     bots: Mapped[List["Bot"]] = relationship("Bot", back_populates="category")
 
-class Bot(Base):
+class Bot(TimestampMixin, Base):
     __tablename__ = 'bots'
-    __table_args__ = {'schema': 'marketplace'}
-    
+    __table_args__ = (
+        # Containment filters (capabilities @> '{"lang": "tr"}') without a seq scan
+        Index('ix_bot_capabilities_gin', 'capabilities', postgresql_using='gin'),
+        # Active featured/premium bots are a small slice of the catalog; partial
+        # indexes in the listings' sort order stay tiny and cache resident
+        Index(
+            'ix_bot_featured_active', text('rating DESC'), 'display_name',
+            postgresql_where=text("is_featured AND bot_status = 'active'")
+        ),
+        Index(
+            'ix_bot_premium_active', text('rating DESC'), 'display_name',
+            postgresql_where=text("is_premium AND bot_status = 'active'")
+        ),
+        # get_by_category's filter and ORDER BY, so pages come off the index
+        # presorted; the leading column also serves the category FK
+        Index(
+            'ix_bot_cat_listing', 'bot_category_id', 'bot_status',
+            text('is_featured DESC'), text('rating DESC'), 'display_name'
+        ),
+        # get_top_rated_bots: only rated bots, in ranking order
+        Index(
+            'ix_bot_top_rated', 'bot_status', text('rating DESC'), text('total_conversations DESC'),
+            postgresql_where=text('rating IS NOT NULL')
+        ),
+        # Trigram indexes for search_bots' ILIKE '%query%' filters (pg_trgm)
+        Index(
+            'ix_bot_name_trgm', 'bot_name',
+            postgresql_using='gin', postgresql_ops={'bot_name': 'gin_trgm_ops'}
+        ),
+        Index(
+            'ix_bot_display_name_trgm', 'display_name',
+            postgresql_using='gin', postgresql_ops={'display_name': 'gin_trgm_ops'}
+        ),
+        Index(
+            'ix_bot_description_trgm', 'bot_description',
+            postgresql_using='gin', postgresql_ops={'bot_description': 'gin_trgm_ops'}
+        ),
+        Index('ix_bot_search_tsv', 'search_tsv', postgresql_using='gin'),
+        {'schema': 'marketplace'}
+    )
+    
+    # Declared widest-alignment first, like User (timestamps come from TimestampMixin)
     bot_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid.uuid4())
+        default=_uuid7
     )
     bot_category_id: Mapped[Optional[str]] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey('marketplace.bot_categories.category_id', ondelete='SET NULL'),
-        nullable=True,
-        index=True
+        nullable=True  # leading column of ix_bot_cat_listing
     )
-    bot_name: Mapped[str] = mapped_column(
-        String(255),
-        nullable=False,
-        unique=True
+    bot_owner_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey('auth.users.user_id', ondelete='CASCADE'),
+        nullable=False
     )
-    display_name: Mapped[Optional[str]] = mapped_column(String(150))
-    bot_description: Mapped[Optional[str]] = mapped_column(Text)
-    bot_avatar_url: Mapped[Optional[str]] = mapped_column(Text)
-    bot_status: Mapped[str] = mapped_column(
-        String(50),
-        default='active',
+    bot_status: Mapped[BotStatus] = mapped_column(
+        SQLEnum(
+            BotStatus, name='bot_status', schema='marketplace',
+            native_enum=True, values_callable=_enum_values
+        ),
+        default=BotStatus.ACTIVE,
         nullable=False
     )
+    total_conversations: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Ratings are 0.0-5.0 in 0.1 steps, stored as tenths in a 2-byte smallint;
+    # filter and sort on rating_tenths, read the float through .rating
+    rating_tenths: Mapped[Optional[int]] = mapped_column('rating', SmallInteger)
     is_public: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_featured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_premium: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    rating: Mapped[Optional[float]] = mapped_column(Float)
-    total_conversations: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    capabilities: Mapped[Optional[dict]] = mapped_column(JSON)
-    configuration: Mapped[Optional[dict]] = mapped_column(JSON)
+    bot_name: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        unique=True
+    )
+    display_name: Mapped[Optional[str]] = mapped_column(String(150))
     bot_version: Mapped[str] = mapped_column(
         String(50),
         default='1.0'
     )
-    bot_owner_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
-        ForeignKey('auth.users.user_id', ondelete='CASCADE'),
-        nullable=False
-    )
+    bot_description: Mapped[Optional[str]] = mapped_column(Text)
+    bot_avatar_url: Mapped[Optional[str]] = mapped_column(Text)
+    # Full-text document for multi-word search_bots queries; maintained by the
+    # server and only used in WHERE clauses, so never loaded onto instances
+    search_tsv: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(bot_name, '') || ' ' || "
+            "coalesce(display_name, '') || ' ' || coalesce(bot_description, ''))",
+            persisted=True
+        ),
+        deferred=True,
+        deferred_raiseload=True
+    )
+    capabilities: Mapped[Optional[dict]] = mapped_column(JSONB)
+    configuration: Mapped[Optional[dict]] = mapped_column(JSONB)
     default_system_prompt: Mapped[Optional[str]] = mapped_column(Text)
     default_knowledge: Mapped[Optional[str]] = mapped_column(Text)
     bot_default_memory: Mapped[Optional[str]] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True),
-        server_default=func.now(),
-        nullable=False
-    )
-    
-    # Properties to match service expectations
-    @property
-    def category_id(self) -> Optional[str]:
-        return self.bot_category_id
-    
-    @category_id.setter
-    def category_id(self, value: Optional[str]):
-        self.bot_category_id = value
-    
-    @property
-    def name(self) -> str:
-        return self.bot_name
-    
-    @name.setter
-    def name(self, value: str):
-        self.bot_name = value
-    
-    @property
-    def description(self) -> Optional[str]:
-        return self.bot_description
-    
-    @description.setter
-    def description(self, value: Optional[str]):
-        self.bot_description = value
-    
-    @property
-    def avatar_url(self) -> Optional[str]:
-        return self.bot_avatar_url
     
-    @avatar_url.setter
-    def avatar_url(self, value: Optional[str]):
-        self.bot_avatar_url = value
+    # Aliases to match service expectations - synonyms are plain instrumented
+    # attributes on instances and usable in queries
+    category_id = synonym("bot_category_id")
+    name = synonym("bot_name")
+    description = synonym("bot_description")
+    avatar_url = synonym("bot_avatar_url")
+    status = synonym("bot_status")
     
     @property
-    def status(self) -> BotStatus:
-        return BotStatus(self.bot_status)
+    def rating(self) -> Optional[float]:
+        return None if self.rating_tenths is None else self.rating_tenths / 10
     
-    @status.setter
-    def status(self, value: BotStatus):
-        self.bot_status = value.value
+    @rating.setter
+    def rating(self, value: Optional[float]):
+        self.rating_tenths = None if value is None else round(value * 10)
     
     @property
     def created_by(self) -> Optional[str]:
@@ -818,7 +856,9 @@ class Bot(Base):
             self.bot_owner_id = value
     
     # Relationships
-    category: Mapped["BotCategory"] = relationship("BotCategory", back_populates="bots")
+    # Services resolve categories through BotService's in-memory cache;
+    # load explicitly with selectinload(Bot.category) where needed
+    category: Mapped["BotCategory"] = relationship("BotCategory", back_populates="bots", lazy="raise_on_sql")
     conversations: Mapped[List["Conversation"]] = relationship("Conversation", back_populates="bot")
 
 # Export all models
@@ -828,6 +868,7 @@ __all__ = [
     "ConversationStatus", 
     "MessageType",
     "BotStatus",
+    "MessageRole",
     "User",
     "UserProfile",
     "UserSettings",
@@ -5,8 +5,12 @@ import asyncio
 from datetime import datetime
 
 # SQLAlchemy imports
+# Eager loading convention for the repositories: selectinload for collections
+# (one extra "WHERE pk IN (...)" query, no row multiplication from a JOIN);
+# joinedload only for one-to-one/many-to-one rows fetched alongside a single
+# parent (user profile/settings), where the JOIN adds columns but not rows
 from sqlalchemy import select, update, delete, and_, or_
-from sqlalchemy.orm import Session, selectinload, joinedload
+from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.exc import NoResultFound, MultipleResultsFound
 from ._repository_abc import RepositoryABC, AsyncRepositoryABC
@@ -3,15 +3,65 @@ Bot Repository for Chat Marketplace Service
 Handles Bot and BotCategory operations
 """
 
+import asyncio
 from typing import Optional, List, Dict, Any
-from sqlalchemy import select, update, delete, and_, or_, func, desc, asc
+from sqlalchemy import select, update, delete, and_, or_, func, desc, asc, literal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import selectinload, raiseload
 
 from ._base_repository import AsyncBaseRepository
 from ..model.sqlalchemy_models import Bot, BotCategory, Conversation
 from ..model.dto.marketplace_dto import BotStatus
 
+# Base statement for Bot queries: relationships the query did not ask for
+# raise on access instead of lazy loading (an N+1 or MissingGreenlet under asyncio)
+_SELECT_BOT = select(Bot).options(raiseload("*"))
+
+# 'active' rendered inline rather than bound, so the planner can match the
+# partial listing indexes' bot_status predicate even with a generic plan
+_ACTIVE_INLINE = literal(BotStatus.ACTIVE.value, literal_execute=True)
+
+# ORDER BY of the keyset-paginated listings as (attribute, descending) pairs;
+# bot_id closes each order so a cursor names exactly one position
+CATEGORY_LISTING_ORDER = (
+    (Bot.is_featured, True), (Bot.rating_tenths, True), (Bot.display_name, False), (Bot.bot_id, False)
+)
+PREMIUM_LISTING_ORDER = (
+    (Bot.rating_tenths, True), (Bot.display_name, False), (Bot.bot_id, False)
+)
+
+def listing_cursor(bot: Bot, order) -> tuple:
+    """Sort-key values of ``bot`` - pass back as ``after`` to fetch the rows that follow it"""
+    return tuple(getattr(bot, attribute.key) for attribute, _ in order)
+
+def _order_by(order) -> list:
+    return [desc(attribute) if descending else asc(attribute) for attribute, descending in order]
+
+def _seek_after(order, cursor: tuple):
+    """Rows strictly after ``cursor`` in ``order``
+    
+    Mixed ASC/DESC keys rule out a single row-value comparison, so this is the
+    expanded form: k1 after c1, OR k1 = c1 AND k2 after c2, OR ... NULLs follow
+    PostgreSQL's default placement (first under DESC, last under ASC), which
+    keeps ORDER BY on the bare columns and so on the listing indexes.
+    """
+    if len(cursor) != len(order):
+        raise ValueError("Cursor does not match the listing order")
+    branches = []
+    equal = []
+    for (attribute, descending), value in zip(order, cursor):
+        if value is None:
+            # Only non-NULLs follow a NULL under DESC; nothing follows it under ASC
+            after = attribute.is_not(None) if descending else None
+            same = attribute.is_(None)
+        else:
+            after = attribute < value if descending else or_(attribute > value, attribute.is_(None))
+            same = attribute == value
+        if after is not None:
+            branches.append(and_(*equal, after))
+        equal.append(same)
+    return or_(*branches)
+
 class BotCategoryRepository(AsyncBaseRepository[BotCategory]):
     """Repository for BotCategory operations"""
     
@@ -32,32 +82,36 @@ class BotCategoryRepository(AsyncBaseRepository[BotCategory]):
     
     async def get_with_bot_count(self, category_id: str) -> Optional[Dict[str, Any]]:
         """Get category with bot count"""
-        category_stmt = select(BotCategory).where(BotCategory.category_id == category_id)
-        category_result = await self.session.execute(category_stmt)
-        category = category_result.scalar_one_or_none()
-        
-        if not category:
-            return None
-        
-        # Count active bots in this category
-        bot_count_stmt = (
+        # Active bot count as a scalar subquery - category and count in one round-trip
+        bot_count = (
             select(func.count(Bot.bot_id))
-            .where(Bot.bot_category_id == category_id)
+            .where(Bot.bot_category_id == BotCategory.category_id)
             .where(Bot.bot_status == BotStatus.ACTIVE.value)
+            .scalar_subquery()
         )
-        bot_count_result = await self.session.execute(bot_count_stmt)
-        bot_count = bot_count_result.scalar() or 0
+        stmt = (
+            select(BotCategory, bot_count.label("bot_count"))
+            .where(BotCategory.category_id == category_id)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        
+        if row is None:
+            return None
         
         return {
-            "category": category,
-            "bot_count": bot_count
+            "category": row[0],
+            "bot_count": row[1]
         }
     
     async def get_categories_with_bots(self, limit: int = 50) -> List[BotCategory]:
         """Get categories that have active bots"""
         stmt = (
             select(BotCategory)
-            .options(selectinload(BotCategory.bots.and_(Bot.bot_status == BotStatus.ACTIVE.value)))
+            .options(
+                selectinload(BotCategory.bots.and_(Bot.bot_status == BotStatus.ACTIVE.value)),
+                raiseload("*")
+            )
             .where(BotCategory.is_active == True)
             .order_by(asc(BotCategory.sort_order))
             .limit(limit)
@@ -73,17 +127,19 @@ class BotCategoryRepository(AsyncBaseRepository[BotCategory]):
     
     async def search_categories(self, query: str, limit: int = 20, offset: int = 0) -> List[BotCategory]:
         """Search categories by name or description"""
+        if " " in query.strip():
+            # Multi-word queries match words anywhere in name/description
+            # through the GIN-indexed search_tsv column
+            search_filter = BotCategory.search_tsv.bool_op("@@")(func.plainto_tsquery("simple", query))
+        else:
+            # Single terms keep substring semantics (trigram indexes serve the ILIKEs)
+            search_filter = or_(
+                BotCategory.category_name.ilike(f"%{query}%"),        # Use actual column name
+                BotCategory.category_description.ilike(f"%{query}%") # Use actual column name
+            )
         stmt = (
             select(BotCategory)
-            .where(
-                and_(
-                    BotCategory.is_active == True,
-                    or_(
-                        BotCategory.category_name.ilike(f"%{query}%"),        # Use actual column name
-                        BotCategory.category_description.ilike(f"%{query}%") # Use actual column name
-                    )
-                )
-            )
+            .where(and_(BotCategory.is_active == True, search_filter))
             .order_by(asc(BotCategory.sort_order))
             .limit(limit)
             .offset(offset)
@@ -99,43 +155,20 @@ class BotRepository(AsyncBaseRepository[Bot]):
     
     async def get_by_id(self, bot_id: str) -> Optional[Bot]:
         """Get bot by ID without lazy loading relationships"""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        logger.debug(f"🔍 DEBUG BOT_REPO: get_by_id called for bot_id: {bot_id}")
-        logger.debug(f"🔍 DEBUG BOT_REPO: Session type: {type(self.session)}")
-        logger.debug(f"🔍 DEBUG BOT_REPO: Session is_active: {self.session.is_active}")
-        
-        try:
-            stmt = select(Bot).where(Bot.bot_id == bot_id)
-            logger.debug(f"🔍 DEBUG BOT_REPO: Statement created: {stmt}")
-            
-            logger.debug(f"🔍 DEBUG BOT_REPO: Executing query")
-            result = await self.session.execute(stmt)
-            logger.debug(f"🔍 DEBUG BOT_REPO: Query executed successfully")
-            
-            logger.debug(f"🔍 DEBUG BOT_REPO: Getting scalar result")
-            bot = result.scalar_one_or_none()
-            logger.debug(f"🔍 DEBUG BOT_REPO: Bot found: {bot is not None}")
-            
-            if bot:
-                logger.debug(f"🔍 DEBUG BOT_REPO: Bot object dict keys: {list(bot.__dict__.keys())}")
-            
-            return bot
-        except Exception as e:
-            logger.error(f"❌ DEBUG BOT_REPO: Error in get_by_id: {type(e)} - {str(e)}")
-            raise
+        stmt = _SELECT_BOT.where(Bot.bot_id == bot_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
     
     async def get_by_name(self, name: str) -> Optional[Bot]:
         """Get bot by unique name"""
-        stmt = select(Bot).where(Bot.bot_name == name)
+        stmt = _SELECT_BOT.where(Bot.bot_name == name)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
     async def get_with_category(self, bot_id: str) -> Optional[Bot]:
         """Get bot with category information"""
         stmt = (
-            select(Bot)
+            _SELECT_BOT
             .options(selectinload(Bot.category))
             .where(Bot.bot_id == bot_id)
         )
@@ -147,21 +180,26 @@ class BotRepository(AsyncBaseRepository[Bot]):
         category_id: str,
         status: Optional[BotStatus] = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[tuple] = None
     ) -> List[Bot]:
-        """Get bots by category"""
-        stmt = select(Bot).where(Bot.bot_category_id == category_id)
+        """Get bots by category
+        
+        ``after`` is the listing_cursor() of the previous page's last bot; when
+        given the page seeks past it instead of skipping ``offset`` rows.
+        """
+        stmt = _SELECT_BOT.where(Bot.bot_category_id == category_id)
         
         if status:
             stmt = stmt.where(Bot.bot_status == status.value)
         else:
             stmt = stmt.where(Bot.bot_status == BotStatus.ACTIVE.value)
         
-        stmt = (
-            stmt.order_by(desc(Bot.is_featured), desc(Bot.rating), asc(Bot.display_name))
-            .limit(limit)
-            .offset(offset)
-        )
+        stmt = stmt.order_by(*_order_by(CATEGORY_LISTING_ORDER)).limit(limit)
+        if after is not None:
+            stmt = stmt.where(_seek_after(CATEGORY_LISTING_ORDER, after))
+        else:
+            stmt = stmt.offset(offset)
         
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
@@ -169,35 +207,43 @@ class BotRepository(AsyncBaseRepository[Bot]):
     async def get_featured_bots(self, limit: int = 10) -> List[Bot]:
         """Get featured bots"""
         stmt = (
-            select(Bot)
+            _SELECT_BOT
             .where(Bot.is_featured == True)
-            .where(Bot.bot_status == BotStatus.ACTIVE.value)
-            .order_by(desc(Bot.rating), asc(Bot.display_name))
+            .where(Bot.bot_status == _ACTIVE_INLINE)
+            .order_by(desc(Bot.rating_tenths), asc(Bot.display_name))
             .limit(limit)
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
     
-    async def get_premium_bots(self, limit: int = 20, offset: int = 0) -> List[Bot]:
-        """Get premium bots"""
+    async def get_premium_bots(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        after: Optional[tuple] = None
+    ) -> List[Bot]:
+        """Get premium bots (``after`` seeks like get_by_category's)"""
         stmt = (
-            select(Bot)
+            _SELECT_BOT
             .where(Bot.is_premium == True)
-            .where(Bot.bot_status == BotStatus.ACTIVE.value)
-            .order_by(desc(Bot.rating), asc(Bot.display_name))
+            .where(Bot.bot_status == _ACTIVE_INLINE)
+            .order_by(*_order_by(PREMIUM_LISTING_ORDER))
             .limit(limit)
-            .offset(offset)
         )
+        if after is not None:
+            stmt = stmt.where(_seek_after(PREMIUM_LISTING_ORDER, after))
+        else:
+            stmt = stmt.offset(offset)
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
     
     async def get_top_rated_bots(self, limit: int = 10) -> List[Bot]:
         """Get top rated bots"""
         stmt = (
-            select(Bot)
+            _SELECT_BOT
             .where(Bot.bot_status == BotStatus.ACTIVE.value)
-            .where(Bot.rating.isnot(None))
-            .order_by(desc(Bot.rating), desc(Bot.total_conversations))
+            .where(Bot.rating_tenths.isnot(None))
+            .order_by(desc(Bot.rating_tenths), desc(Bot.total_conversations))
             .limit(limit)
         )
         result = await self.session.execute(stmt)
@@ -206,9 +252,9 @@ class BotRepository(AsyncBaseRepository[Bot]):
     async def get_most_used_bots(self, limit: int = 10) -> List[Bot]:
         """Get most used bots by conversation count"""
         stmt = (
-            select(Bot)
+            _SELECT_BOT
             .where(Bot.bot_status == BotStatus.ACTIVE.value)
-            .order_by(desc(Bot.total_conversations), desc(Bot.rating))
+            .order_by(desc(Bot.total_conversations), desc(Bot.rating_tenths))
             .limit(limit)
         )
         result = await self.session.execute(stmt)
@@ -228,16 +274,18 @@ class BotRepository(AsyncBaseRepository[Bot]):
         offset: int = 0
     ) -> List[Bot]:
         """Search bots with advanced filters"""
-        stmt = (
-            select(Bot)
-            .where(
-                or_(
-                    Bot.bot_name.ilike(f"%{query}%"),       # Use actual column name
-                    Bot.display_name.ilike(f"%{query}%"),   # This should work (direct column)
-                    Bot.bot_description.ilike(f"%{query}%") # Use actual column name
-                )
+        if " " in query.strip():
+            # Multi-word queries match words anywhere in name/display name/description
+            # through the GIN-indexed search_tsv column
+            search_filter = Bot.search_tsv.bool_op("@@")(func.plainto_tsquery("simple", query))
+        else:
+            # Single terms keep substring semantics (trigram indexes serve the ILIKEs)
+            search_filter = or_(
+                Bot.bot_name.ilike(f"%{query}%"),       # Use actual column name
+                Bot.display_name.ilike(f"%{query}%"),   # This should work (direct column)
+                Bot.bot_description.ilike(f"%{query}%") # Use actual column name
             )
-        )
+        stmt = _SELECT_BOT.where(search_filter)
         
         # Apply filters
         if category_id:
@@ -255,14 +303,14 @@ class BotRepository(AsyncBaseRepository[Bot]):
             stmt = stmt.where(Bot.is_premium == is_premium)
         
         if min_rating is not None:
-            stmt = stmt.where(Bot.rating >= min_rating)
+            stmt = stmt.where(Bot.rating_tenths >= round(min_rating * 10))
         
         # Apply sorting - map property names to column names
         column_mapping = {
             "name": Bot.bot_name,
             "display_name": Bot.display_name,
             "description": Bot.bot_description,
-            "rating": Bot.rating,
+            "rating": Bot.rating_tenths,
             "created_at": Bot.created_at,
             "total_conversations": Bot.total_conversations
         }
@@ -278,11 +326,12 @@ class BotRepository(AsyncBaseRepository[Bot]):
         return list(result.scalars().all())
     
     async def get_by_status(self, status: BotStatus, limit: int = 100, offset: int = 0) -> List[Bot]:
-        """Get bots by status"""
+        """Get bots by status, newest first"""
         stmt = (
-            select(Bot)
+            _SELECT_BOT
             .where(Bot.bot_status == status.value)
-            .order_by(desc(Bot.created_at))
+            # bot_id breaks created_at ties so pages never overlap or skip rows
+            .order_by(desc(Bot.created_at), desc(Bot.bot_id))
             .limit(limit)
             .offset(offset)
         )
@@ -291,19 +340,20 @@ class BotRepository(AsyncBaseRepository[Bot]):
     
     async def update_conversation_count(self, bot_id: str) -> bool:
         """Update bot's total conversation count"""
-        # Count conversations for this bot
-        count_stmt = (
+        # Count and write in one statement - one round-trip, no window for a
+        # concurrent conversation insert between the read and the write
+        conversation_count = (
             select(func.count(Conversation.conversation_id))
             .where(Conversation.conversation_bot_id == bot_id)
+            .scalar_subquery()
         )
-        count_result = await self.session.execute(count_stmt)
-        total_conversations = count_result.scalar() or 0
-        
-        # Update bot's conversation count
         update_stmt = (
             update(Bot)
             .where(Bot.bot_id == bot_id)
-            .values(total_conversations=total_conversations)
+            .values(total_conversations=conversation_count)
+            # The subquery cannot be evaluated in Python; skip the extra
+            # fetch of affected rows that "auto" would fall back to
+            .execution_options(synchronize_session=False)
         )
         result = await self.session.execute(update_stmt)
         await self.session.flush()
@@ -314,7 +364,7 @@ class BotRepository(AsyncBaseRepository[Bot]):
         stmt = (
             update(Bot)
             .where(Bot.bot_id == bot_id)
-            .values(rating=new_rating)
+            .values(rating_tenths=round(new_rating * 10))
         )
         result = await self.session.execute(stmt)
         await self.session.flush()
@@ -335,7 +385,13 @@ class BotRepository(AsyncBaseRepository[Bot]):
         """Count bots by status"""
         stmt = select(func.count(Bot.bot_id)).where(Bot.bot_status == status.value)
         result = await self.session.execute(stmt)
-        return result.scalar() or 0
+        return result.scalar_one()
+    
+    async def count_premium(self) -> int:
+        """Count active premium bots"""
+        stmt = select(func.count(Bot.bot_id)).where(Bot.is_premium == True, Bot.bot_status == _ACTIVE_INLINE)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
     
     async def count_by_category(self, category_id: str, status: Optional[BotStatus] = None) -> int:
         """Count bots by category"""
@@ -345,50 +401,48 @@ class BotRepository(AsyncBaseRepository[Bot]):
             stmt = stmt.where(Bot.bot_status == status.value)
         
         result = await self.session.execute(stmt)
-        return result.scalar() or 0
+        return result.scalar_one()
     
     async def get_bot_stats(self) -> Dict[str, Any]:
         """Get bot statistics"""
-        total_stmt = select(func.count(Bot.bot_id))
-        active_stmt = select(func.count(Bot.bot_id)).where(Bot.bot_status == BotStatus.ACTIVE.value)
-        pending_stmt = select(func.count(Bot.bot_id)).where(Bot.bot_status == BotStatus.PENDING.value)
-        featured_stmt = (
-            select(func.count(Bot.bot_id))
-            .where(Bot.is_featured == True)
-            .where(Bot.bot_status == BotStatus.ACTIVE.value)
-        )
-        premium_stmt = (
-            select(func.count(Bot.bot_id))
-            .where(Bot.is_premium == True)
-            .where(Bot.bot_status == BotStatus.ACTIVE.value)
+        # All five counts in one pass over bots - FILTER restricts each aggregate
+        active = Bot.bot_status == BotStatus.ACTIVE.value
+        counts_stmt = select(
+            func.count(Bot.bot_id).label("total_bots"),
+            func.count(Bot.bot_id).filter(active).label("active_bots"),
+            func.count(Bot.bot_id).filter(Bot.bot_status == BotStatus.PENDING.value).label("pending_bots"),
+            func.count(Bot.bot_id).filter(and_(Bot.is_featured == True, active)).label("featured_bots"),
+            func.count(Bot.bot_id).filter(and_(Bot.is_premium == True, active)).label("premium_bots"),
         )
         
-        total_result = await self.session.execute(total_stmt)
-        active_result = await self.session.execute(active_stmt)
-        pending_result = await self.session.execute(pending_stmt)
-        featured_result = await self.session.execute(featured_stmt)
-        premium_result = await self.session.execute(premium_stmt)
-        
-        # Get bots by category - Fixed to use actual column names
+        # Active bots per category - the status test sits in the ON clause so
+        # categories without active bots still come back (COUNT of no rows is 0)
         category_stats_stmt = (
             select(BotCategory.category_name, func.count(Bot.bot_id))
-            .outerjoin(Bot, BotCategory.category_id == Bot.bot_category_id)
-            .where(or_(Bot.bot_status == BotStatus.ACTIVE.value, Bot.bot_status.is_(None)))
+            .outerjoin(Bot, and_(BotCategory.category_id == Bot.bot_category_id, active))
             .group_by(BotCategory.category_id, BotCategory.category_name)
         )
-        category_stats_result = await self.session.execute(category_stats_stmt)
+        
+        # Read-only aggregates: run both on their own pooled connections so they
+        # overlap (one session connection cannot run two statements at once)
+        engine = self.session.bind
+        async with engine.connect() as counts_conn, engine.connect() as categories_conn:
+            counts_result, category_stats_result = await asyncio.gather(
+                counts_conn.execute(counts_stmt),
+                categories_conn.execute(category_stats_stmt)
+            )
+        counts = counts_result.mappings().one()
         bots_by_category = {row[0]: row[1] for row in category_stats_result}
         
         return {
-            "total_bots": total_result.scalar() or 0,
-            "active_bots": active_result.scalar() or 0,
-            "pending_bots": pending_result.scalar() or 0,
-            "featured_bots": featured_result.scalar() or 0,
-            "premium_bots": premium_result.scalar() or 0,
+            **counts,
             "bots_by_category": bots_by_category,
         }
 
 __all__ = [
     "BotCategoryRepository",
-    "BotRepository"
+    "BotRepository",
+    "CATEGORY_LISTING_ORDER",
+    "PREMIUM_LISTING_ORDER",
+    "listing_cursor"
 ]
\ No newline at end of file
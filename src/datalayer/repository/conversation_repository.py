@@ -5,9 +5,10 @@ Handles Conversation operations with related entities
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
-from sqlalchemy import select, update, delete, and_, or_, func, desc
+from sqlalchemy import select, update, delete, and_, or_, func, desc, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ._base_repository import AsyncBaseRepository
 from ..model.sqlalchemy_models import Conversation, Message, User, Bot
@@ -27,16 +28,15 @@ class ConversationRepository(AsyncBaseRepository[Conversation]):
         status: Optional[ConversationStatus] = None
     ) -> List[Conversation]:
         """Get conversations by user ID"""
-        stmt = (
-            select(Conversation)
-            .where(Conversation.conversation_user_id == user_id)
-        )
+        # lambda_stmt: construction is cached per code path, only parameters are rebound
+        stmt = lambda_stmt(lambda: select(Conversation).where(Conversation.conversation_user_id == user_id))
         
         if status:
-            stmt = stmt.where(Conversation.conversation_status == status.value)
+            status_value = status.value
+            stmt += lambda s: s.where(Conversation.conversation_status == status_value)
         
-        stmt = (
-            stmt.limit(limit)
+        stmt += lambda s: (
+            s.limit(limit)
             .offset(offset)
             .order_by(desc(Conversation.last_message_at), desc(Conversation.conversation_updated_at))
         )
@@ -63,18 +63,20 @@ class ConversationRepository(AsyncBaseRepository[Conversation]):
             return None
         
         # Then get recent messages
-        messages_stmt = (
+        messages_stmt = lambda_stmt(lambda: (
             select(Message)
             .where(Message.conversation_id == conversation_id)
             .where(Message.is_deleted == False)
             .order_by(desc(Message.created_at))
             .limit(message_limit)
-        )
+        ))
         messages_result = await self.session.execute(messages_stmt)
         messages = list(messages_result.scalars().all())
         
-        # Reverse to get chronological order
-        conversation.messages = list(reversed(messages))
+        # Reverse to get chronological order. Attached as already-loaded state:
+        # plain assignment would lazy-load the full collection first and mark
+        # every older message as a delete-orphan
+        set_committed_value(conversation, 'messages', list(reversed(messages)))
         
         return conversation
     
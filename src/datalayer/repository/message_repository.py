@@ -3,16 +3,70 @@ Message Repository for Chat Marketplace Service
 Handles Message, Document, and MemoryHistory operations
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from datetime import datetime, timedelta
-from sqlalchemy import select, update, delete, and_, or_, func, desc, asc
+from sqlalchemy import select, insert, update, delete, and_, or_, func, desc, asc, case, bindparam, lambda_stmt, RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import selectinload, undefer_group
 
 from ._base_repository import AsyncBaseRepository
-from ..model.sqlalchemy_models import Message, Document, MemoryHistory, Conversation
+from ..model.sqlalchemy_models import Message, Document, MemoryHistory, Conversation, _uuid7
 from ..model.dto.chat_dto import MessageType
 
+# Columns of MessageResponseDto, labelled with its field names, for read
+# paths that skip ORM hydration (no identity map, no attribute instrumentation)
+_MESSAGE_READ_COLUMNS = (
+    Message.message_id.label("message_id"),
+    Message.message_conversation_id.label("conversation_id"),
+    Message.message_parent_message_id.label("parent_message_id"),
+    Message.message_role.label("sender_type"),
+    case(
+        (Message.message_role == "user", Message.message_user_id),
+        (Message.message_role == "bot", Message.message_bot_id),
+    ).label("sender_id"),
+    # Unknown/legacy/NULL types fall back to 'text', as Message.message_type does
+    case(
+        (Message.message_type_db.in_([member.value for member in MessageType]), Message.message_type_db),
+        else_=MessageType.TEXT.value,
+    ).label("message_type"),
+    Message.content.label("content"),
+    Message.custom_metadata.label("metadata"),
+    Message.is_edited.label("is_edited"),
+    Message.is_deleted.label("is_deleted"),
+    Message.created_at.label("created_at"),
+    Message.updated_at.label("updated_at"),
+)
+
+# Hot statements built once at import with bindparam() placeholders, so each
+# call only supplies parameters and hits the compiled cache directly.
+# New fixed-shape hot queries should follow the same pattern.
+_CONVERSATION_FILTER = Message.message_conversation_id == bindparam("conversation_id")
+_LIVE_FILTER = Message.is_deleted == False
+
+def _message_rows(*criteria):
+    return (
+        select(*_MESSAGE_READ_COLUMNS)
+        .where(*criteria)
+        .order_by(asc(Message.created_at))
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+
+_MESSAGE_ROWS = {
+    False: _message_rows(_CONVERSATION_FILTER, _LIVE_FILTER),  # include_deleted=False
+    True: _message_rows(_CONVERSATION_FILTER),
+}
+_MESSAGE_COUNT = {
+    False: select(func.count(Message.message_id)).where(_CONVERSATION_FILTER, _LIVE_FILTER),
+    True: select(func.count(Message.message_id)).where(_CONVERSATION_FILTER),
+}
+_DOCUMENTS_BY_MESSAGE = (
+    select(Document)
+    .options(undefer_group("content"))
+    .where(Document.document_message_id == bindparam("message_id"))
+    .order_by(asc(Document.created_at))
+)
+
 class MessageRepository(AsyncBaseRepository[Message]):
     """Repository for Message operations"""
     
@@ -27,25 +81,37 @@ class MessageRepository(AsyncBaseRepository[Message]):
         include_deleted: bool = False
     ) -> List[Message]:
         """Get messages by conversation ID"""
-        stmt = select(Message).where(Message.message_conversation_id == conversation_id)
+        # Chat history is the hottest query - lambda_stmt caches the built
+        # statement per code path, so later calls only rebind the parameters
+        stmt = lambda_stmt(lambda: select(Message).where(Message.message_conversation_id == conversation_id))
         
         if not include_deleted:
-            stmt = stmt.where(Message.is_deleted == False)
+            stmt += lambda s: s.where(Message.is_deleted == False)
         
-        stmt = (
-            stmt.order_by(asc(Message.created_at))
-            .limit(limit)
-            .offset(offset)
-        )
+        stmt += lambda s: s.order_by(asc(Message.created_at)).limit(limit).offset(offset)
         
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
     
+    async def get_rows_by_conversation(
+        self, 
+        conversation_id: str, 
+        limit: int = 50, 
+        offset: int = 0,
+        include_deleted: bool = False
+    ) -> List[RowMapping]:
+        """Read-only variant of get_by_conversation returning plain rows keyed like MessageResponseDto"""
+        result = await self.session.execute(
+            _MESSAGE_ROWS[include_deleted],
+            {"conversation_id": conversation_id, "limit": limit, "offset": offset}
+        )
+        return list(result.mappings().all())
+    
     async def get_with_documents(self, message_id: str) -> Optional[Message]:
         """Get message with documents"""
         stmt = (
             select(Message)
-            .options(selectinload(Message.documents))
+            .options(*Message.loader_with_documents())
             .where(Message.message_id == message_id)
         )
         result = await self.session.execute(stmt)
@@ -155,12 +221,7 @@ class MessageRepository(AsyncBaseRepository[Message]):
     
     async def count_by_conversation(self, conversation_id: str, include_deleted: bool = False) -> int:
         """Count messages in a conversation"""
-        stmt = select(func.count(Message.message_id)).where(Message.message_conversation_id == conversation_id)
-        
-        if not include_deleted:
-            stmt = stmt.where(Message.is_deleted == False)
-        
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_MESSAGE_COUNT[include_deleted], {"conversation_id": conversation_id})
         return result.scalar() or 0
     
     async def count_by_sender(self, conversation_id: str, sender_type: str) -> int:
@@ -212,6 +273,31 @@ class MessageRepository(AsyncBaseRepository[Message]):
         result = await self.session.execute(stmt)
         await self.session.flush()
         return result.rowcount > 0
+    
+    async def bulk_insert(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Insert many messages in batched INSERT ... RETURNING statements, returns their IDs
+        
+        Rows are dicts keyed by mapped attribute names (message_conversation_id,
+        message_role, ...). Skips the per-object unit of work - use save() for single messages.
+        IDs come back in the order of ``rows``, even across insertmanyvalues batches.
+        """
+        if not rows:
+            return []
+        stmt = insert(Message).returning(Message.message_id, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, rows)
+        return list(result.scalars().all())
+
+# chats.document columns written by DocumentRepository.copy_insert; timestamps
+# and document_file_type are filled in by the server
+_COPY_COLUMNS = (
+    "document_id",
+    "document_uploaded_by",
+    "document_filename",
+    "document_file_size",
+    "document_mime_type",
+    "document_content",
+    "document_message_id",
+)
 
 class DocumentRepository(AsyncBaseRepository[Document]):
     """Repository for Document operations"""
@@ -221,18 +307,14 @@ class DocumentRepository(AsyncBaseRepository[Document]):
     
     async def get_by_message(self, message_id: str) -> List[Document]:
         """Get documents by message ID"""
-        stmt = (
-            select(Document)
-            .where(Document.document_message_id == message_id)
-            .order_by(asc(Document.created_at))
-        )
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_DOCUMENTS_BY_MESSAGE, {"message_id": message_id})
         return list(result.scalars().all())
     
     async def get_by_conversation(self, conversation_id: str, limit: int = 100, offset: int = 0) -> List[Document]:
         """Get documents by conversation ID"""
         stmt = (
             select(Document)
+            .options(undefer_group("content"))
             .join(Message, Document.document_message_id == Message.message_id)
             .where(Message.message_conversation_id == conversation_id)
             .order_by(desc(Document.created_at))
@@ -251,9 +333,10 @@ class DocumentRepository(AsyncBaseRepository[Document]):
         """Get documents by file type in a conversation"""
         stmt = (
             select(Document)
+            .options(undefer_group("content"))
             .join(Message, Document.document_message_id == Message.message_id)
             .where(Message.message_conversation_id == conversation_id)
-            .where(Document.document_mime_type.like(f"{file_type}%"))
+            .where(Document.document_file_type == file_type)
             .order_by(desc(Document.created_at))
             .limit(limit)
         )
@@ -271,13 +354,14 @@ class DocumentRepository(AsyncBaseRepository[Document]):
         """Search documents by filename"""
         stmt = (
             select(Document)
+            .options(undefer_group("content"))
             .join(Message, Document.document_message_id == Message.message_id)
             .where(Message.message_conversation_id == conversation_id)
             .where(Document.document_filename.ilike(f"%{query}%"))
         )
         
         if file_type:
-            stmt = stmt.where(Document.document_mime_type.like(f"{file_type}%"))
+            stmt = stmt.where(Document.document_file_type == file_type)
         
         stmt = (
             stmt.order_by(desc(Document.created_at))
@@ -298,6 +382,44 @@ class DocumentRepository(AsyncBaseRepository[Document]):
         result = await self.session.execute(stmt)
         return result.scalar() or 0
     
+    async def bulk_insert(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Insert many documents in batched INSERT ... RETURNING statements, returns their IDs
+        
+        IDs come back in the order of ``rows``, even across insertmanyvalues batches.
+        """
+        if not rows:
+            return []
+        stmt = insert(Document).returning(Document.document_id, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, rows)
+        return list(result.scalars().all())
+    
+    async def copy_insert(self, rows: Iterable[Dict[str, Any]]) -> List[str]:
+        """Stream documents into chats.document with binary COPY, returns their IDs
+        
+        For large ingests where INSERT parse/bind overhead dominates. Rows are
+        dicts keyed by column name (document_uploaded_by, document_filename,
+        document_file_size, document_mime_type, document_content,
+        document_message_id) and are consumed lazily. Runs on the session's
+        connection, inside its transaction; no ORM objects are created.
+        """
+        ids: List[str] = []
+        
+        def records():
+            for row in rows:
+                document_id = row.get("document_id") or _uuid7()
+                ids.append(document_id)
+                yield (document_id, *(row[column] for column in _COPY_COLUMNS[1:]))
+        
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Document.__table__.name,
+            schema_name=Document.__table__.schema,
+            columns=_COPY_COLUMNS,
+            records=records()
+        )
+        return ids
+    
     async def get_total_file_size(self, conversation_id: str) -> int:
         """Get total file size for a conversation"""
         stmt = (
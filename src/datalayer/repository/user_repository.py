@@ -4,9 +4,9 @@ Handles User, UserProfile, and UserSettings operations
 """
 
 from typing import Optional, List, Dict, Any
-from sqlalchemy import select, update, delete, and_, or_, func
+from sqlalchemy import select, update, delete, and_, or_, func, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import joinedload
 
 from ._base_repository import AsyncBaseRepository
 from ..model.sqlalchemy_models import User, UserProfile, UserSettings
@@ -20,7 +20,9 @@ class UserRepository(AsyncBaseRepository[User]):
     
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email address"""
-        stmt = select(User).where(User.user_email == email.lower())
+        email = email.lower()
+        # lambda_stmt: login hot path - construction is cached, only email is rebound
+        stmt = lambda_stmt(lambda: select(User).where(User.user_email == email))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
@@ -44,7 +46,7 @@ class UserRepository(AsyncBaseRepository[User]):
         """Get user with profile data"""
         stmt = (
             select(User)
-            .options(selectinload(User.profile))
+            .options(joinedload(User.profile))
             .where(User.user_id == user_id)
         )
         result = await self.session.execute(stmt)
@@ -52,11 +54,13 @@ class UserRepository(AsyncBaseRepository[User]):
     
     async def get_with_profile_and_settings(self, user_id: str) -> Optional[User]:
         """Get user with profile and settings data"""
+        # One-to-one rows - LEFT OUTER JOINed into the same SELECT instead of
+        # two extra selectin round-trips
         stmt = (
             select(User)
             .options(
-                selectinload(User.profile),
-                selectinload(User.settings)
+                joinedload(User.profile),
+                joinedload(User.settings)
             )
             .where(User.user_id == user_id)
         )
@@ -175,7 +179,7 @@ class UserProfileRepository(AsyncBaseRepository[UserProfile]):
     
     async def get_by_user_id(self, user_id: str) -> Optional[UserProfile]:
         """Get profile by user ID"""
-        stmt = select(UserProfile).where(UserProfile.user_id == user_id)
+        stmt = lambda_stmt(lambda: select(UserProfile).where(UserProfile.user_id == user_id))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
@@ -183,7 +187,7 @@ class UserProfileRepository(AsyncBaseRepository[UserProfile]):
         """Get profile with user data"""
         stmt = (
             select(UserProfile)
-            .options(selectinload(UserProfile.user))
+            .options(joinedload(UserProfile.user))
             .where(UserProfile.profile_id == profile_id)
         )
         result = await self.session.execute(stmt)
@@ -215,7 +219,7 @@ class UserSettingsRepository(AsyncBaseRepository[UserSettings]):
     
     async def get_by_user_id(self, user_id: str) -> Optional[UserSettings]:
         """Get settings by user ID"""
-        stmt = select(UserSettings).where(UserSettings.user_id == user_id)
+        stmt = lambda_stmt(lambda: select(UserSettings).where(UserSettings.user_id == user_id))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
@@ -223,7 +227,7 @@ class UserSettingsRepository(AsyncBaseRepository[UserSettings]):
         """Get settings with user data"""
         stmt = (
             select(UserSettings)
-            .options(selectinload(UserSettings.user))
+            .options(joinedload(UserSettings.user))
             .where(UserSettings.settings_id == settings_id)
         )
         result = await self.session.execute(stmt)
@@ -258,7 +262,7 @@ class UserSettingsRepository(AsyncBaseRepository[UserSettings]):
         """Get all users with email notifications enabled"""
         stmt = (
             select(UserSettings)
-            .options(selectinload(UserSettings.user))
+            .options(joinedload(UserSettings.user))
             .where(UserSettings.email_notifications == True)
         )
         result = await self.session.execute(stmt)
@@ -11,6 +11,8 @@ class ChatMarketplaceException(Exception):
         self.message = message
         self.code = code or self.__class__.__name__
         self.details = details or {}
+        # Response body, built once so the exception handler only returns a reference
+        self.payload = {"detail": self.message, "code": self.code, "details": self.details}
         super().__init__(self.message)
 
 class ValidationError(ChatMarketplaceException):
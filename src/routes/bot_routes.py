@@ -348,6 +348,34 @@ async def search_bots_no_slash(
         min_rating, sort_by, sort_order, limit, offset, bot_service
     )
 
+# Registered ahead of /{bot_id}, which would otherwise capture "premium"
+@bots_router.get(
+    "/premium",
+    response_model=BotListResponseDto,
+    summary="Get premium bots",
+    description="Get active premium bots; page with offset or with the previous page's next_cursor"
+)
+async def get_premium_bots(
+    limit: int = Query(20, ge=1, le=200, description="Number of bots to return"),
+    offset: int = Query(0, ge=0, description="Number of bots to skip"),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page; replaces offset"),
+    bot_service: BotService = Depends(get_bot_service)
+):
+    """Get premium bots"""
+    logger.info("🚀 API: Get premium bots requested")
+    
+    try:
+        bots = await bot_service.get_premium_bots(limit, offset, after)
+        logger.info(f"✅ API: Premium bots retrieved: {len(bots.bots)} bots")
+        return bots
+        
+    except ValueError as e:
+        logger.warning(f"⚠️ API: Invalid premium bots request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ API: Failed to get premium bots: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get premium bots")
+
 @bots_router.get(
     "/{bot_id}",
     response_model=BotDetailDto,
@@ -444,16 +472,20 @@ async def get_bots_by_category(
     status: Optional[BotStatus] = Query(BotStatus.ACTIVE, description="Filter by bot status"),
     limit: int = Query(20, ge=1, le=200, description="Number of bots to return"),
     offset: int = Query(0, ge=0, description="Number of bots to skip"),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page; replaces offset"),
     bot_service: BotService = Depends(get_bot_service)
 ):
     """Get bots by category"""
     logger.info(f"🚀 API: Get bots by category requested: {category_id}")
     
     try:
-        bots = await bot_service.get_bots_by_category(category_id, status, limit, offset)
+        bots = await bot_service.get_bots_by_category(category_id, status, limit, offset, after)
         logger.info(f"✅ API: Bots by category retrieved: {len(bots.bots)} bots")
         return bots
         
+    except ValueError as e:
+        logger.warning(f"⚠️ API: Invalid bots by category request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"❌ API: Failed to get bots by category: {e}")
         raise HTTPException(status_code=500, detail="Failed to get bots by category")
@@ -4,7 +4,7 @@ Basic health check endpoints
 """
 
 import logging
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from datalayer.database import health_check
 
 logger = logging.getLogger(__name__)
@@ -16,9 +16,10 @@ router = APIRouter(
 )
 
 # Helper function for health check
-async def _health_check_impl():
+async def _health_check_impl(request: Request):
     """Implementation for health check"""
     logger.info("🚀 API: Health check requested")
+    migrations = getattr(request.app.state, "migration_status", None)
     
     try:
         health = await health_check()
@@ -29,14 +30,16 @@ async def _health_check_impl():
                 "status": "healthy",
                 "service": "Chat Marketplace Service",
                 "version": "2.0.0",
-                "database": health
+                "database": health,
+                "migrations": migrations
             }
         else:
             return {
                 "status": "unhealthy",
                 "service": "Chat Marketplace Service",
                 "version": "2.0.0",
-                "database": health
+                "database": health,
+                "migrations": migrations
             }
         
     except Exception as e:
@@ -45,6 +48,7 @@ async def _health_check_impl():
             "status": "unhealthy",
             "service": "Chat Marketplace Service",
             "version": "2.0.0",
+            "migrations": migrations,
             "error": str(e)
         }
 
@@ -53,9 +57,9 @@ async def _health_check_impl():
     summary="Health check",
     description="Check the health status of the Chat Marketplace service and PostgreSQL database"
 )
-async def health_check_endpoint():
+async def health_check_endpoint(request: Request):
     """Perform health check (without trailing slash)"""
-    return await _health_check_impl()
+    return await _health_check_impl(request)
 
 @router.get(
     "/health/",
@@ -63,8 +67,8 @@ async def health_check_endpoint():
     description="Check the health status of the Chat Marketplace service and PostgreSQL database",
     include_in_schema=False
 )
-async def health_check_endpoint_with_slash():
+async def health_check_endpoint_with_slash(request: Request):
     """Perform health check (with trailing slash)"""
-    return await _health_check_impl()
+    return await _health_check_impl(request)
 
 __all__ = ["router"]
\ No newline at end of file
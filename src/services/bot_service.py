@@ -3,12 +3,17 @@ Bot Service for Chat Marketplace Service
 Handles bot and bot category operations
 """
 
+import base64
 import logging
+import time
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from datalayer.repository.bot_repository import BotRepository, BotCategoryRepository
+from datalayer.repository.bot_repository import (
+    BotRepository, BotCategoryRepository,
+    CATEGORY_LISTING_ORDER, PREMIUM_LISTING_ORDER, listing_cursor
+)
 from datalayer.model.sqlalchemy_models import Bot, BotCategory
 from datalayer.model.dto.marketplace_dto import (
     BotCreateDto, BotUpdateDto, BotResponseDto, BotWithCategoryDto,
@@ -20,6 +25,43 @@ from datalayer.model.dto.marketplace_dto import (
 
 logger = logging.getLogger(__name__)
 
+# Categories are a handful of rarely edited rows shown with every bot detail;
+# their DTOs are served from process memory and reloaded at most every TTL
+_CATEGORY_CACHE_TTL = 300.0
+_category_cache: Dict[str, BotCategoryResponseDto] = {}
+_category_cache_expires_at = 0.0
+
+def _invalidate_category_cache() -> None:
+    """Force the next category lookup to reload from the database"""
+    global _category_cache_expires_at
+    _category_cache_expires_at = 0.0
+
+# Homepage listings (featured/premium/top rated/most used/stats/active categories) are
+# read on every page view but change rarely; results are kept per (method, args)
+# for a short TTL and dropped whenever this process writes a bot or category
+_LISTING_CACHE_TTL = 60.0
+_listing_cache: Dict[tuple, tuple] = {}
+
+def _invalidate_listing_cache() -> None:
+    """Drop every cached listing after a bot or category write"""
+    _listing_cache.clear()
+
+def _encode_cursor(values: tuple) -> str:
+    """Opaque, URL-safe page cursor from a listing_cursor() tuple"""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    """Inverse of _encode_cursor - raises ValueError on a malformed cursor"""
+    if cursor is None:
+        return None
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:  # binascii.Error and orjson.JSONDecodeError included
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or any(isinstance(value, (list, dict)) for value in values):
+        raise ValueError("Invalid cursor")
+    return tuple(values)
+
 class BotService:
     """Service for bot operations"""
     
@@ -61,6 +103,7 @@ class BotService:
             
             saved_bot = await self.bot_repo.save(bot)
             await self.session.commit()
+            _invalidate_listing_cache()
             
             logger.info(f"✅ Bot created successfully: {saved_bot.bot_id}")
             return self._bot_to_dto(saved_bot)
@@ -75,14 +118,11 @@ class BotService:
         logger.debug(f"🔍 Getting bot: {bot_id}")
         
         try:
-            if include_category:
-                bot = await self.bot_repo.get_with_category(bot_id)
-                if bot:
-                    return self._bot_with_category_to_dto(bot)
-            else:
-                bot = await self.bot_repo.get_by_id(bot_id)
-                if bot:
-                    return self._bot_to_dto(bot)
+            bot = await self.bot_repo.get_by_id(bot_id)
+            if bot:
+                if include_category:
+                    return await self._bot_with_category_to_dto(bot)
+                return self._bot_to_dto(bot)
             
             return None
             
@@ -107,7 +147,7 @@ class BotService:
         logger.debug(f"🔍 Getting bot detail: {bot_id}")
         
         try:
-            bot = await self.bot_repo.get_with_category(bot_id)
+            bot = await self.bot_repo.get_by_id(bot_id)
             if not bot:
                 return None
             
@@ -115,10 +155,10 @@ class BotService:
             conversation_count = await self.bot_repo.count_by_bot(bot_id)
             
             bot_dto = self._bot_to_dto(bot)
-            category_dto = self._category_to_dto(bot.category) if bot.category else None
+            category_dto = await self._get_category_dto(bot.bot_category_id)
             
             return BotDetailDto(
-                **bot_dto.dict(),
+                **dict(bot_dto),
                 category=category_dto,
                 conversation_count=conversation_count,
                 recent_conversations=0  # Could be enhanced to show recent activity
@@ -163,10 +203,9 @@ class BotService:
             if update_data.configuration is not None:
                 bot.configuration = update_data.configuration
             
-            bot.updated_at = datetime.utcnow()
-            
             updated_bot = await self.bot_repo.save(bot)
             await self.session.commit()
+            _invalidate_listing_cache()
             
             logger.info(f"✅ Bot updated successfully: {bot_id}")
             return self._bot_to_dto(updated_bot)
@@ -226,20 +265,24 @@ class BotService:
         category_id: str, 
         status: Optional[BotStatus] = None,
         limit: int = 20, 
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[str] = None
     ) -> BotListResponseDto:
-        """Get bots by category"""
+        """Get bots by category (``after``: next_cursor of the previous page)"""
         logger.debug(f"🔍 Getting bots by category: {category_id}")
         
         try:
-            bots = await self.bot_repo.get_by_category(category_id, status, limit + 1, offset)
+            bots = await self.bot_repo.get_by_category(
+                category_id, status, limit + 1, offset, _decode_cursor(after)
+            )
             
             # Check if there are more results
             has_next = len(bots) > limit
             if has_next:
                 bots = bots[:limit]
             
-            has_prev = offset > 0
+            has_prev = offset > 0 or after is not None
+            next_cursor = _encode_cursor(listing_cursor(bots[-1], CATEGORY_LISTING_ORDER)) if has_next else None
             
             # Get total count
             total = await self.bot_repo.count_by_category(category_id, status)
@@ -252,7 +295,8 @@ class BotService:
                 page=(offset // limit) + 1,
                 limit=limit,
                 has_next=has_next,
-                has_prev=has_prev
+                has_prev=has_prev,
+                next_cursor=next_cursor
             )
             
         except Exception as e:
@@ -264,20 +308,62 @@ class BotService:
         logger.debug(f"🔍 Getting featured bots")
         
         try:
-            bots = await self.bot_repo.get_featured_bots(limit)
-            return [self._bot_to_dto(bot) for bot in bots]
+            async def load():
+                bots = await self.bot_repo.get_featured_bots(limit)
+                return [self._bot_to_dto(bot) for bot in bots]
+            
+            return await self._cached(("featured", limit), load)
             
         except Exception as e:
             logger.error(f"❌ Failed to get featured bots: {e}")
             raise
     
+    async def get_premium_bots(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        after: Optional[str] = None
+    ) -> BotListResponseDto:
+        """Get premium bots (``after``: next_cursor of the previous page)"""
+        logger.debug("🔍 Getting premium bots")
+        
+        try:
+            cursor = _decode_cursor(after)
+            
+            async def load():
+                bots = await self.bot_repo.get_premium_bots(limit + 1, offset, cursor)
+                
+                # Check if there are more results
+                has_next = len(bots) > limit
+                if has_next:
+                    bots = bots[:limit]
+                
+                return BotListResponseDto(
+                    bots=[self._bot_to_dto(bot) for bot in bots],
+                    total=await self.bot_repo.count_premium(),
+                    page=(offset // limit) + 1,
+                    limit=limit,
+                    has_next=has_next,
+                    has_prev=offset > 0 or after is not None,
+                    next_cursor=_encode_cursor(listing_cursor(bots[-1], PREMIUM_LISTING_ORDER)) if has_next else None
+                )
+            
+            return await self._cached(("premium", limit, offset, after), load)
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to get premium bots: {e}")
+            raise
+    
     async def get_top_rated_bots(self, limit: int = 10) -> List[BotResponseDto]:
         """Get top rated bots"""
         logger.debug(f"🔍 Getting top rated bots")
         
         try:
-            bots = await self.bot_repo.get_top_rated_bots(limit)
-            return [self._bot_to_dto(bot) for bot in bots]
+            async def load():
+                bots = await self.bot_repo.get_top_rated_bots(limit)
+                return [self._bot_to_dto(bot) for bot in bots]
+            
+            return await self._cached(("top_rated", limit), load)
             
         except Exception as e:
             logger.error(f"❌ Failed to get top rated bots: {e}")
@@ -288,8 +374,11 @@ class BotService:
         logger.debug(f"🔍 Getting most used bots")
         
         try:
-            bots = await self.bot_repo.get_most_used_bots(limit)
-            return [self._bot_to_dto(bot) for bot in bots]
+            async def load():
+                bots = await self.bot_repo.get_most_used_bots(limit)
+                return [self._bot_to_dto(bot) for bot in bots]
+            
+            return await self._cached(("most_used", limit), load)
             
         except Exception as e:
             logger.error(f"❌ Failed to get most used bots: {e}")
@@ -303,6 +392,10 @@ class BotService:
             success = await self.bot_repo.update_status(bot_id, BotStatus.ACTIVE)
             
             if success:
+                await self.session.commit()
+                # Only after the commit - a read racing an earlier clear could
+                # re-cache the pre-commit rows for the whole TTL
+                _invalidate_listing_cache()
                 logger.info(f"✅ Bot approved successfully: {bot_id}")
             else:
                 logger.warning(f"⚠️ Bot not found for approval: {bot_id}")
@@ -310,6 +403,7 @@ class BotService:
             return success
             
         except Exception as e:
+            await self.session.rollback()
             logger.error(f"❌ Failed to approve bot: {e}")
             raise
     
@@ -321,6 +415,10 @@ class BotService:
             success = await self.bot_repo.update_status(bot_id, BotStatus.REJECTED)
             
             if success:
+                await self.session.commit()
+                # Only after the commit - a read racing an earlier clear could
+                # re-cache the pre-commit rows for the whole TTL
+                _invalidate_listing_cache()
                 logger.info(f"✅ Bot rejected successfully: {bot_id}")
             else:
                 logger.warning(f"⚠️ Bot not found for rejection: {bot_id}")
@@ -328,6 +426,7 @@ class BotService:
             return success
             
         except Exception as e:
+            await self.session.rollback()
             logger.error(f"❌ Failed to reject bot: {e}")
             raise
     
@@ -339,6 +438,10 @@ class BotService:
             success = await self.bot_repo.update_rating(bot_id, rating)
             
             if success:
+                await self.session.commit()
+                # Only after the commit - a read racing an earlier clear could
+                # re-cache the pre-commit rows for the whole TTL
+                _invalidate_listing_cache()
                 logger.info(f"✅ Bot rating updated successfully: {bot_id}")
             else:
                 logger.warning(f"⚠️ Bot not found for rating update: {bot_id}")
@@ -346,6 +449,7 @@ class BotService:
             return success
             
         except Exception as e:
+            await self.session.rollback()
             logger.error(f"❌ Failed to update bot rating: {e}")
             raise
     
@@ -354,7 +458,7 @@ class BotService:
         logger.debug("📊 Getting bot statistics")
         
         try:
-            stats = await self.bot_repo.get_bot_stats()
+            stats = await self._cached(("stats",), self.bot_repo.get_bot_stats)
             
             # Get top rated and most used bots
             top_rated_bots = await self.get_top_rated_bots(5)
@@ -397,6 +501,8 @@ class BotService:
             
             saved_category = await self.category_repo.save(category)
             await self.session.commit()
+            _invalidate_category_cache()
+            _invalidate_listing_cache()
             
             logger.info(f"✅ Category created successfully: {saved_category.category_id}")
             return self._category_to_dto(saved_category)
@@ -423,8 +529,11 @@ class BotService:
         logger.debug("🔍 Getting active categories")
         
         try:
-            categories = await self.category_repo.get_active_categories(limit, offset)
-            return [self._category_to_dto(category) for category in categories]
+            async def load():
+                categories = await self.category_repo.get_active_categories(limit, offset)
+                return [self._category_to_dto(category) for category in categories]
+            
+            return await self._cached(("active_categories", limit, offset), load)
             
         except Exception as e:
             logger.error(f"❌ Failed to get active categories: {e}")
@@ -488,19 +597,41 @@ class BotService:
             updated_at=bot.updated_at
         )
     
-    def _bot_with_category_to_dto(self, bot: Bot) -> BotWithCategoryDto:
-        """Convert Bot model with category to BotWithCategoryDto"""
+    async def _bot_with_category_to_dto(self, bot: Bot) -> BotWithCategoryDto:
+        """Convert Bot model to BotWithCategoryDto, category from the cache"""
         bot_dto = self._bot_to_dto(bot)
-        category_dto = None
-        
-        if hasattr(bot, 'category') and bot.category:
-            category_dto = self._category_to_dto(bot.category)
+        category_dto = await self._get_category_dto(bot.bot_category_id)
         
         return BotWithCategoryDto(
-            **bot_dto.dict(),
+            **dict(bot_dto),
             category=category_dto
         )
     
+    @staticmethod
+    async def _cached(key: tuple, load):
+        """Cache-aside lookup in the listing cache; load() runs on a miss or expiry"""
+        now = time.monotonic()
+        entry = _listing_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        value = await load()
+        _listing_cache[key] = (now + _LISTING_CACHE_TTL, value)
+        return value
+    
+    async def _get_category_dto(self, category_id: Optional[str]) -> Optional[BotCategoryResponseDto]:
+        """Category DTO from the process-wide cache, reloading all categories when stale"""
+        global _category_cache, _category_cache_expires_at
+        if category_id is None:
+            return None
+        
+        now = time.monotonic()
+        if now >= _category_cache_expires_at or category_id not in _category_cache:
+            categories = await self.category_repo.get_all()
+            _category_cache = {category.category_id: self._category_to_dto(category) for category in categories}
+            _category_cache_expires_at = now + _CATEGORY_CACHE_TTL
+        
+        return _category_cache.get(category_id)
+    
     @staticmethod
     @staticmethod
     def _category_to_dto(category: BotCategory) -> BotCategoryResponseDto:
@@ -19,6 +19,10 @@ from datalayer.model.dto.chat_dto import (
 
 logger = logging.getLogger(__name__)
 
+# Stored status -> DTO enum for every conversation in a response; a dict
+# lookup instead of EnumMeta.__call__ per row
+_STATUS_LOOKUP = {member.value: member for member in ConversationStatus}
+
 class ConversationService:
     """Service for conversation operations"""
     
@@ -161,8 +165,6 @@ class ConversationService:
             if update_data.metadata is not None:
                 conversation.custom_metadata = update_data.metadata
             
-            conversation.conversation_updated_at = datetime.utcnow()
-            
             updated_conversation = await self.conversation_repo.save(conversation)
             await self.session.commit()
             
@@ -408,7 +410,7 @@ class ConversationService:
                 bot_id=conversation.conversation_bot_id,
                 title=conversation.conversation_title,
                 description=None,  # Not supported in database schema
-                status=ConversationStatus(conversation.conversation_status),
+                status=_STATUS_LOOKUP[conversation.conversation_status],
                 metadata=conversation.custom_metadata,
                 created_at=conversation.conversation_created_at,
                 updated_at=conversation.conversation_updated_at,
@@ -436,7 +438,7 @@ class ConversationService:
             bot_dto = BotService._bot_to_dto(conversation.bot)
         
         return ConversationWithMessagesDto(
-            **conv_dto.dict(),
+            **dict(conv_dto),
             messages=message_dtos,
             bot=bot_dto
         )
@@ -5,7 +5,6 @@ Handles message, document, and memory history operations
 
 import logging
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from datalayer.repository.message_repository import MessageRepository, DocumentRepository, MemoryHistoryRepository
@@ -129,7 +128,8 @@ class MessageService:
         logger.debug(f"🔍 Getting messages for conversation: {conversation_id}")
         
         try:
-            messages = await self.message_repo.get_by_conversation(
+            # Read-only listing - plain rows, no ORM instances to hydrate
+            messages = await self.message_repo.get_rows_by_conversation(
                 conversation_id, limit + 1, offset, include_deleted
             )
             
@@ -143,7 +143,7 @@ class MessageService:
             # Get total count
             total = await self.message_repo.count_by_conversation(conversation_id, include_deleted)
             
-            message_dtos = [self._message_to_dto(msg) for msg in messages]
+            message_dtos = [MessageResponseDto(**row) for row in messages]
             
             return MessageListResponseDto(
                 messages=message_dtos,
@@ -177,8 +177,6 @@ class MessageService:
             if update_data.metadata is not None:
                 message.custom_metadata = update_data.metadata
             
-            message.updated_at = datetime.utcnow()
-            
             updated_message = await self.message_repo.save(message)
             await self.session.commit()
             
@@ -319,7 +317,7 @@ class MessageService:
             document = Document(
                 message_id=message_id,
                 file_name=document_data.file_name,
-                # file_type removed - it's a computed property from mime_type
+                # file_type is generated by the database from mime_type
                 file_size=document_data.file_size,
                 mime_type=document_data.mime_type,
                 content=document_data.content,
@@ -503,7 +501,7 @@ class MessageService:
             parent_msg_dto = self._message_to_dto(message.parent_message)
         
         return MessageWithDocumentsDto(
-            **msg_dto.dict(),
+            **dict(msg_dto),
             documents=document_dtos,
             parent_message=parent_msg_dto
         )
@@ -5,7 +5,6 @@ Handles user profile operations
 
 import logging
 from typing import Optional
-from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from datalayer.repository.user_repository import UserProfileRepository
@@ -106,7 +105,6 @@ class ProfileService:
             
             # Only save if there were actual updates
             if updated_fields:
-                profile.updated_at = datetime.utcnow()
                 updated_profile = await self.profile_repo.save(profile)
                 await self.session.commit()
                 logger.info(f"✅ Profile updated successfully for user {user_id}: {', '.join(updated_fields)}")
@@ -131,7 +129,6 @@ class ProfileService:
                 return None
             
             profile.avatar_url = avatar_url
-            profile.updated_at = datetime.utcnow()
             
             updated_profile = await self.profile_repo.save(profile)
             await self.session.commit()
@@ -5,7 +5,6 @@ Handles user settings operations
 
 import logging
 from typing import Optional, List
-from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from datalayer.repository.user_repository import UserSettingsRepository
@@ -107,8 +106,6 @@ class SettingsService:
             if update_data.two_factor_enabled is not None:
                 settings.two_factor_enabled = update_data.two_factor_enabled
             
-            settings.updated_at = datetime.utcnow()
-            
             updated_settings = await self.settings_repo.save(settings)
             await self.session.commit()
             
@@ -155,7 +152,6 @@ class SettingsService:
                 return None
             
             settings.theme = theme
-            settings.updated_at = datetime.utcnow()
             
             updated_settings = await self.settings_repo.save(settings)
             await self.session.commit()
@@ -178,7 +174,6 @@ class SettingsService:
                 return None
             
             settings.language = language
-            settings.updated_at = datetime.utcnow()
             
             updated_settings = await self.settings_repo.save(settings)
             await self.session.commit()
@@ -201,7 +196,6 @@ class SettingsService:
                 return None
             
             settings.two_factor_enabled = enabled
-            settings.updated_at = datetime.utcnow()
             
             updated_settings = await self.settings_repo.save(settings)
             await self.session.commit()
@@ -243,7 +237,6 @@ class SettingsService:
             settings.privacy_level = 'public'
             settings.theme = 'light'
             settings.two_factor_enabled = False
-            settings.updated_at = datetime.utcnow()
             
             updated_settings = await self.settings_repo.save(settings)
             await self.session.commit()
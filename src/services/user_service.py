@@ -18,6 +18,9 @@ from datalayer.model.dto.auth_dto import (
 
 logger = logging.getLogger(__name__)
 
+# Stored status -> DTO enum for every user in a response (dict lookup, not EnumMeta.__call__)
+_STATUS_LOOKUP = {member.value: member for member in UserStatus}
+
 class UserService:
     """Service for user operations"""
     
@@ -49,7 +52,7 @@ class UserService:
             
             # Create user with proper field mapping
             user = User()
-            user.user_email = user_data.email.lower()
+            user.user_email = user_data.email  # already lowercased by UserCreateDto
             user.password_hash = password_hash
             user.user_name = user_data.user_name  # First name
             user.user_surname = user_data.user_surname  # Last name
@@ -173,8 +176,6 @@ class UserService:
             if update_data.status is not None:
                 user.status = update_data.status.value
             
-            user.user_updated_at = datetime.utcnow()
-            
             updated_user = await self.user_repo.save(user)
             await self.session.commit()
             
@@ -203,7 +204,6 @@ class UserService:
             # Hash new password
             new_password_hash = self._hash_password(password_data.new_password)
             user.password_hash = new_password_hash
-            user.user_updated_at = datetime.utcnow()
             
             await self.user_repo.save(user)
             await self.session.commit()
@@ -226,7 +226,6 @@ class UserService:
                 return False
             
             user.status = UserStatus.INACTIVE.value
-            user.user_updated_at = datetime.utcnow()
             
             await self.user_repo.save(user)
             await self.session.commit()
@@ -249,7 +248,6 @@ class UserService:
                 return False
             
             user.is_verified = True
-            user.user_updated_at = datetime.utcnow()
             
             await self.user_repo.save(user)
             await self.session.commit()
@@ -359,7 +357,7 @@ class UserService:
             username=user.username,
             phone_number=user.phone_number,
             is_verified=user.is_verified,
-            status=UserStatus(user.status),
+            status=_STATUS_LOOKUP[user.status],
             created_at=user.user_created_at,
             updated_at=user.user_updated_at,
             last_login_at=user.last_login_at
@@ -381,7 +379,7 @@ class UserService:
             settings_dto = SettingsService._settings_to_dto(user.settings)
         
         return UserWithProfileDto(
-            **user_dto.dict(),
+            **dict(user_dto),
             profile=profile_dto,
             settings=settings_dto
         )
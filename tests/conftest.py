@@ -0,0 +1,105 @@
+"""
+Shared fixtures for the Chat Marketplace Service test suite
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Application modules import each other from src/ (e.g. `from config import config`)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config import config
+
+# Database tests run against a scratch database named by TEST_POSTGRES_DB (same
+# host and credentials as the app) and are skipped when it is unset or unreachable
+TEST_POSTGRES_DB = os.getenv("TEST_POSTGRES_DB")
+
+# Same bootstrap as database.py: schemas plus pg_trgm for the trigram indexes
+_BOOTSTRAP_SQL = """
+DO $$
+BEGIN
+    CREATE SCHEMA IF NOT EXISTS auth;
+    CREATE SCHEMA IF NOT EXISTS chats;
+    CREATE SCHEMA IF NOT EXISTS marketplace;
+    CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
+END $$
+"""
+
+
+async def _database_reachable() -> bool:
+    import asyncpg
+    try:
+        conn = await asyncio.wait_for(
+            asyncpg.connect(
+                host=config.postgres_host,
+                port=config.postgres_port,
+                user=config.postgres_user,
+                password=config.postgres_password,
+                database=TEST_POSTGRES_DB
+            ),
+            timeout=2.0
+        )
+    except Exception:
+        return False
+    await conn.close()
+    return True
+
+
+@pytest.fixture
+async def db_session():
+    """AsyncSession over freshly created tables, all rolled back afterwards
+    
+    The schema is created inside the outer transaction, so every test starts
+    from empty tables and leaves nothing behind. Session commits become
+    savepoints within that transaction.
+    """
+    if not TEST_POSTGRES_DB:
+        pytest.skip("TEST_POSTGRES_DB is not set")
+    if not await _database_reachable():
+        pytest.skip(f"PostgreSQL database {TEST_POSTGRES_DB} is not reachable")
+
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.pool import NullPool
+    from datalayer.model.sqlalchemy_models import Base
+
+    url = f"{config.postgres_url.rsplit('/', 1)[0]}/{TEST_POSTGRES_DB}"
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        await connection.exec_driver_sql(_BOOTSTRAP_SQL)
+        await connection.run_sync(Base.metadata.create_all)
+        session = AsyncSession(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+
+@pytest.fixture
+async def conversation(db_session):
+    """A user, a bot and a conversation between them"""
+    from datalayer.model.sqlalchemy_models import Bot, Conversation, User
+
+    user = User(
+        user_email="tester@example.com",
+        password_hash="not-a-real-hash",
+        user_name="Test"
+    )
+    db_session.add(user)
+    await db_session.flush()
+    bot = Bot(bot_name="test-bot", bot_owner_id=user.user_id)
+    db_session.add(bot)
+    await db_session.flush()
+    conversation = Conversation(conversation_user_id=user.user_id, conversation_bot_id=bot.bot_id)
+    db_session.add(conversation)
+    await db_session.flush()
+    return conversation
@@ -0,0 +1,65 @@
+"""
+Import-time smoke test of alembic/env.py
+"""
+
+import builtins
+import dis
+import io
+import os
+
+import pytest
+from alembic.config import Config
+from alembic.runtime.environment import EnvironmentContext
+from alembic.script import ScriptDirectory
+from alembic.util import load_python_file
+
+pytestmark = pytest.mark.unit
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+@pytest.fixture
+def env_module():
+    """Execute env.py in offline mode with no revisions to run and return its module"""
+    cfg = Config(os.path.join(ROOT, 'alembic.ini'), output_buffer=io.StringIO())
+    cfg.set_main_option('script_location', os.path.join(ROOT, 'alembic'))
+    # Leave the test run's logging configuration alone
+    cfg.attributes['configure_logger'] = False
+    script = ScriptDirectory.from_config(cfg)
+    with EnvironmentContext(cfg, script, fn=lambda rev, context: [], as_sql=True):
+        yield load_python_file(script.dir, 'env.py')
+
+
+def _global_loads(code):
+    """Global names read by a code object and every function nested in it"""
+    for instruction in dis.get_instructions(code):
+        if instruction.opname == 'LOAD_GLOBAL':
+            yield instruction.argval
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            yield from _global_loads(const)
+
+
+def test_env_module_loads(env_module):
+    assert env_module.target_metadata is not None
+    assert set(env_module.APP_SCHEMAS) == {'auth', 'chats', 'marketplace'}
+
+
+def test_env_functions_only_reference_defined_names(env_module):
+    # The online path only runs against a live database; an undefined helper
+    # there would otherwise surface as a NameError on the first real upgrade
+    for name, value in vars(env_module).items():
+        if getattr(value, '__module__', None) != env_module.__name__ or not hasattr(value, '__code__'):
+            continue
+        missing = {
+            loaded for loaded in _global_loads(value.__code__)
+            if loaded not in vars(env_module) and not hasattr(builtins, loaded)
+        }
+        assert not missing, f"{name} references undefined globals: {sorted(missing)}"
+
+
+def test_include_name_restricts_schemas(env_module):
+    assert env_module.include_name(None, 'schema', {})
+    assert env_module.include_name('marketplace', 'schema', {})
+    assert not env_module.include_name('pg_catalog', 'schema', {})
+    assert env_module.include_name('bots', 'table', {})
@@ -0,0 +1,49 @@
+"""
+Validation on the auth DTOs
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from datalayer.model.dto.auth_dto import UserCreateDto
+
+pytestmark = pytest.mark.unit
+
+
+def _user(**overrides):
+    fields = {"email": "Tester@Example.com", "password": "password123", "user_name": "Tester"}
+    fields.update(overrides)
+    return UserCreateDto(**fields)
+
+
+@pytest.mark.parametrize("username, expected", [
+    ("tester", "tester"),
+    ("Tester_01", "tester_01"),
+    ("test-er", "test-er"),
+    # \w is Unicode-aware, like the isalnum() check it replaced
+    ("Gaffar_Dülkadir", "gaffar_dülkadir"),
+    ("şükrü", "şükrü"),
+])
+def test_valid_usernames_are_lowercased(username, expected):
+    assert _user(username=username).username == expected
+
+
+@pytest.mark.parametrize("username", [
+    "test er",
+    "test.er",
+    "test@er",
+    "tester!",
+    # \Z, unlike $, does not accept a trailing newline
+    "tester\n",
+])
+def test_invalid_usernames_are_rejected(username):
+    with pytest.raises(ValidationError):
+        _user(username=username)
+
+
+def test_username_is_optional():
+    assert _user().username is None
+
+
+def test_email_is_lowercased():
+    assert _user().email == "tester@example.com"
@@ -0,0 +1,38 @@
+"""
+Bot.rating float view over the rating_tenths SMALLINT column
+"""
+
+import pytest
+
+from datalayer.model.sqlalchemy_models import Bot
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("rating, tenths", [
+    (0.0, 0),
+    (4.3, 43),
+    (3.7, 37),
+    (5.0, 50),
+])
+def test_rating_setter_stores_tenths(rating, tenths):
+    bot = Bot()
+    bot.rating = rating
+    assert bot.rating_tenths == tenths
+
+
+@pytest.mark.parametrize("tenths", [0, 1, 43, 50])
+def test_rating_round_trips_through_tenths(tenths):
+    bot = Bot(rating_tenths=tenths)
+    assert bot.rating == tenths / 10
+
+    copy = Bot()
+    copy.rating = bot.rating
+    assert copy.rating_tenths == tenths
+
+
+def test_missing_rating_stays_none():
+    bot = Bot()
+    bot.rating = None
+    assert bot.rating_tenths is None
+    assert bot.rating is None
@@ -0,0 +1,116 @@
+"""
+Listing cache of BotService
+"""
+
+import pytest
+
+from services import bot_service
+from services.bot_service import BotService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def empty_listing_cache():
+    bot_service._invalidate_listing_cache()
+    yield
+    bot_service._invalidate_listing_cache()
+
+
+class _CountingLoader:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+class _RecordingSession:
+    def __init__(self, events):
+        self.events = events
+
+    async def commit(self):
+        # Whatever is cached at commit time must still be there
+        self.events.append(('commit', len(bot_service._listing_cache)))
+
+    async def rollback(self):
+        self.events.append(('rollback', len(bot_service._listing_cache)))
+
+
+class _StubBotRepository:
+    def __init__(self, result):
+        self.result = result
+
+    async def update_status(self, bot_id, status):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def _service(events, update_result):
+    service = BotService(_RecordingSession(events))
+    service.bot_repo = _StubBotRepository(update_result)
+    return service
+
+
+async def test_cached_loads_once_per_key():
+    load = _CountingLoader()
+
+    assert await BotService._cached(('premium', 20, 0, None), load) == 1
+    assert await BotService._cached(('premium', 20, 0, None), load) == 1
+    assert await BotService._cached(('premium', 20, 20, None), load) == 2
+    assert load.calls == 2
+
+
+async def test_cached_reloads_after_expiry(monkeypatch):
+    load = _CountingLoader()
+    await BotService._cached(('premium', 20, 0, None), load)
+    monkeypatch.setattr(bot_service, '_LISTING_CACHE_TTL', -1)
+
+    await BotService._cached(('premium', 20, 0, None), load)
+
+    assert load.calls == 2
+
+
+async def test_invalidate_drops_every_listing():
+    load = _CountingLoader()
+    await BotService._cached(('premium', 20, 0, None), load)
+    await BotService._cached(('category', 'c1', 20, 0, None), load)
+
+    bot_service._invalidate_listing_cache()
+
+    assert bot_service._listing_cache == {}
+    await BotService._cached(('premium', 20, 0, None), load)
+    assert load.calls == 3
+
+
+async def test_approve_bot_invalidates_after_commit():
+    await BotService._cached(('premium', 20, 0, None), _CountingLoader())
+    events = []
+
+    assert await _service(events, True).approve_bot('bot-1')
+
+    assert events == [('commit', 1)]
+    assert bot_service._listing_cache == {}
+
+
+async def test_approve_missing_bot_keeps_cache():
+    await BotService._cached(('premium', 20, 0, None), _CountingLoader())
+    events = []
+
+    assert not await _service(events, False).approve_bot('missing')
+
+    assert events == []
+    assert len(bot_service._listing_cache) == 1
+
+
+async def test_failed_approve_rolls_back_and_keeps_cache():
+    await BotService._cached(('premium', 20, 0, None), _CountingLoader())
+    events = []
+
+    with pytest.raises(RuntimeError):
+        await _service(events, RuntimeError('boom')).approve_bot('bot-1')
+
+    assert events == [('rollback', 1)]
+    assert len(bot_service._listing_cache) == 1
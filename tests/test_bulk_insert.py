@@ -0,0 +1,67 @@
+"""
+Batched INSERT ... RETURNING paths of MessageRepository and DocumentRepository
+"""
+
+import pytest
+from sqlalchemy import select
+
+from datalayer.model.sqlalchemy_models import Document, Message, MessageRole
+from datalayer.repository.message_repository import DocumentRepository, MessageRepository
+
+pytestmark = [pytest.mark.integration, pytest.mark.database]
+
+
+def _message_rows(conversation, count):
+    return [
+        {
+            "message_conversation_id": conversation.conversation_id,
+            "message_role": MessageRole.USER,
+            "message_user_id": conversation.conversation_user_id,
+            "message_type_db": "text",
+            "content": f"message {i}",
+        }
+        for i in range(count)
+    ]
+
+
+async def test_message_bulk_insert_returns_ids_in_row_order(db_session, conversation, monkeypatch):
+    # Several insertmanyvalues batches, so ordering has to survive batching
+    monkeypatch.setattr(db_session.bind.dialect, "insertmanyvalues_page_size", 7)
+    rows = _message_rows(conversation, 25)
+
+    ids = await MessageRepository(db_session).bulk_insert(rows)
+
+    assert len(ids) == len(rows)
+    result = await db_session.execute(
+        select(Message.message_id, Message.content).where(Message.message_id.in_(ids))
+    )
+    content_by_id = dict(result.all())
+    assert [content_by_id[message_id] for message_id in ids] == [row["content"] for row in rows]
+
+
+async def test_message_bulk_insert_without_rows(db_session):
+    assert await MessageRepository(db_session).bulk_insert([]) == []
+
+
+async def test_document_bulk_insert_returns_ids_in_row_order(db_session, conversation, monkeypatch):
+    monkeypatch.setattr(db_session.bind.dialect, "insertmanyvalues_page_size", 3)
+    [message_id] = await MessageRepository(db_session).bulk_insert(_message_rows(conversation, 1))
+    rows = [
+        {
+            "document_message_id": message_id,
+            "document_uploaded_by": conversation.conversation_user_id,
+            "document_filename": f"file-{i}.txt",
+            "document_file_size": 100 + i,
+            "document_mime_type": "text/plain",
+            "document_content": f"content {i}",
+        }
+        for i in range(10)
+    ]
+
+    ids = await DocumentRepository(db_session).bulk_insert(rows)
+
+    result = await db_session.execute(
+        select(Document.document_id, Document.document_filename).where(Document.document_id.in_(ids))
+    )
+    filename_by_id = dict(result.all())
+    assert [filename_by_id[document_id] for document_id in ids] == [row["document_filename"] for row in rows]
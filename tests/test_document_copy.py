@@ -0,0 +1,66 @@
+"""
+Binary COPY ingest of DocumentRepository.copy_insert
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import undefer_group
+
+from datalayer.model.sqlalchemy_models import Document, MessageRole
+from datalayer.repository.message_repository import DocumentRepository, MessageRepository
+
+pytestmark = [pytest.mark.integration, pytest.mark.database]
+
+
+async def test_copy_insert_round_trips_rows(db_session, conversation):
+    [message_id] = await MessageRepository(db_session).bulk_insert([{
+        "message_conversation_id": conversation.conversation_id,
+        "message_role": MessageRole.USER,
+        "message_user_id": conversation.conversation_user_id,
+        "content": "with attachments",
+    }])
+    rows = [
+        {
+            "document_message_id": message_id,
+            "document_uploaded_by": conversation.conversation_user_id,
+            "document_filename": "report.pdf",
+            # bigint column - a size past the int4 range
+            "document_file_size": 5 * 1024 ** 3,
+            "document_mime_type": "application/pdf",
+            "document_content": "%PDF-1.7 ...",
+        },
+        {
+            # Caller-supplied IDs are kept as-is
+            "document_id": "0190b2a4-0000-7000-8000-000000000001",
+            "document_message_id": message_id,
+            "document_uploaded_by": conversation.conversation_user_id,
+            "document_filename": "photo.png",
+            "document_file_size": 2048,
+            "document_mime_type": "image/png",
+            "document_content": "iVBORw0KGgo=",
+        },
+    ]
+
+    # A generator - copy_insert consumes rows lazily
+    ids = await DocumentRepository(db_session).copy_insert(row for row in rows)
+
+    assert len(ids) == 2
+    assert ids[1] == rows[1]["document_id"]
+    result = await db_session.execute(
+        select(Document).options(undefer_group("content")).where(Document.document_id.in_(ids))
+    )
+    documents = {document.document_id: document for document in result.scalars()}
+    for document_id, row in zip(ids, rows):
+        document = documents[document_id]
+        assert document.document_message_id == message_id
+        assert document.document_filename == row["document_filename"]
+        assert document.document_file_size == row["document_file_size"]
+        assert document.document_mime_type == row["document_mime_type"]
+        assert document.document_content == row["document_content"]
+        # Generated by the server from the MIME type, not part of the COPY
+        assert document.document_file_type == row["document_mime_type"].split("/")[0]
+        assert document.created_at is not None
+
+
+async def test_copy_insert_without_rows(db_session):
+    assert await DocumentRepository(db_session).copy_insert([]) == []
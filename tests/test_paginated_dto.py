@@ -0,0 +1,36 @@
+"""
+has_next / has_prev derivation on PaginatedDto list responses
+"""
+
+import pytest
+
+from datalayer.model.dto.marketplace_dto import BotListResponseDto
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("page, limit, total, has_next, has_prev", [
+    (1, 20, 0, False, False),
+    (1, 20, 20, False, False),
+    (1, 20, 21, True, False),
+    (2, 20, 41, True, True),
+    (3, 20, 41, False, True),
+])
+def test_flags_derived_from_page_limit_total(page, limit, total, has_next, has_prev):
+    dto = BotListResponseDto(bots=[], total=total, page=page, limit=limit)
+    assert dto.has_next is has_next
+    assert dto.has_prev is has_prev
+
+
+def test_explicit_flags_are_kept():
+    # Keyset pages know from the limit + 1 probe, not from page * limit
+    dto = BotListResponseDto(bots=[], total=0, page=1, limit=20, has_next=True, has_prev=True)
+    assert dto.has_next is True
+    assert dto.has_prev is True
+
+
+def test_flags_serialize_under_camel_case_aliases():
+    dto = BotListResponseDto(bots=[], total=21, page=1, limit=20)
+    dumped = dto.model_dump(by_alias=True)
+    assert dumped["hasNext"] is True
+    assert dumped["hasPrev"] is False